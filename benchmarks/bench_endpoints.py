@@ -0,0 +1,131 @@
+"""Benchmark the per call overhead of the list endpoints.
+
+Run from the repository root with ``python -m benchmarks.bench_endpoints``.
+
+Requests are answered from canned responses so only the work done by the
+client after the response is decoded is measured. Each endpoint is also
+timed with a TypeAdapter built on every call, the cost the module level
+adapters avoid.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from asyncpixel import Hypixel
+from asyncpixel.models import AuctionItem, Friend, Game, News
+
+from .payloads import auction_item
+
+PLAYER = "405dcf08b80f4e23b97d943ad93d14fd"
+
+NEWS = {
+    "items": [
+        {
+            "item": {"material": "MONSTER_EGG", "data": 90},
+            "link": "https://hypixel.net/threads/2852738/",
+            "text": "6th May 2020",
+            "title": "SkyBlock v0.7.8",
+        },
+        {
+            "item": {"material": "GOLD_NUGGET"},
+            "link": "https://hypixel.net/threads/2655146/",
+            "text": "9th March 2020",
+            "title": "SkyBlock v0.7.7",
+        },
+    ]
+}
+FRIENDS = {
+    "records": [
+        {
+            "_id": "5eb97d170cf22f431e8d6170",
+            "uuidSender": "20934ef9488c465180a78f861586b4cf",
+            "uuidReceiver": PLAYER,
+            "started": 1589214487454,
+        }
+    ]
+}
+GAMES = {
+    "games": [
+        {"date": 1590935247444, "gameType": "SKYWARS", "mode": "solo_normal", "map": "Shire"},
+        {"date": 1590850836485, "gameType": "BEDWARS", "mode": "FOUR_FOUR", "map": "Dreamgrove"},
+    ]
+}
+AUCTIONS = {"auctions": [auction_item(random.Random(seed), [PLAYER]) for seed in range(2)]}
+
+Call = Callable[[Hypixel], Awaitable[Any]]
+
+CASES: List[Tuple[str, Dict[str, Any], str, Type[BaseModel], Call]] = [
+    ("news", NEWS, "items", News, lambda client: client.news()),
+    ("player_friends", FRIENDS, "records", Friend, lambda client: client.player_friends(PLAYER)),
+    ("recent_games", GAMES, "games", Game, lambda client: client.recent_games(PLAYER)),
+    ("auction_from_uuid", AUCTIONS, "auctions", AuctionItem, lambda client: client.auction_from_uuid(PLAYER)),
+    ("auction_from_player", AUCTIONS, "auctions", AuctionItem, lambda client: client.auction_from_player(PLAYER)),
+    ("auction_from_profile", AUCTIONS, "auctions", AuctionItem, lambda client: client.auction_from_profile(PLAYER)),
+]
+
+
+async def measure(client: Hypixel, call: Call, number: int, repeat: int) -> float:
+    """Time an endpoint.
+
+    Args:
+        client (Hypixel): client answering from a canned response.
+        call (Call): endpoint call.
+        number (int): calls per timing run.
+        repeat (int): number of timing runs, the fastest is kept.
+
+    Returns:
+        float: microseconds per call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await call(client)
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+async def run(number: int, repeat: int) -> None:
+    """Run the benchmarks and print microseconds per call.
+
+    Args:
+        number (int): calls per timing run.
+        repeat (int): number of timing runs, the fastest is kept.
+    """
+    client = Hypixel(api_key=uuid.uuid4())
+    try:
+        for name, response, field, model, call in CASES:
+
+            async def get(*args: Any, response: Dict[str, Any] = response, **kwargs: Any) -> Dict[str, Any]:
+                return response
+
+            client._get = get  # type: ignore[method-assign]
+            cached = await measure(client, call, number, repeat)
+
+            async def uncached(
+                client: Hypixel, response: Dict[str, Any] = response, field: str = field, model: Any = model
+            ) -> Any:
+                return TypeAdapter(List[model]).validate_python(response[field])
+
+            rebuilt = await measure(client, uncached, number, repeat)
+            print(f"{name:<24} {cached:>10.1f} us   adapter per call {rebuilt:>10.1f} us")
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.number, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark the json decoders on api responses.
+
+Run from the repository root with ``python -m benchmarks.bench_json``.
+
+Only the backends installed are measured.
+"""
+import argparse
+import functools
+import json
+import timeit
+from typing import Dict
+
+from asyncpixel.codec import DECODERS
+
+from .payloads import auction_page, player, profile
+
+
+def main() -> None:
+    """Run the benchmarks and print the throughput of each decoder."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    bodies: Dict[str, bytes] = {
+        "auctions": json.dumps(auction_page()).encode(),
+        "player": json.dumps({"success": True, "player": player()}).encode(),
+        "profile": json.dumps(profile()).encode(),
+    }
+    for name, body in bodies.items():
+        print(f"{name} ({len(body) / 1024:.0f} KiB)")
+        for backend, decode in sorted(DECODERS.items()):
+            timings = timeit.repeat(functools.partial(decode, body), repeat=args.repeat, number=args.number)
+            seconds = min(timings) / args.number
+            print(f"    {backend:<10} {seconds * 1000:>10.3f} ms {len(body) / seconds / 1024**2:>10.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark building models from api responses.
+
+Run from the repository root with ``python -m benchmarks.bench_parsing``.
+
+``model_construct`` skips validation and does not build nested models, so
+it is the floor for any trusted construction path rather than a usable
+alternative. Its gap to ``model_validate`` is all such a path could save.
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from asyncpixel.models import Auction, Player
+
+try:
+    from asyncpixel import structs
+except ImportError:
+    structs = None  # type: ignore[assignment]
+
+from .payloads import auction_page, player
+
+
+def measure(function: Callable[[], Any], repeat: int, number: int) -> float:
+    """Time a function.
+
+    Args:
+        function (Callable[[], Any]): function to time.
+        repeat (int): number of timing runs, the fastest is kept.
+        number (int): calls per timing run.
+
+    Returns:
+        float: milliseconds per call.
+    """
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number * 1000
+
+
+def cases() -> List[Tuple[str, Callable[[], Any]]]:
+    """Build the benchmark cases.
+
+    Returns:
+        List[Tuple[str, Callable[[], Any]]]: name and function of each case.
+    """
+    page = auction_page()
+    page_body = json.dumps(page).encode()
+    profile = player()
+    profile_body = json.dumps(profile).encode()
+    auction_cases: List[Tuple[str, Callable[[], Any]]] = [
+        ("auctions: json.loads", lambda: json.loads(page_body)),
+        ("auctions: model_validate", lambda: Auction.model_validate(page)),
+        ("auctions: model_validate_json", lambda: Auction.model_validate_json(page_body)),
+        ("auctions: model_construct (shallow)", lambda: Auction.model_construct(**page)),
+    ]
+    if structs is not None:
+        auction_cases += [
+            ("auctions: structs.convert", lambda: structs.convert(page, structs.Auction)),
+            ("auctions: structs.decode", lambda: structs.decode(page_body, structs.Auction)),
+        ]
+    return [
+        *auction_cases,
+        ("player: json.loads", lambda: json.loads(profile_body)),
+        ("player: model_validate", lambda: Player.model_validate(profile)),
+        ("player: model_validate lazy_stats", lambda: Player.model_validate(profile, context={"lazy_stats": True})),
+        ("player: model_validate_json", lambda: Player.model_validate_json(profile_body)),
+        ("player: model_construct (shallow)", lambda: Player.model_construct(**profile)),
+    ]
+
+
+def main() -> None:
+    """Run the benchmarks and print milliseconds per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    for name, function in cases():
+        print(f"{name:<40} {measure(function, args.repeat, args.number):>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
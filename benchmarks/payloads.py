@@ -0,0 +1,111 @@
+"""Realistic api payloads for the benchmarks."""
+import json
+import pathlib
+import random
+import uuid
+from typing import Any, Dict, List
+
+DATA = pathlib.Path(__file__).parent / "data"
+
+ITEMS = [
+    ("Hyperion", "LEGENDARY", "weapon"),
+    ("Aspect of the End", "RARE", "weapon"),
+    ("Enchanted Diamond", "UNCOMMON", "misc"),
+    ("Wise Dragon Chestplate", "LEGENDARY", "armor"),
+    ("Jungle Pickaxe", "UNCOMMON", "misc"),
+    ("Magical Mushroom Soup", "UNCOMMON", "consumables"),
+]
+
+
+def player() -> Dict[str, Any]:
+    """Json of a player with stats for most games.
+
+    Returns:
+        Dict[str, Any]: player json.
+    """
+    data: Dict[str, Any] = json.loads((DATA / "player.json").read_text())
+    return data
+
+
+def profile() -> Dict[str, Any]:
+    """Json response of a skyblock profile.
+
+    Returns:
+        Dict[str, Any]: profile response json.
+    """
+    data: Dict[str, Any] = json.loads((DATA / "profile.json").read_text())
+    return data
+
+
+def auction_item(rng: random.Random, sellers: List[str]) -> Dict[str, Any]:
+    """Json of a random auction.
+
+    Args:
+        rng (random.Random): random generator.
+        sellers (List[str]): uuids of the players selling and bidding.
+
+    Returns:
+        Dict[str, Any]: auction json.
+    """
+    auction_id = uuid.UUID(int=rng.getrandbits(128), version=4).hex
+    name, tier, category = rng.choice(ITEMS)
+    start = 1_700_000_000_000 + rng.randrange(86_400_000)
+    starting_bid = rng.randrange(1, 100_000_000)
+    is_bin = rng.random() < 0.8
+    bids = (
+        []
+        if is_bin
+        else [
+            {
+                "auction_id": auction_id,
+                "bidder": rng.choice(sellers),
+                "profile_id": rng.choice(sellers),
+                "amount": starting_bid + i * 1000,
+                "timestamp": start + i * 60_000,
+            }
+            for i in range(rng.randrange(4))
+        ]
+    )
+    seller = rng.choice(sellers)
+    return {
+        "uuid": auction_id,
+        "auctioneer": seller,
+        "profile_id": seller,
+        "coop": [seller],
+        "start": start,
+        "end": start + 86_400_000,
+        "item_name": name,
+        "item_lore": "§7Damage: §c+270\n§7Strength: §c+150\n\n§6Ability: Wither Impact §e§lRIGHT CLICK",
+        "extra": f"{name} Diamond Sword",
+        "category": category,
+        "tier": tier,
+        "starting_bid": starting_bid,
+        "item_bytes": "H4sIAAAAAAAAAE1Ry27TQBR9" + "A" * 600,
+        "claimed": False,
+        "claimed_bidders": [],
+        "highest_bid_amount": bids[-1]["amount"] if bids else 0,
+        "bin": is_bin,
+        "bids": bids,
+    }
+
+
+def auction_page(size: int = 1000, seed: int = 0) -> Dict[str, Any]:
+    """Json of a full page of the auction house.
+
+    Args:
+        size (int, optional): number of auctions. Defaults to 1000.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: page json.
+    """
+    rng = random.Random(seed)
+    sellers = [uuid.UUID(int=rng.getrandbits(128), version=4).hex for _ in range(size // 4 or 1)]
+    return {
+        "success": True,
+        "page": 0,
+        "totalPages": 60,
+        "totalAuctions": 60 * size,
+        "lastUpdated": 1_700_000_000_000,
+        "auctions": [auction_item(rng, sellers) for _ in range(size)],
+    }
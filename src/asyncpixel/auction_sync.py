@@ -0,0 +1,126 @@
+"""Incremental synchronisation of the skyblock auction house."""
+import asyncio
+import datetime
+import uuid
+from typing import AsyncIterator, Dict, List, Optional
+
+from .exceptions import ApiNoSuccessError
+from .hypixel import Hypixel
+from .models import Auction, AuctionDiff, AuctionItem
+
+__all__ = ["AuctionSync"]
+
+REFRESH_PERIOD = datetime.timedelta(seconds=60)
+
+
+class AuctionSync:
+    """Keep an in memory snapshot of the auction house up to date.
+
+    Hypixel refreshes the auction house about once a minute. The snapshot is
+    only crawled again once the ``lastUpdated`` time of the first page moves
+    on, and every refresh reports what changed as an :class:`AuctionDiff`.
+    If hypixel updates the auction house while it is being crawled the crawl
+    is started over, so a snapshot never mixes pages of two updates.
+    A response cache on the client delays refreshes by the time to live of
+    ``skyblock/auctions``.
+    """
+
+    def __init__(self, client: Hypixel, concurrency: int = 10, retry: int = 3, restarts: int = 2) -> None:
+        """Initialise synchroniser.
+
+        Args:
+            client (Hypixel): client used to fetch auctions.
+            concurrency (int): Maximum number of pages fetched at once. Defaults to 10.
+            retry (int): Amount of attempts to get each page. Defaults to 3.
+            restarts (int): Amount of times a crawl is started over when the
+                auction house is updated during it. Defaults to 2.
+        """
+        self.client = client
+        self.concurrency = concurrency
+        self.retry = retry
+        self.restarts = restarts
+        self.auctions: Dict[uuid.UUID, AuctionItem] = {}
+        self.last_updated: Optional[datetime.datetime] = None
+
+    async def refresh(self) -> Optional[AuctionDiff]:
+        """Crawl the auction house if it has been updated.
+
+        Raises:
+            ApiNoSuccessError: the auction house was updated during every crawl.
+
+        Returns:
+            Optional[AuctionDiff]: changes since the previous snapshot, None if
+                the auction house has not been updated.
+        """
+        for _ in range(self.restarts + 1):
+            pages = self.client.auctions_all(concurrency=self.concurrency, retry=self.retry)
+            current: Dict[uuid.UUID, AuctionItem] = {}
+            new: List[AuctionItem] = []
+            changed: List[AuctionItem] = []
+            consistent = True
+            try:
+                first = await pages.__anext__()
+                if first.last_updated == self.last_updated:
+                    return None
+                self._compare(first, current, new, changed)
+                async for page in pages:
+                    if page.last_updated != first.last_updated:
+                        consistent = False
+                        break
+                    self._compare(page, current, new, changed)
+            finally:
+                await pages.aclose()
+            if consistent:
+                break
+        else:
+            raise ApiNoSuccessError("skyblock/auctions")
+
+        removed = [item for key, item in self.auctions.items() if key not in current]
+        self.auctions = current
+        self.last_updated = first.last_updated
+        # Built without validation so auctions can be msgspec structs as well as models.
+        return AuctionDiff.model_construct(last_updated=first.last_updated, new=new, changed=changed, removed=removed)
+
+    def _compare(
+        self,
+        page: Auction,
+        current: Dict[uuid.UUID, AuctionItem],
+        new: List[AuctionItem],
+        changed: List[AuctionItem],
+    ) -> None:
+        """Compare a page of auctions against the previous snapshot.
+
+        Args:
+            page (Auction): page of auctions.
+            current (Dict[uuid.UUID, AuctionItem]): new snapshot being built.
+            new (List[AuctionItem]): auctions not in the previous snapshot.
+            changed (List[AuctionItem]): auctions that have received bids.
+        """
+        for item in page.auctions:
+            current[item.uuid] = item
+            previous = self.auctions.get(item.uuid)
+            if previous is None:
+                new.append(item)
+            elif (previous.highest_bid_amount, len(previous.bids)) != (item.highest_bid_amount, len(item.bids)):
+                changed.append(item)
+
+    async def watch(self, interval: float = 1.0) -> AsyncIterator[AuctionDiff]:
+        """Yield the changes to the auction house each time it is updated.
+
+        After an update the auction house is left alone until the next one is
+        due, it is then polled every interval seconds.
+
+        Args:
+            interval (float): seconds between polls. Defaults to 1.0.
+
+        Yields:
+            AuctionDiff: changes since the previous snapshot.
+        """
+        while True:
+            diff = await self.refresh()
+            delay = interval
+            if diff is not None:
+                yield diff
+                now = datetime.datetime.now(tz=diff.last_updated.tzinfo)
+                delay = max((diff.last_updated + REFRESH_PERIOD - now).total_seconds(), interval)
+            await asyncio.sleep(delay)
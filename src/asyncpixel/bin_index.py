@@ -0,0 +1,192 @@
+"""Price index over the BIN auctions of the auction house."""
+import re
+import uuid
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import AuctionDiff, AuctionItem
+
+__all__ = ["BinIndex", "item_key", "normalize_name"]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an item name for lookups.
+
+    Strips colour codes, dungeon stars and repeated whitespace and lowercases
+    the name.
+
+    Args:
+        name (str): item name.
+
+    Returns:
+        str: normalized item name.
+    """
+    name = re.sub(r"§.|[✪➊➋➌➍➎]", "", name)
+    return " ".join(name.split()).lower()
+
+
+def item_key(item: AuctionItem) -> str:
+    """Get the default index key of an auction.
+
+    Args:
+        item (AuctionItem): auction.
+
+    Returns:
+        str: normalized item name.
+    """
+    return normalize_name(item.item_name)
+
+
+def _buyable(auction: AuctionItem) -> bool:
+    """Whether an auction is a BIN that can still be bought.
+
+    A BIN auction that was bought has a bid until its seller claims it.
+
+    Args:
+        auction (AuctionItem): auction.
+
+    Returns:
+        bool: whether the auction is BIN, unclaimed and without bids.
+    """
+    return auction.bin and not auction.claimed and not auction.bids and auction.highest_bid_amount == 0
+
+
+class BinIndex:
+    """Sorted BIN prices per item.
+
+    Every key holds a list of ``(price, auction uuid)`` sorted by price so the
+    lowest price is read in O(1) and the k cheapest or a percentile in
+    O(log n + k). Auctions are added and removed incrementally, typically by
+    applying each :class:`AuctionDiff` from an :class:`AuctionSync`.
+    """
+
+    def __init__(self, key: Callable[[AuctionItem], str] = item_key) -> None:
+        """Initialise index.
+
+        Args:
+            key (Callable[[AuctionItem], str], optional): function mapping an
+                auction to its index key, the key is normalized with
+                normalize_name. Defaults to item_key.
+        """
+        self.key = key
+        self._prices: Dict[str, List[Tuple[int, uuid.UUID]]] = {}
+        self._auctions: Dict[uuid.UUID, Tuple[str, int]] = {}
+
+    @classmethod
+    def from_auctions(cls, auctions: Iterable[AuctionItem], key: Callable[[AuctionItem], str] = item_key) -> "BinIndex":
+        """Build an index from auctions.
+
+        Args:
+            auctions (Iterable[AuctionItem]): auctions to index.
+            key (Callable[[AuctionItem], str], optional): function mapping an
+                auction to its index key. Defaults to item_key.
+
+        Returns:
+            BinIndex: index of the BIN auctions that can still be bought.
+        """
+        index = cls(key)
+        for auction in auctions:
+            if _buyable(auction):
+                name = normalize_name(key(auction))
+                index._prices.setdefault(name, []).append((auction.starting_bid, auction.uuid))
+                index._auctions[auction.uuid] = (name, auction.starting_bid)
+        for prices in index._prices.values():
+            prices.sort()
+        return index
+
+    def __len__(self) -> int:
+        """Number of indexed auctions."""
+        return len(self._auctions)
+
+    def __contains__(self, name: object) -> bool:
+        """Whether an item has any BIN auctions."""
+        return isinstance(name, str) and normalize_name(name) in self._prices
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the indexed item keys."""
+        return iter(self._prices)
+
+    def add(self, auction: AuctionItem) -> None:
+        """Add or update an auction.
+
+        Auctions that are not BIN, or that were bought, are removed instead.
+
+        Args:
+            auction (AuctionItem): auction to add.
+        """
+        self.remove(auction.uuid)
+        if not _buyable(auction):
+            return
+        name = normalize_name(self.key(auction))
+        insort(self._prices.setdefault(name, []), (auction.starting_bid, auction.uuid))
+        self._auctions[auction.uuid] = (name, auction.starting_bid)
+
+    def remove(self, auction_id: uuid.UUID) -> None:
+        """Remove an auction if it is indexed.
+
+        Args:
+            auction_id (uuid.UUID): uuid of the auction.
+        """
+        entry = self._auctions.pop(auction_id, None)
+        if entry is None:
+            return
+        name, price = entry
+        prices = self._prices[name]
+        del prices[bisect_left(prices, (price, auction_id))]
+        if not prices:
+            del self._prices[name]
+
+    def apply(self, diff: AuctionDiff) -> None:
+        """Apply the changes between two auction house snapshots.
+
+        Args:
+            diff (AuctionDiff): changes to apply.
+        """
+        for auction in diff.removed:
+            self.remove(auction.uuid)
+        for auction in diff.new:
+            self.add(auction)
+        for auction in diff.changed:
+            self.add(auction)
+
+    def lowest(self, name: str) -> Optional[int]:
+        """Get the lowest BIN price of an item.
+
+        Args:
+            name (str): item key.
+
+        Returns:
+            Optional[int]: lowest price, None if there are no BIN auctions.
+        """
+        prices = self._prices.get(normalize_name(name))
+        return prices[0][0] if prices else None
+
+    def cheapest(self, name: str, k: int = 1) -> List[Tuple[int, uuid.UUID]]:
+        """Get the k cheapest BIN auctions of an item.
+
+        Args:
+            name (str): item key.
+            k (int, optional): number of auctions. Defaults to 1.
+
+        Returns:
+            List[Tuple[int, uuid.UUID]]: price and uuid of each auction, cheapest first.
+        """
+        return self._prices.get(normalize_name(name), [])[:k]
+
+    def percentile(self, name: str, percentile: float) -> Optional[int]:
+        """Get a percentile of the BIN prices of an item.
+
+        Uses the nearest rank method.
+
+        Args:
+            name (str): item key.
+            percentile (float): percentile between 0 and 100.
+
+        Returns:
+            Optional[int]: price at the percentile, None if there are no BIN auctions.
+        """
+        prices = self._prices.get(normalize_name(name))
+        if not prices:
+            return None
+        rank = max(int(-(-percentile * len(prices) // 100)), 1)
+        return prices[min(rank, len(prices)) - 1][0]
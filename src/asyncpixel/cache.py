@@ -0,0 +1,388 @@
+"""Response caches for the hypixel api."""
+import abc
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlencode
+
+from . import codec, utils
+
+__all__ = ["DEFAULT_TTL", "BaseCache", "MemoryCache", "SQLiteCache"]
+
+T = TypeVar("T")
+
+DEFAULT_TTL: Dict[str, float] = {
+    "boosters": 60,
+    "friends": 300,
+    "gameCounts": 60,
+    "guild": 300,
+    "leaderboards": 3600,
+    "player": 60,
+    "playerCount": 60,
+    "recentGames": 60,
+    "resources": 6 * 3600,
+    "skyblock/auction": 60,
+    "skyblock/auctions": 60,
+    "skyblock/auctions_ended": 60,
+    "skyblock/bazaar": 10,
+    "skyblock/news": 3600,
+    "skyblock/profile": 60,
+    "skyblock/profiles": 60,
+    "status": 10,
+    "watchdogstats": 60,
+}
+
+
+def _timestamp() -> float:
+    """Get the current wall clock time.
+
+    Returns:
+        float: seconds since the epoch.
+    """
+    return time.time()
+
+
+class BaseCache(abc.ABC):
+    """Base class for response caches.
+
+    Responses are cached for a time to live configured per endpoint. An
+    endpoint matches its own path and every path below it, the most specific
+    match wins. Endpoints without a time to live are never cached.
+    """
+
+    def __init__(self, ttl: Optional[Mapping[str, float]] = None) -> None:
+        """Initialise cache.
+
+        Args:
+            ttl (Optional[Mapping[str, float]], optional): time to live in seconds
+                per endpoint, merged over DEFAULT_TTL. Defaults to None.
+        """
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, path: str) -> float:
+        """Get the time to live of an endpoint.
+
+        Args:
+            path (str): path of the endpoint.
+
+        Returns:
+            float: time to live in seconds, 0 if the endpoint is not cached.
+        """
+        while path:
+            if path in self.ttl:
+                return self.ttl[path]
+            path = path.rpartition("/")[0]
+        return 0
+
+    @staticmethod
+    def key(path: str, params: Mapping[str, Any]) -> str:
+        """Build the cache key of a request.
+
+        Args:
+            path (str): path of the endpoint.
+            params (Mapping[str, Any]): parameters of the request.
+
+        Returns:
+            str: cache key.
+        """
+        return f"{path}?{urlencode(sorted((name, str(value)) for name, value in params.items()))}"
+
+    async def get(self, path: str, params: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a cached response.
+
+        Args:
+            path (str): path of the endpoint.
+            params (Mapping[str, Any]): parameters of the request.
+
+        Returns:
+            Optional[Dict[str, Any]]: cached response if there is a fresh one.
+        """
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return None
+        data = await self._load(self.key(path, params))
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    async def set(
+        self, path: str, params: Mapping[str, Any], data: Dict[str, Any], size: int, body: Optional[bytes] = None
+    ) -> None:
+        """Cache a response.
+
+        Args:
+            path (str): path of the endpoint.
+            params (Mapping[str, Any]): parameters of the request.
+            data (Dict[str, Any]): decoded response.
+            size (int): size of the response body in bytes.
+            body (Optional[bytes], optional): json body of the response, saves
+                backends that store bytes from encoding data again. Defaults to None.
+        """
+        ttl = self.ttl_for(path)
+        if ttl > 0:
+            await self._store(self.key(path, params), data, size, ttl, body)
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        """Remove every cached response."""
+
+    @abc.abstractmethod
+    async def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a fresh entry from the backend.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: cached response if there is a fresh one.
+        """
+
+    @abc.abstractmethod
+    async def _store(self, key: str, data: Dict[str, Any], size: int, ttl: float, body: Optional[bytes]) -> None:
+        """Store an entry in the backend.
+
+        Args:
+            key (str): cache key.
+            data (Dict[str, Any]): decoded response.
+            size (int): size of the response body in bytes.
+            ttl (float): time to live in seconds.
+            body (Optional[bytes]): json body of the response, if known.
+        """
+
+
+class MemoryCache(BaseCache):
+    """In memory response cache with least recently used eviction.
+
+    Cached responses are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Initialise cache.
+
+        Args:
+            ttl (Optional[Mapping[str, float]], optional): time to live in seconds
+                per endpoint, merged over DEFAULT_TTL. Defaults to None.
+            max_entries (int, optional): maximum number of cached responses.
+                Defaults to 1024.
+            max_bytes (int, optional): maximum total size of cached response
+                bodies. Defaults to 64 MiB.
+        """
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+    async def clear(self) -> None:
+        """Remove every cached response."""
+        self._entries.clear()
+        self.size = 0
+
+    async def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a fresh entry.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: cached response if there is a fresh one.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, size, data = entry
+        if expires <= utils.monotonic():
+            del self._entries[key]
+            self.size -= size
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    async def _store(self, key: str, data: Dict[str, Any], size: int, ttl: float, body: Optional[bytes]) -> None:
+        """Store an entry, evicting the least recently used ones to make room.
+
+        Args:
+            key (str): cache key.
+            data (Dict[str, Any]): decoded response.
+            size (int): size of the response body in bytes.
+            ttl (float): time to live in seconds.
+            body (Optional[bytes]): json body of the response, unused.
+        """
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self._entries[key] = (utils.monotonic() + ttl, size, data)
+        self.size += size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self.size -= evicted
+            self.evictions += 1
+
+
+class SQLiteCache(BaseCache):
+    """Response cache persisted in a local SQLite database.
+
+    Bodies are stored zlib compressed next to their expiry time so the cache
+    survives restarts and can be shared by every process on a host. Database
+    access runs in the default executor to keep the event loop free.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"] = "asyncpixel.sqlite",
+        ttl: Optional[Mapping[str, float]] = None,
+        compression_level: int = 6,
+        json_decoder: Optional[Union[str, codec.Decoder]] = None,
+    ) -> None:
+        """Initialise cache.
+
+        Args:
+            path (Union[str, os.PathLike[str]], optional): path of the database file.
+                Defaults to "asyncpixel.sqlite".
+            ttl (Optional[Mapping[str, float]], optional): time to live in seconds
+                per endpoint, merged over DEFAULT_TTL. Defaults to None.
+            compression_level (int, optional): zlib compression level. Defaults to 6.
+            json_decoder (Optional[Union[str, codec.Decoder]], optional): json
+                backend used to decode entries, "orjson", "msgspec", "json" or a
+                function decoding bytes. Defaults to the fastest installed.
+        """
+        super().__init__(ttl)
+        self.compression_level = compression_level
+        self._decode = codec.get_decoder(json_decoder)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL NOT NULL, body BLOB NOT NULL)"
+        )
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a database call in the default executor.
+
+        Args:
+            function (Callable[..., T]): function to run.
+            *args (Any): arguments of the function.
+
+        Returns:
+            T: return value of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    def _execute(self, query: str, *args: Any) -> int:
+        """Execute a query while holding the connection lock.
+
+        Args:
+            query (str): sql query.
+            *args (Any): query parameters.
+
+        Returns:
+            int: number of rows changed.
+        """
+        with self._lock:
+            return self._connection.execute(query, args).rowcount
+
+    def _fetch(self, query: str, *args: Any) -> Optional[Tuple[Any, ...]]:
+        """Execute a query and fetch its first row while holding the connection lock.
+
+        Args:
+            query (str): sql query.
+            *args (Any): query parameters.
+
+        Returns:
+            Optional[Tuple[Any, ...]]: first row, None if there are no rows.
+        """
+        with self._lock:
+            row: Optional[Tuple[Any, ...]] = self._connection.execute(query, args).fetchone()
+            return row
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read and decode a fresh entry.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: cached response if there is a fresh one.
+        """
+        row = self._fetch("SELECT body FROM responses WHERE key = ? AND expires > ?", key, _timestamp())
+        if row is None:
+            return None
+        data: Dict[str, Any] = self._decode(zlib.decompress(row[0]))
+        return data
+
+    def _write(self, key: str, data: Dict[str, Any], ttl: float, body: Optional[bytes]) -> None:
+        """Compress and write an entry.
+
+        Args:
+            key (str): cache key.
+            data (Dict[str, Any]): decoded response, encoded if body is None.
+            ttl (float): time to live in seconds.
+            body (Optional[bytes]): json body of the response.
+        """
+        if body is None:
+            body = codec.encode(data)
+        compressed = zlib.compress(body, self.compression_level)
+        self._execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", key, _timestamp() + ttl, compressed)
+
+    async def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a fresh entry.
+
+        Args:
+            key (str): cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: cached response if there is a fresh one.
+        """
+        return await self._run(self._read, key)
+
+    async def _store(self, key: str, data: Dict[str, Any], size: int, ttl: float, body: Optional[bytes]) -> None:
+        """Store an entry.
+
+        Args:
+            key (str): cache key.
+            data (Dict[str, Any]): decoded response.
+            size (int): size of the response body in bytes.
+            ttl (float): time to live in seconds.
+            body (Optional[bytes]): json body of the response, if known.
+        """
+        await self._run(self._write, key, data, ttl, body)
+
+    async def purge(self) -> int:
+        """Remove expired entries.
+
+        Returns:
+            int: number of entries removed.
+        """
+        removed = await self._run(self._execute, "DELETE FROM responses WHERE expires <= ?", _timestamp())
+        self.evictions += removed
+        return removed
+
+    async def clear(self) -> None:
+        """Remove every cached response."""
+        await self._run(self._execute, "DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
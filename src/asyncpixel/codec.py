@@ -0,0 +1,98 @@
+"""Json decoding of api responses with optional fast backends."""
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+__all__ = ["DECODERS", "Decoder", "decode_msgspec", "decode_orjson", "decode_stdlib", "encode", "get_decoder"]
+
+Decoder = Callable[[bytes], Any]
+
+
+def decode_stdlib(body: bytes) -> Any:
+    """Decode json with the standard library.
+
+    Args:
+        body (bytes): encoded json.
+
+    Returns:
+        Any: decoded json.
+    """
+    return json.loads(body)
+
+
+def decode_orjson(body: bytes) -> Any:
+    """Decode json with orjson.
+
+    Args:
+        body (bytes): encoded json.
+
+    Returns:
+        Any: decoded json.
+    """
+    return orjson.loads(body)
+
+
+def decode_msgspec(body: bytes) -> Any:
+    """Decode json with msgspec.
+
+    Args:
+        body (bytes): encoded json.
+
+    Returns:
+        Any: decoded json.
+    """
+    return msgspec.json.decode(body)
+
+
+DECODERS: Dict[str, Decoder] = {"json": decode_stdlib}
+if msgspec is not None:  # pragma: no branch
+    DECODERS["msgspec"] = decode_msgspec
+if orjson is not None:  # pragma: no branch
+    DECODERS["orjson"] = decode_orjson
+
+
+def get_decoder(decoder: Optional[Union[str, Decoder]] = None) -> Decoder:
+    """Get a json decoder.
+
+    Args:
+        decoder (Optional[Union[str, Decoder]], optional): name of an installed
+            backend in DECODERS, or a function decoding bytes. Defaults to the
+            fastest installed backend: orjson, then msgspec, then the standard
+            library.
+
+    Raises:
+        ValueError: the backend is not installed.
+
+    Returns:
+        Decoder: function decoding json bytes.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        return DECODERS.get("orjson") or DECODERS.get("msgspec") or decode_stdlib
+    if decoder not in DECODERS:
+        raise ValueError(f"Json decoder {decoder!r} is not installed, choose from {sorted(DECODERS)}")
+    return DECODERS[decoder]
+
+
+def encode(data: Any) -> bytes:
+    """Encode json compactly, with orjson if it is installed.
+
+    Args:
+        data (Any): json data.
+
+    Returns:
+        bytes: encoded json.
+    """
+    if orjson is None:  # pragma: no cover
+        return json.dumps(data, separators=(",", ":")).encode()
+    return orjson.dumps(data)
@@ -0,0 +1,328 @@
+"""Columnar snapshot of the auction house for bulk analytics."""
+import datetime
+import statistics
+import time
+import uuid
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from .models import AuctionItem
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+__all__ = ["AuctionColumns"]
+
+
+class _StringTable:
+    """Interned strings addressed by a small integer code."""
+
+    def __init__(self) -> None:
+        """Initialise table."""
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Get the code of a string, interning it if needed.
+
+        Args:
+            value (str): string.
+
+        Returns:
+            int: code of the string.
+        """
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _millis(value: Any) -> int:
+    """Convert a timestamp to milliseconds since the epoch.
+
+    Args:
+        value (Any): datetime or milliseconds since the epoch.
+
+    Returns:
+        int: milliseconds since the epoch.
+    """
+    if isinstance(value, datetime.datetime):
+        return int(value.timestamp() * 1000)
+    return int(value)
+
+
+class AuctionColumns:
+    """Auction house snapshot stored as one contiguous array per field.
+
+    Each auction is a row index into the arrays. Prices and timestamps are
+    64 bit integers, timestamps in milliseconds since the epoch, and item
+    names, tiers and categories are interned and stored as integer codes.
+    The arrays support the buffer protocol, so ``numpy.frombuffer`` gives
+    zero copy views of them. When numpy is installed, from the ``numpy``
+    extra, the queries run vectorised over those views, otherwise they loop
+    over the arrays in Python.
+
+    Args:
+        ids (bytearray): 16 byte uuid of each auction.
+        starting_bids (array): starting bid of each auction.
+        prices (array): highest bid, or the starting bid if there are no bids.
+        starts (array): start time of each auction.
+        ends (array): end time of each auction.
+        bins (array): 1 if the auction is BIN.
+        names (array): item name code of each auction.
+        tiers (array): tier code of each auction.
+        categories (array): category code of each auction.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty snapshot."""
+        self.ids = bytearray()
+        self.starting_bids = array("q")
+        self.prices = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.bins = array("b")
+        self.names = array("i")
+        self.tiers = array("h")
+        self.categories = array("h")
+        self._names = _StringTable()
+        self._tiers = _StringTable()
+        self._categories = _StringTable()
+
+    @classmethod
+    def from_auctions(cls, auctions: Iterable[AuctionItem]) -> "AuctionColumns":
+        """Build a snapshot from auction models.
+
+        Args:
+            auctions (Iterable[AuctionItem]): auctions.
+
+        Returns:
+            AuctionColumns: snapshot of the auctions.
+        """
+        columns = cls()
+        for auction in auctions:
+            columns.add(auction)
+        return columns
+
+    @classmethod
+    def from_json(cls, auctions: Iterable[Mapping[str, Any]]) -> "AuctionColumns":
+        """Build a snapshot straight from auction json without creating models.
+
+        Args:
+            auctions (Iterable[Mapping[str, Any]]): auctions as returned by hypixel.
+
+        Returns:
+            AuctionColumns: snapshot of the auctions.
+        """
+        columns = cls()
+        for auction in auctions:
+            columns._append(
+                uuid.UUID(auction["uuid"]).bytes,
+                auction["starting_bid"],
+                auction.get("highest_bid_amount", 0),
+                auction["start"],
+                auction["end"],
+                auction.get("bin", False),
+                auction["item_name"],
+                auction["tier"],
+                auction["category"],
+            )
+        return columns
+
+    def add(self, auction: AuctionItem) -> None:
+        """Append an auction.
+
+        Args:
+            auction (AuctionItem): auction.
+        """
+        self._append(
+            auction.uuid.bytes,
+            auction.starting_bid,
+            auction.highest_bid_amount,
+            auction.start,
+            auction.end,
+            auction.bin,
+            auction.item_name,
+            auction.tier,
+            auction.category,
+        )
+
+    def _append(
+        self,
+        auction_id: bytes,
+        starting_bid: int,
+        highest_bid: int,
+        start: Any,
+        end: Any,
+        bin: bool,
+        name: str,
+        tier: str,
+        category: str,
+    ) -> None:
+        """Append a row to every column."""
+        self.ids += auction_id
+        self.starting_bids.append(starting_bid)
+        self.prices.append(max(starting_bid, highest_bid))
+        self.starts.append(_millis(start))
+        self.ends.append(_millis(end))
+        self.bins.append(bool(bin))
+        self.names.append(self._names.code(name))
+        self.tiers.append(self._tiers.code(tier))
+        self.categories.append(self._categories.code(category))
+
+    def __len__(self) -> int:
+        """Number of auctions."""
+        return len(self.prices)
+
+    def uuid(self, row: int) -> uuid.UUID:
+        """Get the uuid of an auction.
+
+        Args:
+            row (int): row of the auction.
+
+        Returns:
+            uuid.UUID: uuid of the auction.
+        """
+        return uuid.UUID(bytes=bytes(self.ids[row * 16 : row * 16 + 16]))
+
+    def name(self, row: int) -> str:
+        """Get the item name of an auction.
+
+        Args:
+            row (int): row of the auction.
+
+        Returns:
+            str: item name.
+        """
+        return self._names.values[self.names[row]]
+
+    def tier(self, row: int) -> str:
+        """Get the tier of an auction.
+
+        Args:
+            row (int): row of the auction.
+
+        Returns:
+            str: tier.
+        """
+        return self._tiers.values[self.tiers[row]]
+
+    def _view(self, column: array) -> Any:  # type: ignore[type-arg]
+        """Get a zero copy numpy view of a column.
+
+        Args:
+            column (array): column.
+
+        Returns:
+            Any: numpy array sharing the memory of the column.
+        """
+        return numpy.frombuffer(column, dtype=column.typecode)
+
+    def where(
+        self,
+        bin: Optional[bool] = None,
+        name: Optional[str] = None,
+        tier: Optional[str] = None,
+        category: Optional[str] = None,
+        max_price: Optional[int] = None,
+        rows: Optional[Sequence[int]] = None,
+    ) -> List[int]:
+        """Select the rows matching every given condition.
+
+        String conditions are compared as interned codes, so each row costs an
+        integer comparison per condition.
+
+        Args:
+            bin (Optional[bool], optional): BIN flag. Defaults to None.
+            name (Optional[str], optional): exact item name. Defaults to None.
+            tier (Optional[str], optional): tier. Defaults to None.
+            category (Optional[str], optional): category. Defaults to None.
+            max_price (Optional[int], optional): highest price. Defaults to None.
+            rows (Optional[Sequence[int]], optional): rows to select from,
+                defaults to every row.
+
+        Returns:
+            List[int]: matching rows.
+        """
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            for column, table, value in (
+                (self.names, self._names, name),
+                (self.tiers, self._tiers, tier),
+                (self.categories, self._categories, category),
+            ):
+                if value is not None:
+                    mask &= self._view(column) == table.codes.get(value, -1)
+            if bin is not None:
+                mask &= self._view(self.bins) == bin
+            if max_price is not None:
+                mask &= self._view(self.prices) <= max_price
+            if rows is None:
+                matched: List[int] = numpy.flatnonzero(mask).tolist()
+            else:
+                indices = numpy.asarray(rows, dtype=numpy.intp)
+                matched = indices[mask[indices]].tolist()
+            return matched
+        selected: Sequence[int] = range(len(self)) if rows is None else rows
+        for column, table, value in (
+            (self.names, self._names, name),
+            (self.tiers, self._tiers, tier),
+            (self.categories, self._categories, category),
+        ):
+            if value is not None:
+                code = table.codes.get(value, -1)
+                selected = [row for row in selected if column[row] == code]
+        if bin is not None:
+            selected = [row for row in selected if self.bins[row] == bin]
+        if max_price is not None:
+            prices = self.prices
+            selected = [row for row in selected if prices[row] <= max_price]
+        return list(selected)
+
+    def ending_within(self, seconds: float, now: Optional[float] = None) -> List[int]:
+        """Select the auctions that end within a number of seconds.
+
+        Args:
+            seconds (float): window in seconds.
+            now (Optional[float], optional): current time in seconds since the
+                epoch. Defaults to the current time.
+
+        Returns:
+            List[int]: rows of the auctions, auctions that already ended excluded.
+        """
+        start = int((time.time() if now is None else now) * 1000)
+        stop = start + int(seconds * 1000)
+        if numpy is not None:
+            ends = self._view(self.ends)
+            ending: List[int] = numpy.flatnonzero((ends >= start) & (ends <= stop)).tolist()
+            return ending
+        return [row for row, end in enumerate(self.ends) if start <= end <= stop]
+
+    def median_prices(self, rows: Optional[Sequence[int]] = None) -> Dict[str, float]:
+        """Get the median price per item name.
+
+        Args:
+            rows (Optional[Sequence[int]], optional): rows to aggregate,
+                defaults to every row.
+
+        Returns:
+            Dict[str, float]: median price of each item name.
+        """
+        if numpy is not None:
+            codes, prices = self._view(self.names), self._view(self.prices)
+            if rows is not None:
+                indices = numpy.asarray(rows, dtype=numpy.intp)
+                codes, prices = codes[indices], prices[indices]
+            order = numpy.lexsort((prices, codes))
+            codes, prices = codes[order], prices[order].astype(float)
+            unique, first, counts = numpy.unique(codes, return_index=True, return_counts=True)
+            medians = (prices[first + (counts - 1) // 2] + prices[first + counts // 2]) / 2
+            return {self._names.values[code]: median for code, median in zip(unique.tolist(), medians.tolist())}
+        groups: Dict[int, List[int]] = {}
+        names, prices = self.names, self.prices
+        for row in range(len(self)) if rows is None else rows:
+            groups.setdefault(names[row], []).append(prices[row])
+        return {self._names.values[code]: statistics.median(group) for code, group in groups.items()}
@@ -2,9 +2,9 @@
 import json
 import os
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
 
@@ -30,6 +30,58 @@ class GameType(BaseModel):
     clean_name: str
     standard_name: str
     legacy: bool = False
+    model_config = ConfigDict(frozen=True)
+
+
+class GameTypeIndex:
+    """Game types indexed by id and by each of their names.
+
+    Every lookup is a dict lookup returning the shared GameType instance. If
+    several game types share a key the first one wins.
+    """
+
+    def __init__(self, game_types: Iterable[GameType]) -> None:
+        """Initialise index.
+
+        Args:
+            game_types (Iterable[GameType]): game types to index.
+        """
+        self.by_id: Dict[int, GameType] = {}
+        self.by_type_name: Dict[str, GameType] = {}
+        self.by_database_name: Dict[str, GameType] = {}
+        self.by_clean_name: Dict[str, GameType] = {}
+        for game_type in game_types:
+            self.by_id.setdefault(game_type.id, game_type)
+            self.by_type_name.setdefault(game_type.type_name, game_type)
+            self.by_database_name.setdefault(game_type.database_name, game_type)
+            self.by_clean_name.setdefault(game_type.clean_name, game_type)
+
+    def get(self, game_type: Union[str, int]) -> GameType:
+        """Get a game type from its id or name.
+
+        Names are matched against the type name, then the database name and
+        then the clean name.
+
+        Args:
+            game_type (Union[str, int]): id or name of the game type.
+
+        Raises:
+            ValueError: no game type matches.
+
+        Returns:
+            GameType: game type.
+        """
+        if isinstance(game_type, str):
+            found = (
+                self.by_type_name.get(game_type)
+                or self.by_database_name.get(game_type)
+                or self.by_clean_name.get(game_type)
+            )
+        else:
+            found = self.by_id.get(game_type)
+        if found is None:
+            raise ValueError(f"Unknown game type {game_type!r}")
+        return found
 
 
 # with open("asyncpixel/hypixelconstants/build/achievements.json") as file:
@@ -87,3 +139,13 @@ def get_game_types() -> List[GameType]:
     with open(abs_file_path) as file:
         game_types_data: Dict[str, Any] = json.load(file)
     return [GameType.model_validate(data) for data in game_types_data]
+
+
+@lru_cache()
+def get_game_type_index() -> GameTypeIndex:
+    """Get the index of the current game types.
+
+    Returns:
+        GameTypeIndex: game types by id and name.
+    """
+    return GameTypeIndex(get_game_types())
@@ -0,0 +1,380 @@
+"""Crawling of the friend graph into compact adjacency arrays."""
+import asyncio
+import heapq
+import json
+import os
+import sys
+import uuid
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .hypixel import UUID, Hypixel
+from .models import Friend
+
+__all__ = ["FriendCrawler", "FriendGraph"]
+
+DISCOVERED = 0
+CRAWLED = 1
+FAILED = 2
+
+
+class FriendGraph:
+    """Friend graph with players interned as integer node ids.
+
+    Node ``n`` is the player whose 16 byte uuid is at ``ids[16 * n]``. Each
+    friendship is stored once as an edge between two node ids, along with
+    the time it started in milliseconds since the epoch. :meth:`csr` packs
+    the edges into compressed sparse row arrays for traversal.
+
+    Args:
+        ids (bytearray): 16 byte uuid of each node.
+        depths (array): hops from the nearest seed of each node.
+        states (bytearray): whether the friends of each node were crawled,
+            DISCOVERED, CRAWLED or FAILED.
+        sources (array): first node of each edge.
+        targets (array): second node of each edge.
+        started (array): start time of each edge.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty graph."""
+        self.ids = bytearray()
+        self.depths = array("h")
+        self.states = bytearray()
+        self.sources = array("i")
+        self.targets = array("i")
+        self.started = array("q")
+        self._index: Dict[bytes, int] = {}
+        self._csr: "Optional[Tuple[array[int], array[int]]]" = None
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return len(self.depths)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of friendships."""
+        return len(self.sources)
+
+    def node(self, player_uuid: UUID) -> Optional[int]:
+        """Get the node id of a player.
+
+        Args:
+            player_uuid (UUID): uuid of the player.
+
+        Returns:
+            Optional[int]: node id, None if the player is not in the graph.
+        """
+        return self._index.get(_uuid(player_uuid).bytes)
+
+    def uuid_of(self, node: int) -> uuid.UUID:
+        """Get the uuid of a node.
+
+        Args:
+            node (int): node id.
+
+        Returns:
+            uuid.UUID: uuid of the player.
+        """
+        return uuid.UUID(bytes=bytes(self.ids[16 * node : 16 * node + 16]))
+
+    def add_node(self, player_uuid: UUID, depth: int) -> Tuple[int, bool]:
+        """Add a player, or lower its depth if it is closer than seen before.
+
+        Args:
+            player_uuid (UUID): uuid of the player.
+            depth (int): hops from the nearest seed.
+
+        Returns:
+            Tuple[int, bool]: node id, and whether the player was added or
+                its depth lowered.
+        """
+        key = _uuid(player_uuid).bytes
+        node = self._index.get(key)
+        if node is None:
+            node = self._index[key] = len(self.depths)
+            self.ids += key
+            self.depths.append(depth)
+            self.states.append(DISCOVERED)
+            return node, True
+        if depth < self.depths[node]:
+            self.depths[node] = depth
+            return node, True
+        return node, False
+
+    def add_edge(self, source: int, target: int, started: int = 0) -> None:
+        """Add a friendship.
+
+        Args:
+            source (int): node id of one friend.
+            target (int): node id of the other friend.
+            started (int, optional): start time in milliseconds since the epoch.
+                Defaults to 0.
+        """
+        self.sources.append(source)
+        self.targets.append(target)
+        self.started.append(started)
+        self._csr = None
+
+    def csr(self) -> "Tuple[array[int], array[int]]":
+        """Pack the edges into compressed sparse row arrays.
+
+        Every friendship appears in both directions. The friends of node ``n``
+        are ``targets[offsets[n]:offsets[n + 1]]``. The arrays are cached
+        until an edge is added.
+
+        Returns:
+            Tuple[array, array]: offsets of each node and target of each entry.
+        """
+        if self._csr is None:
+            offsets = array("q", bytes(8 * (len(self) + 1)))
+            for node in self.sources:
+                offsets[node + 1] += 1
+            for node in self.targets:
+                offsets[node + 1] += 1
+            for node in range(len(self)):
+                offsets[node + 1] += offsets[node]
+            fill = array("q", offsets[:-1])
+            targets = array("i", bytes(4 * offsets[-1]))
+            for source, target in zip(self.sources, self.targets):
+                targets[fill[source]] = target
+                fill[source] += 1
+                targets[fill[target]] = source
+                fill[target] += 1
+            self._csr = (offsets, targets)
+        return self._csr
+
+    def friends(self, player_uuid: UUID) -> List[uuid.UUID]:
+        """Get the friends of a player found so far.
+
+        Args:
+            player_uuid (UUID): uuid of the player.
+
+        Returns:
+            List[uuid.UUID]: uuids of the friends, empty if the player is not
+                in the graph.
+        """
+        node = self.node(player_uuid)
+        if node is None:
+            return []
+        offsets, targets = self.csr()
+        return [self.uuid_of(friend) for friend in targets[offsets[node] : offsets[node + 1]]]
+
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Write the graph to a checkpoint file.
+
+        The file is replaced atomically, so an interrupted save leaves the
+        previous checkpoint intact.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): path of the checkpoint.
+        """
+        header = {"byteorder": sys.byteorder, "nodes": len(self), "edges": self.edge_count}
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(json.dumps(header).encode() + b"\n")
+            file.write(self.ids)
+            self.depths.tofile(file)
+            file.write(self.states)
+            self.sources.tofile(file)
+            self.targets.tofile(file)
+            self.started.tofile(file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"]) -> "FriendGraph":
+        """Read a graph from a checkpoint file.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): path of the checkpoint.
+
+        Returns:
+            FriendGraph: graph as it was saved.
+        """
+        graph = cls()
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            nodes, edges = header["nodes"], header["edges"]
+            graph.ids = bytearray(file.read(16 * nodes))
+            graph.depths.fromfile(file, nodes)
+            graph.states = bytearray(file.read(nodes))
+            graph.sources.fromfile(file, edges)
+            graph.targets.fromfile(file, edges)
+            graph.started.fromfile(file, edges)
+        if header["byteorder"] != sys.byteorder:
+            for values in (graph.depths, graph.sources, graph.targets, graph.started):
+                values.byteswap()
+        graph._index = {bytes(graph.ids[16 * node : 16 * node + 16]): node for node in range(nodes)}
+        return graph
+
+
+def _uuid(value: UUID) -> uuid.UUID:
+    """Parse a uuid.
+
+    Args:
+        value (UUID): uuid as a string or object.
+
+    Returns:
+        uuid.UUID: parsed uuid.
+    """
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
+class FriendCrawler:
+    """Crawl the friends of players outwards from seed players.
+
+    Players are crawled in order of priority, by default breadth first. The
+    friends of players closer to a seed than ``max_depth`` are fetched,
+    players at ``max_depth`` are only recorded. At most ``max_nodes`` friend
+    lists are fetched in total, including those of a resumed crawl, fetches
+    that fail do not count towards it.
+    """
+
+    def __init__(
+        self,
+        client: Hypixel,
+        max_depth: int = 2,
+        max_nodes: int = 10_000,
+        concurrency: int = 10,
+        priority: Optional[Callable[[uuid.UUID, int], float]] = None,
+        graph: Optional[FriendGraph] = None,
+        checkpoint: Optional[Union[str, "os.PathLike[str]"]] = None,
+        checkpoint_every: int = 1000,
+        wait_for_ratelimit: bool = True,
+    ) -> None:
+        """Initialise crawler.
+
+        Args:
+            client (Hypixel): client used to fetch friends.
+            max_depth (int, optional): hops from the seeds to crawl. Defaults to 2.
+            max_nodes (int, optional): maximum number of friend lists fetched.
+                Defaults to 10 000.
+            concurrency (int, optional): Maximum number of friend lists fetched at
+                once. Defaults to 10.
+            priority (Optional[Callable[[uuid.UUID, int], float]], optional): key
+                of a player given its uuid and depth, lowest is crawled first.
+                Defaults to the depth.
+            graph (Optional[FriendGraph], optional): graph to resume crawling,
+                players not crawled yet are crawled. Defaults to an empty graph.
+            checkpoint (Optional[Union[str, os.PathLike[str]]], optional): path the
+                graph is saved to while crawling and when the crawl stops.
+                Defaults to None.
+            checkpoint_every (int, optional): friend lists fetched between
+                checkpoints. Defaults to 1000.
+            wait_for_ratelimit (bool, optional): wait for the ratelimit instead
+                of failing fetches with RateLimitError. Defaults to True.
+        """
+        self.client = client
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.concurrency = concurrency
+        self.priority = priority
+        self.graph = FriendGraph() if graph is None else graph
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.wait_for_ratelimit = wait_for_ratelimit
+        self.errors = 0
+        self._queue: List[Tuple[float, int, int]] = []
+        self._pushed = 0
+
+    @classmethod
+    def resume(cls, client: Hypixel, checkpoint: Union[str, "os.PathLike[str]"], **kwargs: Any) -> "FriendCrawler":
+        """Resume a crawl from its checkpoint.
+
+        Args:
+            client (Hypixel): client used to fetch friends.
+            checkpoint (Union[str, os.PathLike[str]]): path of the checkpoint, it
+                keeps being updated.
+            **kwargs (Any): other arguments of the crawler.
+
+        Returns:
+            FriendCrawler: crawler continuing from the checkpoint.
+        """
+        return cls(client, graph=FriendGraph.load(checkpoint), checkpoint=checkpoint, **kwargs)
+
+    def _push(self, node: int) -> None:
+        """Queue a node to be crawled if it is within the depth limit.
+
+        Args:
+            node (int): node id.
+        """
+        depth = self.graph.depths[node]
+        if depth >= self.max_depth or self.graph.states[node] == CRAWLED:
+            return
+        key = float(depth) if self.priority is None else self.priority(self.graph.uuid_of(node), depth)
+        heapq.heappush(self._queue, (key, self._pushed, node))
+        self._pushed += 1
+
+    async def crawl(self, seeds: Iterable[UUID] = ()) -> FriendGraph:
+        """Crawl from the seeds and any players left by a previous crawl.
+
+        Failing friend lists are counted in errors and retried by the next
+        crawl.
+
+        Args:
+            seeds (Iterable[UUID], optional): uuids of the players to start from.
+                Defaults to none.
+
+        Returns:
+            FriendGraph: graph crawled.
+        """
+        graph = self.graph
+        for seed in seeds:
+            graph.add_node(seed, 0)
+        for node in range(len(graph)):
+            self._push(node)
+
+        loop = asyncio.get_running_loop()
+        crawled = graph.states.count(CRAWLED)
+        tasks: Dict["asyncio.Future[Optional[List[Friend]]]", int] = {}
+        try:
+            while True:
+                while self._queue and len(tasks) < self.concurrency and crawled + len(tasks) < self.max_nodes:
+                    _, _, node = heapq.heappop(self._queue)
+                    if graph.states[node] == CRAWLED or node in tasks.values():
+                        continue
+                    fetch = self.client.player_friends(graph.uuid_of(node), self.wait_for_ratelimit)
+                    tasks[asyncio.ensure_future(fetch)] = node
+                if not tasks:
+                    break
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = tasks.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception:
+                        self.errors += 1
+                        graph.states[node] = FAILED
+                        continue
+                    self._expand(node, result or [])
+                    crawled += 1
+                    if self.checkpoint is not None and crawled % self.checkpoint_every == 0:
+                        # The graph only changes in this coroutine, so it is not
+                        # modified while it is written.
+                        await loop.run_in_executor(None, graph.save, self.checkpoint)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.checkpoint is not None:
+                await loop.run_in_executor(None, graph.save, self.checkpoint)
+        return graph
+
+    def _expand(self, node: int, friends: List[Friend]) -> None:
+        """Record the friends of a crawled player.
+
+        Args:
+            node (int): node id of the player.
+            friends (List[Friend]): friends of the player.
+        """
+        graph = self.graph
+        player_uuid = graph.uuid_of(node)
+        depth = graph.depths[node] + 1
+        for friend in friends:
+            other = friend.uuid_receiver if friend.uuid_sender == player_uuid else friend.uuid_sender
+            target, closer = graph.add_node(other, depth)
+            # Friendships with crawled players were recorded when they were crawled.
+            if graph.states[target] != CRAWLED:
+                graph.add_edge(node, target, int(friend.started.timestamp() * 1000))
+            if closer:
+                self._push(target)
+        graph.states[node] = CRAWLED
@@ -0,0 +1,167 @@
+"""Connection settings of the http sessions used by the client."""
+import asyncio
+from typing import Dict, Optional
+
+import aiohttp
+
+__all__ = ["MOJANG_CONFIG", "HttpConfig", "LazySession"]
+
+
+class HttpConfig:
+    """Settings for an aiohttp session.
+
+    The defaults are tuned for crawling api.hypixel.net, a single host serving
+    large responses: connections are pooled and kept alive between requests,
+    dns lookups are cached and a stalled read fails instead of hanging.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 100,
+        keepalive_timeout: float = 60.0,
+        ttl_dns_cache: Optional[int] = 300,
+        total_timeout: Optional[float] = 60.0,
+        connect_timeout: Optional[float] = 10.0,
+        sock_read_timeout: Optional[float] = 30.0,
+        compress: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+    ) -> None:
+        """Initialise settings.
+
+        Args:
+            limit (int, optional): maximum number of open connections, 0 for no
+                limit. Defaults to 100.
+            limit_per_host (int, optional): maximum number of open connections to
+                one host, 0 for no limit. Defaults to 100.
+            keepalive_timeout (float, optional): seconds an idle connection is
+                kept open for reuse. Defaults to 60.0.
+            ttl_dns_cache (Optional[int], optional): seconds dns lookups are
+                cached, None to cache them forever. Defaults to 300.
+            total_timeout (Optional[float], optional): seconds a request may take
+                in total, None for no limit. Defaults to 60.0.
+            connect_timeout (Optional[float], optional): seconds to wait for a
+                connection, including waiting for a free one in the pool. Defaults
+                to 10.0.
+            sock_read_timeout (Optional[float], optional): seconds to wait between
+                two reads of the response. Defaults to 30.0.
+            compress (bool, optional): ask for compressed responses. Defaults to True.
+            headers (Optional[Dict[str, str]], optional): headers sent with every
+                request. Defaults to None.
+            connector (Optional[aiohttp.BaseConnector], optional): connector to use
+                instead of building one from the pool settings, it is not closed
+                with the session. Defaults to None.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.total_timeout = total_timeout
+        self.connect_timeout = connect_timeout
+        self.sock_read_timeout = sock_read_timeout
+        self.compress = compress
+        self.headers = {} if headers is None else dict(headers)
+        self.connector = connector
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        """Build the timeouts of a session.
+
+        Returns:
+            aiohttp.ClientTimeout: timeouts.
+        """
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout, connect=self.connect_timeout, sock_read=self.sock_read_timeout
+        )
+
+    def session(self) -> aiohttp.ClientSession:
+        """Build a session with these settings.
+
+        Returns:
+            aiohttp.ClientSession: new session.
+        """
+        headers = dict(self.headers)
+        if not self.compress:
+            headers.setdefault("Accept-Encoding", "identity")
+        connector = self.connector
+        if connector is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+            )
+        return aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=self.connector is None,
+            timeout=self.timeout(),
+            headers=headers,
+        )
+
+
+class LazySession:
+    """Session created on first use inside the running event loop.
+
+    A session belongs to the loop it was created in. It is created again when
+    it is used from another loop or after it has been closed, so a client can
+    be built outside of any coroutine and outlive several loops.
+    """
+
+    def __init__(self, config: HttpConfig, session: Optional[aiohttp.ClientSession] = None) -> None:
+        """Initialise lazy session.
+
+        Args:
+            config (HttpConfig): settings of the sessions created.
+            session (Optional[aiohttp.ClientSession], optional): session to use
+                instead of creating one, it is never closed or replaced.
+                Defaults to None.
+        """
+        self.config = config
+        self._shared = session
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def session(self) -> aiohttp.ClientSession:
+        """Get the session, creating it if needed.
+
+        Must be called from a coroutine.
+
+        Returns:
+            aiohttp.ClientSession: session bound to the running loop.
+        """
+        if self._shared is not None:
+            return self._shared
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not None and self._loop is not loop:
+            self._discard(self._session, self._loop)
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self.config.session()
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    def _discard(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a session of another loop without awaiting it.
+
+        The session is closed in its loop if that loop is still running.
+        Otherwise it is detached from its connector, whose connections are
+        left for aiohttp to collect.
+
+        Args:
+            session (aiohttp.ClientSession): session to close.
+            loop (asyncio.AbstractEventLoop): loop the session belongs to.
+        """
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            session.detach()
+
+    async def close(self) -> None:
+        """Close the session if it was created here."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+# Mojang only allows a few hundred lookups every ten minutes, a small pool is plenty.
+MOJANG_CONFIG = HttpConfig(limit=10, limit_per_host=10, keepalive_timeout=15.0, total_timeout=10.0)
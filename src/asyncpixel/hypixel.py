@@ -12,14 +12,34 @@
 #
 # You should have received a copy of the GNU General Public License a
 # long with this program. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
 import datetime
+import importlib
+import itertools
 import uuid
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import ModuleType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import aiohttp
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter
 
+from .cache import BaseCache
+from .codec import Decoder, get_decoder
 from .exceptions import ApiNoSuccessError, InvalidApiKeyError, RateLimitError
+from .http import MOJANG_CONFIG, HttpConfig, LazySession
 from .models import (
     Auction,
     AuctionEnded,
@@ -31,15 +51,20 @@ from .models import (
     Game,
     GameCounts,
     Guild,
+    GuildWithPlayers,
     Key,
     Leaderboards,
     News,
     Player,
+    PlayerResult,
     Profile,
     Status,
     WatchDog,
 )
-from .utils import calc_player_level
+from .mojang import NameResolver
+from .ratelimit import KeyPool, RateLimiter
+from .streaming import ArrayItems
+from .utils import calc_player_level, unique_uuids
 
 __all__ = ["Hypixel"]
 
@@ -47,29 +72,162 @@ BASE_URL = "https://api.hypixel.net/"
 
 UUID = Union[str, uuid.UUID]
 
+M = TypeVar("M", bound=BaseModel)
+
+# Path, whether a key is needed, whether to wait for the ratelimit and params.
+_Flight = Tuple[str, bool, bool, Tuple[Tuple[str, str], ...]]
+
+_NEWS_ADAPTER = TypeAdapter(List[News])
+_FRIENDS_ADAPTER = TypeAdapter(List[Friend])
+_GAMES_ADAPTER = TypeAdapter(List[Game])
+_AUCTION_ITEMS_ADAPTER = TypeAdapter(List[AuctionItem])
+
 
 class Hypixel:
     """Client class for hypixel wrapper."""
 
     def __init__(
         self,
-        api_key: Optional[UUID] = None,
+        api_key: Optional[Union[UUID, Iterable[UUID]]] = None,
+        wait_for_ratelimit: bool = False,
+        cache: Optional[BaseCache] = None,
+        lazy_stats: bool = False,
+        player_raw: str = "dict",
+        json_decoder: Optional[Union[str, Decoder]] = None,
+        models: str = "pydantic",
+        http: Optional[HttpConfig] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        mojang_http: Optional[HttpConfig] = None,
+        mojang_session: Optional[aiohttp.ClientSession] = None,
     ) -> None:
         """Initialise client object.
 
         Args:
-            api_key (Optional[UUID], optional): hypixel api key. Defaults to None.
-        """
-        if isinstance(api_key, str) and api_key is not None:
-            api_key = uuid.UUID(api_key)
-        self.api_key = api_key
-        self._session = aiohttp.ClientSession()
-        self.requests_remaining: int = -1
-        self.total_requests: int = 0
-        self._ratelimit_reset: datetime.datetime = datetime.datetime(1998, 1, 1)
-        self.retry_after: datetime.datetime = datetime.datetime(1998, 1, 1)
+            api_key (Optional[Union[UUID, Iterable[UUID]]], optional): hypixel api key
+                or a pool of keys to spread requests across. Defaults to None.
+            wait_for_ratelimit (bool, optional): wait for the ratelimit to allow a
+                request instead of raising RateLimitError. Requests that need no
+                key have no known budget, they only wait out a throttle from
+                hypixel. Defaults to False.
+            cache (Optional[BaseCache], optional): cache to serve responses from.
+                Defaults to None.
+            lazy_stats (bool, optional): validate the stats of each game of a
+                player only when they are first accessed. Defaults to False.
+            player_raw (str, optional): how the raw data of a player is kept,
+                "dict" as decoded, "json" as compact json bytes or "none" to
+                drop it. Defaults to "dict".
+            json_decoder (Optional[Union[str, Decoder]], optional): json backend
+                used to decode responses, "orjson", "msgspec", "json" or a
+                function decoding bytes. Defaults to the fastest installed.
+            models (str, optional): model family built by the auction, bazaar and
+                guild endpoints, "pydantic" or "msgspec" for the compact structs
+                of :mod:`asyncpixel.structs`. Defaults to "pydantic".
+            http (Optional[HttpConfig], optional): connection settings for the
+                hypixel api. Defaults to settings tuned for api.hypixel.net.
+            session (Optional[aiohttp.ClientSession], optional): session to send
+                hypixel api requests with instead of building one from http, it
+                is not closed with the client. Defaults to None.
+            mojang_http (Optional[HttpConfig], optional): connection settings for
+                the mojang api. Defaults to a small pool.
+            mojang_session (Optional[aiohttp.ClientSession], optional): session to
+                send mojang api requests with, it is not closed with the client.
+                Defaults to None.
+
+        Raises:
+            ValueError: unknown model family or raw mode of players.
+        """
+        if api_key is None:
+            api_key = []
+        elif isinstance(api_key, (str, uuid.UUID)):
+            api_key = [api_key]
+        self._keys = KeyPool(api_key)
+        self.wait_for_ratelimit = wait_for_ratelimit
+        self.cache = cache
+        self.lazy_stats = lazy_stats
+        if player_raw not in ("dict", "json", "none"):
+            raise ValueError(f"Unknown raw mode {player_raw!r}, choose from ['dict', 'json', 'none']")
+        self.player_raw = player_raw
+        self._decode = get_decoder(json_decoder)
+        self._structs: Optional[ModuleType] = None
+        if models == "msgspec":
+            self._structs = importlib.import_module(".structs", __package__)
+        elif models != "pydantic":
+            raise ValueError(f"Unknown model family {models!r}, choose from ['msgspec', 'pydantic']")
+        self.models = models
+        self.http = HttpConfig() if http is None else http
+        self.mojang_http = MOJANG_CONFIG if mojang_http is None else mojang_http
+        self._session = LazySession(self.http, session)
+        self._mojang_session = LazySession(self.mojang_http, mojang_session)
+        self.names = NameResolver(self._mojang_session)
+        self._keyless_ratelimit = RateLimiter()
+        self._inflight: Dict[_Flight, "asyncio.Future[Dict[str, Any]]"] = {}
         self._calc_player_level = calc_player_level
 
+    def _model(self, model: Type[M], data: Any) -> M:
+        """Build a model, or the struct of the same name when using msgspec.
+
+        Args:
+            model (Type[M]): pydantic model.
+            data (Any): decoded json.
+
+        Returns:
+            M: model or struct with the same attributes.
+        """
+        if self._structs is None:
+            return model.model_validate(data)
+        return cast(M, self._structs.convert(data, getattr(self._structs, model.__name__)))
+
+    def _auction_items(self, data: Any) -> List[AuctionItem]:
+        """Build a list of auctions.
+
+        Args:
+            data (Any): decoded json.
+
+        Returns:
+            List[AuctionItem]: auctions.
+        """
+        if self._structs is None:
+            return _AUCTION_ITEMS_ADAPTER.validate_python(data)
+        item: Any = self._structs.AuctionItem
+        return cast(List[AuctionItem], self._structs.convert(data, List[item]))
+
+    @property
+    def api_key(self) -> Optional[uuid.UUID]:
+        """First api key in the pool."""
+        return next(iter(self._keys), None)
+
+    @api_key.setter
+    def api_key(self, api_key: Optional[UUID]) -> None:
+        self._keys = KeyPool([] if api_key is None else [api_key])
+
+    @property
+    def api_keys(self) -> List[uuid.UUID]:
+        """Api keys in the pool, keys found to be invalid are dropped."""
+        return list(self._keys)
+
+    @property
+    def requests_remaining(self) -> int:
+        """Requests remaining in the current ratelimit window across all keys, -1 if unknown."""
+        known = [limiter.remaining for limiter in self._keys.limiters if limiter.remaining != -1]
+        return sum(known) if known else -1
+
+    @property
+    def total_requests(self) -> int:
+        """Requests allowed per ratelimit window across all keys, 0 if unknown."""
+        return sum(limiter.limit for limiter in self._keys.limiters)
+
+    @property
+    def retry_after(self) -> datetime.datetime:
+        """Time the api may be used again after being throttled."""
+        return min(
+            (limiter.retry_after for limiter in self._keys.limiters), default=self._keyless_ratelimit.retry_after
+        )
+
+    @property
+    def _ratelimit_reset(self) -> datetime.datetime:
+        """Time the first ratelimit window resets."""
+        return min((limiter.reset for limiter in self._keys.limiters), default=self._keyless_ratelimit.reset)
+
     async def __aenter__(self) -> "Hypixel":
         """Enter context manager."""
         return self  # pragma: no cover
@@ -79,76 +237,166 @@ class Hypixel:
         await self.close()  # pragma: no cover
 
     async def close(self) -> None:
-        """Used for safe client cleanup."""
-        await self._session.close()  # pragma: no cover
+        """Used for safe client cleanup.
+
+        Sessions passed to the client are left open. The client can still be
+        used afterwards, new sessions are then created.
+        """
+        await self._session.close()
+        await self._mojang_session.close()
 
     async def _get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         key_required: bool = True,
+        wait: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """Base function to get raw data from hypixel.
 
+        Responses are served from the cache when the client has one. Identical
+        requests made while one is already in flight share its response instead
+        of sending another request. The returned dictionary may therefore be
+        shared between callers and must not be mutated.
+
         Args:
             path (str):
                 path that you wish to request from.
             params (Dict, optional):
                 parameters to pass into request defaults to empty dictionary.
             key_required (bool): Whether an api key is needed
+            wait (Optional[bool]): wait for the ratelimit instead of raising
+                RateLimitError. Defaults to wait_for_ratelimit of the client.
 
         Raises:
-            RateLimitError: error if ratelimit has been reached.
-            InvalidApiKeyError: error if api key is invalid.
+            RateLimitError: error if ratelimit has been reached and the client
+                is not waiting for it.
+            InvalidApiKeyError: error if no api key in the pool is valid.
             ApiNoSuccessError: error if api throughs an error.
 
         Returns:
             dict: returns a dictionary of the json response.
         """
-        if (
-            self.requests_remaining != -1
-            and (self.requests_remaining == 0 and self._ratelimit_reset > datetime.datetime.now())
-            or self.retry_after
-            and (self.retry_after > datetime.datetime.now())
-        ):
-            raise RateLimitError(self.retry_after)
-
-        if params is None:
-            params = {}
-        if key_required:
-            if self.api_key is None:
-                raise InvalidApiKeyError("No API key provided")
-            params["key"] = str(self.api_key)
-
-        response: aiohttp.ClientResponse = await self._session.get(f"{BASE_URL}{path}", params=params)
-
-        if response.status == 429:
-            self.requests_remaining = 0
-            self.retry_after = datetime.datetime.now() + datetime.timedelta(
-                seconds=int(response.headers["Retry-After"])
-            )
-            raise RateLimitError(
-                datetime.datetime.now() + datetime.timedelta(seconds=int(response.headers["Retry-After"]))
-            )
-
-        elif response.status == 403:
-            raise InvalidApiKeyError()
+        params = {} if params is None else dict(params)
+        if "key" in params:
+            # Requests for an explicit key are never shared.
+            return await self._request(path, params, key_required, wait)
+
+        if self.cache is not None:
+            cached = await self.cache.get(path, params)
+            if cached is not None:
+                return cached
+
+        # Callers that wait for the ratelimit and callers that raise on it
+        # must not be handed each other's outcome.
+        waits = self.wait_for_ratelimit if wait is None else wait
+        flight: _Flight = (
+            path,
+            key_required,
+            waits,
+            tuple(sorted((name, str(value)) for name, value in params.items())),
+        )
+        task = self._inflight.get(flight)
+        if task is None:
+            task = asyncio.ensure_future(self._request(path, params, key_required, wait))
+            self._inflight[flight] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight, None))
+        return await asyncio.shield(task)
+
+    async def _request(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        key_required: bool,
+        wait: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Send a request to hypixel.
 
-        elif response.status != 200:
-            raise ApiNoSuccessError(path)
+        Args:
+            path (str): path that you wish to request from.
+            params (Dict): parameters to pass into request.
+            key_required (bool): Whether an api key is needed
+            wait (Optional[bool]): wait for the ratelimit instead of raising
+                RateLimitError. Defaults to wait_for_ratelimit of the client.
 
-        elif key_required and "RateLimit-Limit" in response.headers:
-            if self.total_requests == 0:
-                self.total_requests = int(response.headers["RateLimit-Limit"])
-            self.requests_remaining = int(response.headers["RateLimit-Remaining"])
-            self._ratelimit_reset = datetime.datetime.now() + datetime.timedelta(
-                seconds=int(response.headers["RateLimit-Reset"])
-            )
+        Raises:
+            RateLimitError: error if ratelimit has been reached and the client
+                is not waiting for it.
+            InvalidApiKeyError: error if no api key in the pool is valid.
+            ApiNoSuccessError: error if api throughs an error.
 
-        data: Dict[str, Any] = await response.json()
+        Returns:
+            dict: returns a dictionary of the json response.
+        """
+        cache_params = dict(params)
+        response = await self._send(path, params, key_required, wait)
+        body = await response.read()
+        data: Dict[str, Any] = self._decode(body)
+        if self.cache is not None:
+            await self.cache.set(path, cache_params, data, len(body), body)
 
         return data
 
+    async def _send(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        key_required: bool,
+        wait: Optional[bool] = None,
+    ) -> aiohttp.ClientResponse:
+        """Send a request to hypixel and check its status.
+
+        Args:
+            path (str): path that you wish to request from.
+            params (Dict): parameters to pass into request.
+            key_required (bool): Whether an api key is needed
+            wait (Optional[bool]): wait for the ratelimit instead of raising
+                RateLimitError. Defaults to wait_for_ratelimit of the client.
+
+        Raises:
+            RateLimitError: error if ratelimit has been reached and the client
+                is not waiting for it.
+            InvalidApiKeyError: error if no api key in the pool is valid.
+            ApiNoSuccessError: error if api throughs an error.
+
+        Returns:
+            aiohttp.ClientResponse: successful response, its body is not read yet.
+        """
+        wait = self.wait_for_ratelimit if wait is None else wait
+        while True:
+            key: Optional[uuid.UUID] = None
+            limiter = self._keyless_ratelimit
+            if key_required:
+                key, limiter = await self._keys.acquire(wait)
+                params["key"] = str(key)
+            else:
+                # Keyless requests report no budget, so only a throttle is waited
+                # out and they are not queued behind a probe.
+                if wait:
+                    await limiter.wait_throttle()
+                await limiter.acquire(False)
+            try:
+                response: aiohttp.ClientResponse = await self._session.session().get(f"{BASE_URL}{path}", params=params)
+                if response.status != 200:
+                    # The body of an error is not read, so hand the connection back.
+                    response.release()
+                if response.status == 429:
+                    retry_after = limiter.throttle(int(response.headers["Retry-After"]))
+                    if wait:
+                        continue
+                    raise RateLimitError(retry_after)
+                elif response.status == 403:
+                    if key is not None and self._keys.remove(key):
+                        continue
+                    raise InvalidApiKeyError()
+                elif response.status != 200:
+                    raise ApiNoSuccessError(path)
+                elif key_required:
+                    limiter.update(response.headers)
+            finally:
+                limiter.release()
+            return response
+
     async def watchdog_stats(self) -> WatchDog:
         """Get current watchdog stats.
 
@@ -190,8 +438,7 @@ class Hypixel:
             Boosters: object containing boosters.
         """
         data = await self._get("boosters")
-        data["decrementing"] = data["boosterState"]["decrementing"]
-        return Boosters.model_validate(data)
+        return Boosters.model_validate({**data, "decrementing": data["boosterState"]["decrementing"]})
 
     async def player_count(self) -> int:
         """Get the current amount of players online.
@@ -211,8 +458,7 @@ class Hypixel:
         """
         data = await self._get("skyblock/news")
 
-        adapter = TypeAdapter(List[News])
-        return adapter.validate_python(data["items"])
+        return _NEWS_ADAPTER.validate_python(data["items"])
 
     async def player_status(self, uuid: UUID) -> Optional[Status]:
         """Get current online status about a player.
@@ -228,22 +474,23 @@ class Hypixel:
             return None
         return Status.model_validate(data["session"])
 
-    async def player_friends(self, uuid: UUID) -> Optional[List[Friend]]:
+    async def player_friends(self, uuid: UUID, wait_for_ratelimit: Optional[bool] = None) -> Optional[List[Friend]]:
         """Get a list of a players friends.
 
         Args:
             uuid (UUID): the uuid of the player you wish to get friends from.
+            wait_for_ratelimit (Optional[bool]): wait for the ratelimit instead of
+                raising RateLimitError. Defaults to wait_for_ratelimit of the client.
 
         Returns:
             List[Friend]: returns a list of friend elements.
         """
         params = {"uuid": str(uuid)}
-        data = await self._get("friends", params=params)
+        data = await self._get("friends", params=params, wait=wait_for_ratelimit)
         if data["records"] is None:
             return None
 
-        adapter = TypeAdapter(List[Friend])
-        return adapter.validate_python(data["records"])
+        return _FRIENDS_ADAPTER.validate_python(data["records"])
 
     async def bazaar(self) -> Bazaar:
         """Get info of the items in the bazaar.
@@ -252,12 +499,13 @@ class Hypixel:
             Bazaar: object for bazzar.
         """
         data = await self._get("skyblock/bazaar", key_required=False)
+        if self._structs is not None:
+            return cast(Bazaar, self._structs.bazaar(data))
 
         bazaar_items = []
 
         for name in data["products"]:
-            elements = data["products"][name]
-            elements["name"] = name
+            elements = {**data["products"][name], "name": name}
             bazaar_items.append(BazaarItem.model_validate(elements))
 
         return Bazaar(
@@ -288,7 +536,73 @@ class Hypixel:
                 pass
         if data is None:  # pragma: no cover
             raise ApiNoSuccessError("Could not get auctions.")
-        return Auction.model_validate(data)
+        return self._model(Auction, data)
+
+    async def auctions_all(self, concurrency: int = 10, retry: int = 3) -> AsyncGenerator[Auction, None]:
+        """Get every page of the auction house.
+
+        The first page is fetched to learn how many pages there are, the rest
+        are then fetched concurrently and yielded in the order they arrive.
+
+        Args:
+            concurrency (int): Maximum number of pages fetched at once. Defaults to 10.
+            retry (int): Amount of attempts to get each page. Defaults to 3.
+
+        Yields:
+            Auction: Auction object for each page.
+
+        Raises:
+            ApiNoSuccessError: Could not get a page of auctions.
+        """
+        first = await self.auctions(0, retry=retry)
+        yield first
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> Auction:
+            async with semaphore:
+                for _ in range(retry - 1):
+                    try:
+                        return await self.auctions(page, retry=1)
+                    except (ApiNoSuccessError, aiohttp.ClientError, asyncio.TimeoutError):
+                        pass
+                return await self.auctions(page, retry=1)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(1, first.total_pages)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for pending in tasks:
+                pending.cancel()
+
+    async def auctions_stream(self, page: int = 0) -> AsyncGenerator[AuctionItem, None]:
+        """Get the auctions of a page while it is being received.
+
+        The page is parsed incrementally as bytes arrive, so the first auction
+        is available before the page has been downloaded and the whole page
+        is never held in memory. Pages streamed are not cached and requests
+        for the same page are not shared.
+
+        Args:
+            page (int): Page of auction list you want. Defaults to 0.
+
+        Yields:
+            AuctionItem: each auction of the page, in order.
+
+        Raises:
+            ApiNoSuccessError: Could not get auctions.
+        """
+        response = await self._send("skyblock/auctions", {"page": page}, key_required=False)
+        parser = ArrayItems("auctions")
+        try:
+            async for chunk in response.content.iter_any():
+                for item in parser.feed(chunk):
+                    yield self._model(AuctionItem, item)
+            # The object closes after the array, so this only checks the page was complete.
+            parser.feed(b"", final=True)
+        finally:
+            response.release()
 
     async def auctions_ended(self, retry: int = 3) -> AuctionEnded:
         """Get the auctions that have ended.
@@ -312,7 +626,7 @@ class Hypixel:
 
         if data is None:  # pragma: no cover
             raise ApiNoSuccessError("Could not get auctions ended.")
-        return AuctionEnded.model_validate(data)
+        return self._model(AuctionEnded, data)
 
     async def recent_games(self, uuid: UUID) -> Optional[List[Game]]:
         """Get recent games of a player.
@@ -328,8 +642,7 @@ class Hypixel:
         if data["games"] is None:
             return None
 
-        adapter = TypeAdapter(List[Game])
-        return adapter.validate_python(data["games"])
+        return _GAMES_ADAPTER.validate_python(data["games"])
 
     async def player(self, uuid: UUID) -> Optional[Player]:
         """Get information about a player from their uuid.
@@ -342,9 +655,74 @@ class Hypixel:
         """
         params = {"uuid": str(uuid)}
         data = await self._get("player", params=params)
+        return self._player(data)
+
+    def _player(self, data: Dict[str, Any]) -> Optional[Player]:
+        """Build a player from a response.
+
+        Args:
+            data (Dict[str, Any]): decoded json of the response.
+
+        Returns:
+            Optional[Player]: player, None if it does not exist.
+        """
         if data["player"] is None:
             return None
-        return Player.model_validate(data["player"])
+        return Player.model_validate(data["player"], context={"lazy_stats": self.lazy_stats, "raw": self.player_raw})
+
+    async def players_many(
+        self, uuids: Iterable[UUID], concurrency: int = 10, wait_for_ratelimit: bool = True
+    ) -> AsyncGenerator[PlayerResult, None]:
+        """Get many players with a bounded number of requests in flight.
+
+        Repeated uuids are only fetched once and cached players are served
+        without a request. Requests wait for the ratelimit of the keys unless
+        told otherwise, and an error fetching one player is reported in its
+        result instead of stopping the batch. Uuids are read from the iterable
+        as requests complete, so it may be a lazy generator.
+
+        Args:
+            uuids (Iterable[UUID]): uuids of the players.
+            concurrency (int): Maximum number of players fetched at once. Defaults to 10.
+            wait_for_ratelimit (bool): wait for the ratelimit instead of reporting
+                RateLimitError. Defaults to True.
+
+        Yields:
+            PlayerResult: outcome for each unique uuid, in the order they complete.
+
+        Raises:
+            ValueError: a uuid is malformed.
+        """
+        pending = unique_uuids(uuids)
+        tasks: Set["asyncio.Future[PlayerResult]"] = set()
+        try:
+            while True:
+                for player_uuid in itertools.islice(pending, concurrency - len(tasks)):
+                    tasks.add(asyncio.ensure_future(self._player_result(player_uuid, wait_for_ratelimit)))
+                if not tasks:
+                    return
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _player_result(self, player_uuid: uuid.UUID, wait: bool) -> PlayerResult:
+        """Fetch a player of a batch.
+
+        Args:
+            player_uuid (uuid.UUID): uuid of the player.
+            wait (bool): wait for the ratelimit instead of raising RateLimitError.
+
+        Returns:
+            PlayerResult: the player or the error raised fetching it.
+        """
+        try:
+            data = await self._get("player", params={"uuid": str(player_uuid)}, wait=wait)
+            return PlayerResult(uuid=player_uuid, player=self._player(data))
+        except Exception as error:
+            return PlayerResult(uuid=player_uuid, error=error)
 
     async def guild_by_name(self, guild_name: str) -> Optional[Guild]:
         """Get guild by name.
@@ -359,7 +737,7 @@ class Hypixel:
         data = await self._get("guild", params=params)
         if data["guild"] is None:
             return None
-        return Guild.model_validate(data["guild"])
+        return self._model(Guild, data["guild"])
 
     async def guild_by_id(self, guild_id: str) -> Optional[Guild]:
         """Get guild by id.
@@ -374,7 +752,7 @@ class Hypixel:
         data = await self._get("guild", params=params)
         if data["guild"] is None:
             return None
-        return Guild.model_validate(data["guild"])
+        return self._model(Guild, data["guild"])
 
     async def guild_by_player(self, player_uuid: UUID) -> Optional[Guild]:
         """Get guild by player.
@@ -389,7 +767,73 @@ class Hypixel:
         data = await self._get("guild", params=params)
         if data["guild"] is None:
             return None
-        return Guild.model_validate(data["guild"])
+        return self._model(Guild, data["guild"])
+
+    async def guild_players(
+        self, guild: Guild, timeout: Optional[float] = None, concurrency: int = 10
+    ) -> GuildWithPlayers:
+        """Fetch the players of every member of a guild.
+
+        Players are fetched like :meth:`players_many`, so cached players are
+        reused and requests wait for the ratelimit. Once the timeout is up the
+        members still being fetched are reported as pending.
+
+        Args:
+            guild (Guild): the guild.
+            timeout (Optional[float]): seconds to wait for the players, None to
+                wait for all of them. Defaults to None.
+            concurrency (int): Maximum number of players fetched at once. Defaults to 10.
+
+        Returns:
+            GuildWithPlayers: guild and the players fetched.
+        """
+        players: Dict[uuid.UUID, Optional[Player]] = {}
+        errors: Dict[uuid.UUID, Exception] = {}
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        members = unique_uuids(member.uuid for member in guild.members)
+        tasks: Set["asyncio.Future[PlayerResult]"] = set()
+        try:
+            while True:
+                for player_uuid in itertools.islice(members, concurrency - len(tasks)):
+                    tasks.add(asyncio.ensure_future(self._player_result(player_uuid, True)))
+                if not tasks:
+                    break
+                remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                done, tasks = await asyncio.wait(tasks, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    result = task.result()
+                    if result.error is None:
+                        players[result.uuid] = result.player
+                    else:
+                        errors[result.uuid] = result.error
+        finally:
+            for task in tasks:
+                task.cancel()
+        pending = [member.uuid for member in guild.members if member.uuid not in players and member.uuid not in errors]
+        return GuildWithPlayers.model_construct(guild=guild, players=players, errors=errors, pending=pending)
+
+    async def guild_with_players(
+        self, guild_id: str, timeout: Optional[float] = None, concurrency: int = 10
+    ) -> Optional[GuildWithPlayers]:
+        """Get a guild by id along with the players of its members.
+
+        Args:
+            guild_id (str): id of guild.
+            timeout (Optional[float]): seconds to wait for the players once the
+                guild is fetched, None to wait for all of them. Defaults to None.
+            concurrency (int): Maximum number of players fetched at once. Defaults to 10.
+
+        Returns:
+            Optional[GuildWithPlayers]: guild and the players fetched, None if
+                the guild does not exist.
+        """
+        guild = await self.guild_by_id(guild_id)
+        if guild is None:
+            return None
+        return await self.guild_players(guild, timeout=timeout, concurrency=concurrency)
 
     async def auction_from_uuid(self, uuid: UUID) -> Optional[List[AuctionItem]]:
         """Get auction from uuid.
@@ -405,8 +849,7 @@ class Hypixel:
         if data["auctions"] is None:
             return None
 
-        adapter = TypeAdapter(List[AuctionItem])
-        return adapter.validate_python(data["auctions"])
+        return self._auction_items(data["auctions"])
 
     async def auction_from_player(self, player: str) -> Optional[List[AuctionItem]]:
         """Get auction data from player.
@@ -422,8 +865,7 @@ class Hypixel:
         if data["auctions"] is None:
             return None
 
-        adapter = TypeAdapter(List[AuctionItem])
-        return adapter.validate_python(data["auctions"])
+        return self._auction_items(data["auctions"])
 
     async def auction_from_profile(self, profile_id: str) -> Optional[List[AuctionItem]]:
         """Get auction data from profile.
@@ -439,8 +881,7 @@ class Hypixel:
         if data["auctions"] is None:
             return None
 
-        adapter = TypeAdapter(List[AuctionItem])
-        return adapter.validate_python(data["auctions"])
+        return self._auction_items(data["auctions"])
 
     async def game_count(self) -> GameCounts:
         """Gets number of players per game.
@@ -584,14 +1025,32 @@ class Hypixel:
     async def uuid_from_name(self, username: str) -> Optional[uuid.UUID]:
         """Helper method to get uuid from username.
 
+        The name is resolved through :attr:`names`, so it shares its cache and
+        requests with :meth:`uuids_from_names`.
+
         Args:
             username (str): username of player
 
+        Raises:
+            RateLimitError: mojang is still ratelimiting after every retry.
+            ApiNoSuccessError: mojang returned an error.
+
         Returns:
             UUID4: uuid of player
         """
-        async with self._session.get("https://api.mojang.com/users/profiles/minecraft/" f"{username}") as response:
-            if response.status != 200:
-                return None
-            else:
-                return uuid.UUID((await response.json())["id"])
+        return (await self.names.resolve([username]))[username]
+
+    async def uuids_from_names(self, usernames: Iterable[str]) -> Dict[str, Optional[uuid.UUID]]:
+        """Get the uuids of many usernames.
+
+        Usernames are resolved ten to a request and cached, see
+        :class:`asyncpixel.mojang.NameResolver`.
+
+        Args:
+            usernames (Iterable[str]): usernames of players.
+
+        Returns:
+            Dict[str, Optional[uuid.UUID]]: uuid of each username as given,
+                None if there is no such player.
+        """
+        return await self.names.resolve(usernames)
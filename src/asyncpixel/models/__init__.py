@@ -1,55 +1,59 @@
 """Models for asyncpixel data objects."""
-from .auctions import Auction, AuctionItem, Bids
+from .auctions import Auction, AuctionDiff, AuctionItem, Bids
 from .auctions_ended import AuctionEnded, AuctionEndedItem
 from .bazaar import Bazaar, BazaarItem, BazaarQuickStatus, BazaarSummary
 from .booster import Booster, Boosters
 from .friends import Friend
 from .game_count import GameCounts, GameCountsGame
 from .games import Game
-from .guild import Guild, GuildMembers, Pattern, Rank
+from .guild import Guild, GuildMembers, GuildWithPlayers, Pattern, Rank
 from .key import Key
 from .leaderboards import Leaderboards
 from .news import Item, News
 from .pet import Pet, PetStat
-from .player import Player, Social, Stats
+from .player import Player, PlayerResult, Social, Stats
 from .player_profile import InvArmor, Members, Objective, Profile, Quests
-from .status import Status
+from .status import Status, StatusChange
 from .watchdog import WatchDog
 
 __all__ = [
     "Auction",
-    "Item",
-    "AuctionItem",
+    "AuctionDiff",
     "AuctionEnded",
     "AuctionEndedItem",
+    "AuctionItem",
     "Bazaar",
-    "BazaarSummary",
     "BazaarItem",
     "BazaarQuickStatus",
+    "BazaarSummary",
+    "Bids",
     "Booster",
     "Boosters",
     "Friend",
+    "Game",
     "GameCounts",
     "GameCountsGame",
-    "Game",
     "Guild",
+    "GuildMembers",
+    "GuildWithPlayers",
+    "InvArmor",
+    "Item",
     "Key",
     "Leaderboards",
-    "News",
-    "Player",
-    "InvArmor",
     "Members",
+    "News",
     "Objective",
+    "Pattern",
+    "Pet",
+    "PetStat",
+    "Player",
+    "PlayerResult",
     "Profile",
     "Quests",
+    "Rank",
+    "Social",
+    "Stats",
     "Status",
+    "StatusChange",
     "WatchDog",
-    "Bids",
-    "GuildMembers",
-    "Pattern",
-    "Stats",
-    "Social",
-    "Rank",
-    "Pet",
-    "PetStat",
 ]
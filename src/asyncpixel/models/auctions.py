@@ -1,12 +1,14 @@
 """Auction related objects."""
 import datetime
+from functools import cached_property
 from math import floor
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.types import UUID4
 
-from .utils import to_camel
+from ..nbt import decode_item_bytes
+from .utils import fields_equal, to_camel
 
 
 class Bids(BaseModel):
@@ -73,6 +75,17 @@ class AuctionItem(BaseModel):
     id: Optional[str] = Field(alias="_id", default=None)
     bin: bool = False
 
+    @cached_property
+    def nbt(self) -> Dict[str, Any]:
+        """NBT data of the item, decoded from item_bytes on first access."""
+        return decode_item_bytes(self.item_bytes)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the fields of two auctions, ignoring a decoded nbt."""
+        if not isinstance(other, AuctionItem):
+            return NotImplemented
+        return fields_equal(self, other)
+
     def active(self) -> bool:
         """Return if auction is active - you can bid on it."""
         return not self.claimed and datetime.datetime.now(tz=self.end.astimezone().tzinfo) < self.end
@@ -104,3 +117,19 @@ class Auction(BaseModel):
     last_updated: datetime.datetime
     auctions: List[AuctionItem]
     model_config = ConfigDict(alias_generator=to_camel)
+
+
+class AuctionDiff(BaseModel):
+    """Changes to the auction house between two snapshots.
+
+    Args:
+        last_updated (datetime.datetime): Time the newer snapshot was last updated.
+        new (List[AuctionItem]): Auctions that were not in the older snapshot.
+        changed (List[AuctionItem]): Auctions that have received bids since.
+        removed (List[AuctionItem]): Auctions that are no longer listed.
+    """
+
+    last_updated: datetime.datetime
+    new: List[AuctionItem] = []
+    changed: List[AuctionItem] = []
+    removed: List[AuctionItem] = []
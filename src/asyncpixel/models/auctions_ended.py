@@ -1,11 +1,13 @@
 """Ended auction related objects."""
 import datetime
-from typing import Dict, List, Union
+from functools import cached_property
+from typing import Any, Dict, List, Union
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.types import UUID4
 
-from .utils import to_camel
+from ..nbt import decode_item_bytes
+from .utils import fields_equal, to_camel
 
 
 class AuctionEndedItem(BaseModel):
@@ -31,6 +33,17 @@ class AuctionEndedItem(BaseModel):
     item_bytes: Union[str, Dict[str, Union[int, str]]]
     price: int
 
+    @cached_property
+    def nbt(self) -> Dict[str, Any]:
+        """NBT data of the item, decoded from item_bytes on first access."""
+        return decode_item_bytes(self.item_bytes)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the fields of two auctions, ignoring a decoded nbt."""
+        if not isinstance(other, AuctionEndedItem):
+            return NotImplemented
+        return fields_equal(self, other)
+
 
 class AuctionEnded(BaseModel):
     """Main auction ended object.
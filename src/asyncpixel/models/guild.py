@@ -1,13 +1,17 @@
 """Guild objects."""
 import datetime
 import uuid
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.fields import Field
 
+from asyncpixel.models.player import Player
 from asyncpixel.models.utils import to_camel
 
+if TYPE_CHECKING:  # pragma: no cover
+    from asyncpixel.hypixel import Hypixel
+
 
 class Pattern(BaseModel):
     """Pattern.
@@ -106,3 +110,44 @@ class Guild(BaseModel):
     guild_exp_by_game_type: Optional[Dict[str, int]] = None
     tag_color: Optional[str] = None
     model_config = ConfigDict(alias_generator=to_camel)
+
+    async def expand(
+        self, client: "Hypixel", timeout: Optional[float] = None, concurrency: int = 10
+    ) -> "GuildWithPlayers":
+        """Fetch the players of every member, see :meth:`Hypixel.guild_players`.
+
+        Args:
+            client (Hypixel): client to fetch the players with.
+            timeout (Optional[float], optional): seconds to wait for the players,
+                None to wait for all of them. Defaults to None.
+            concurrency (int, optional): Maximum number of players fetched at once.
+                Defaults to 10.
+
+        Returns:
+            GuildWithPlayers: guild and the players fetched.
+        """
+        return await client.guild_players(self, timeout=timeout, concurrency=concurrency)
+
+
+class GuildWithPlayers(BaseModel):
+    """Guild with the players of its members.
+
+    Args:
+        guild (Guild): the guild.
+        players (Dict[uuid.UUID, Optional[Player]]): player of each member
+            fetched, None if the player does not exist.
+        errors (Dict[uuid.UUID, Exception]): error raised fetching a member.
+        pending (List[uuid.UUID]): members not fetched before the deadline.
+    """
+
+    guild: Guild
+    players: Dict[uuid.UUID, Optional[Player]] = {}
+    errors: Dict[uuid.UUID, Exception] = {}
+    pending: List[uuid.UUID] = []
+
+    @property
+    def complete(self) -> bool:
+        """Whether the player of every member was fetched."""
+        return not self.errors and not self.pending
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,11 +1,24 @@
 """Player objects."""
 import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 from pydantic.types import UUID4
 
 from asyncpixel import utils
+from asyncpixel.codec import encode, get_decoder
 from asyncpixel.constants import GameType
 from asyncpixel.models.pet import Pet
 
@@ -34,10 +47,16 @@ from .players import (
 )
 from .utils import to_camel
 
+_decode = get_decoder()
+
 
 class Stats(BaseModel):
     """Game Stats.
 
+    When validated with ``lazy_stats`` set in the validation context, the raw
+    stats of each game are kept and only validated when the game is first
+    accessed, so parsing a player costs only the games that are read.
+
     Args:
         bedwars (Optional[Bedwars]): bedwars stats.
         arcade (Optional[Arcade]): Arcade stats.
@@ -88,6 +107,59 @@ class Stats(BaseModel):
     # sky_block: Optional[SkyBlock]= Field(alias="SkyBlock", default=None)
     # super_smash: Optional[SuperSmash] = Field(alias="SuperSmash", default=None)
 
+    _pending: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _defer_games(cls, values: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+        """Keep the raw stats of each game when lazy_stats is set in the context."""
+        if not (info.context and info.context.get("lazy_stats")) or not isinstance(values, dict):
+            return handler(values)
+        stats = cls.model_construct()
+        for name in cls.model_fields:
+            del stats.__dict__[name]
+        stats._pending = values
+        return stats
+
+    def _load(self, *names: str) -> None:
+        """Validate the stats of games that have not been validated yet.
+
+        Args:
+            *names (str): field names of the games.
+        """
+        pending = self._pending
+        if pending is None:
+            return
+        names = tuple(name for name in names if name not in self.__dict__)
+        aliases = [self.model_fields[name].alias or name for name in names]
+        loaded = type(self).model_validate({alias: pending[alias] for alias in aliases if alias in pending})
+        self.__dict__.update({name: loaded.__dict__[name] for name in names})
+        self.__pydantic_fields_set__.update(loaded.model_fields_set)
+        if len(self.__dict__) == len(self.model_fields):
+            self._pending = None
+
+    if not TYPE_CHECKING:  # pragma: no branch
+
+        def __getattr__(self, name: str) -> Any:
+            """Validate the stats of a game on first access."""
+            if name in type(self).model_fields:
+                self._load(name)
+                return self.__dict__[name]
+            return super().__getattr__(name)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare stats, validating any game that has not been accessed yet."""
+        if isinstance(other, Stats):
+            self._load(*self.model_fields)
+            other._load(*other.model_fields)
+        return super().__eq__(other)
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        """Validate every game before serializing."""
+        self._load(*self.model_fields)
+        return handler(self)
+
 
 class Social(BaseModel):
     """Social accounts.
@@ -153,30 +225,13 @@ class Player(BaseModel):
         channel (Optional[str]): Channel.
         most_recent_game_type (Optional[GameType]): Most recent Game Type that
             has been played.
-        level (Optional[float]): Level of user.
+        level (float): Level of user.
         pet_stats (Optional[Pet]): Pet stats.
-        raw (Dict[str, Any]): raw data
     """
 
     uuid: UUID4
     displayname: Optional[str] = None
     rank: Optional[str] = None
-
-    @model_validator(mode="before")
-    @classmethod
-    def create_rank(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        """Get the rank."""
-        out = values.copy()
-        rank = utils.get_rank(
-            values.get("rank"),
-            values.get("prefix"),
-            values.get("monthlyPackageRank"),
-            values.get("newPackageRank"),
-            values.get("packageRank"),
-        )
-        out["rank"] = rank
-        return out
-
     first_login: datetime.datetime
     last_login: Optional[datetime.datetime] = None
     last_logout: Optional[datetime.datetime] = None
@@ -212,25 +267,69 @@ class Player(BaseModel):
         """Validate game type."""
         return utils.validate_game_type(v)
 
-    level: float
+    level: float = 0.0
 
-    @model_validator(mode="before")
+    _raw: Union[Dict[str, Any], bytes, None] = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
     @classmethod
-    def create_level(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        """Create level."""
-        out = values.copy()
-        exp = float(out.get("networkExp", 0.0))
-        out["level"] = utils.calc_player_level(exp)
-        return out
+    def _derive(cls, values: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+        """Derive the rank and level and keep the raw data.
 
-    raw: Dict[str, Any]
+        The raw data is kept according to ``raw`` in the validation context:
+        ``"dict"`` keeps the data as given, ``"json"`` keeps it encoded as
+        json bytes and ``"none"`` drops it.
+        """
+        player = handler(values)
+        if not isinstance(values, dict):
+            return player
+        player.__dict__["rank"] = utils.get_rank(
+            values.get("rank"),
+            values.get("prefix"),
+            values.get("monthlyPackageRank"),
+            values.get("newPackageRank"),
+            values.get("packageRank"),
+        )
+        player.__dict__["level"] = utils.calc_player_level(float(values.get("networkExp", 0.0)))
+        player.__pydantic_fields_set__.update(("rank", "level"))
+        mode = (info.context or {}).get("raw", "dict")
+        if mode == "json":
+            player._raw = encode(values)
+        elif mode == "dict":
+            player._raw = values
+        elif mode != "none":
+            raise ValueError(f"Unknown raw mode {mode!r}")
+        return player
 
-    @model_validator(mode="before")
-    @classmethod
-    def create_raw(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a copy of the values to directly access."""
-        out = values.copy()
-        out["raw"] = values
-        return out
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Raw data of the player, empty if it was not kept."""
+        if isinstance(self._raw, bytes):
+            data: Dict[str, Any] = _decode(self._raw)
+            return data
+        return self._raw or {}
 
     model_config = ConfigDict(alias_generator=to_camel)
+
+
+class PlayerResult(BaseModel):
+    """Outcome of fetching one player of a batch.
+
+    Args:
+        uuid (UUID): uuid of the player requested.
+        player (Optional[Player]): player, None if the player does not exist
+            or could not be fetched.
+        error (Optional[Exception]): error raised while fetching the player,
+            None on success.
+    """
+
+    uuid: UUID
+    player: Optional[Player] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the player was fetched."""
+        return self.error is None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,5 +1,7 @@
 """Status data class."""
+import datetime
 from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
@@ -30,3 +32,21 @@ class Status(BaseModel):
         return validate_game_type(v)
 
     model_config = ConfigDict(alias_generator=to_camel)
+
+
+class StatusChange(BaseModel):
+    """Change in the online status of a player.
+
+    Args:
+        uuid (UUID): uuid of the player.
+        previous (Optional[Status]): Status before the change, None if the
+            player had no session. Defaults to None.
+        current (Optional[Status]): Status after the change, None if the
+            player has no session. Defaults to None.
+        time (datetime.datetime): Time the change was seen.
+    """
+
+    uuid: UUID
+    previous: Optional[Status] = None
+    current: Optional[Status] = None
+    time: datetime.datetime
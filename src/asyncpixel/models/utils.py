@@ -1,6 +1,8 @@
 """Utils for pydantic models."""
 from typing import Union
 
+from pydantic import BaseModel
+
 
 def safe_divide(dividend: Union[int, float], divisor: Union[int, float]) -> float:
     """Return dividend / divisor without raising ZeroDivisionError.
@@ -42,3 +44,22 @@ def to_upper(string: str) -> str:
         str: upperCase version of str.
     """
     return string.upper()
+
+
+def fields_equal(model: BaseModel, other: BaseModel) -> bool:
+    """Compare the fields of two models of the same class.
+
+    Values cached on a model with ``functools.cached_property`` live in its
+    ``__dict__`` next to the fields, pydantic before 2.6 compares the whole
+    ``__dict__`` so reading a cached property would make equal models differ.
+
+    Args:
+        model (BaseModel): first model.
+        other (BaseModel): second model.
+
+    Returns:
+        bool: whether both models are of the same class with equal fields.
+    """
+    return type(model) is type(other) and all(
+        getattr(model, name) == getattr(other, name) for name in type(model).model_fields
+    )
@@ -0,0 +1,231 @@
+"""Resolution of minecraft names to uuids through the mojang api."""
+import asyncio
+import datetime
+import re
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from . import utils
+from .exceptions import ApiNoSuccessError, RateLimitError
+from .http import LazySession
+
+__all__ = ["PROFILES_URL", "NameResolver"]
+
+PROFILES_URL = "https://api.mojang.com/profiles/minecraft"
+
+# The bulk endpoint rejects a whole request if one name is not a valid name.
+_VALID_NAME = re.compile(r"^[A-Za-z0-9_]{1,16}$")
+
+
+class NameResolver:
+    """Resolve names to uuids in bulk, with a least recently used cache.
+
+    Names are looked up through the bulk profiles endpoint, ten to a request.
+    Names without an account are cached as well, for a shorter time, and
+    concurrent lookups of the same name share one request. Names are case
+    insensitive.
+    """
+
+    def __init__(
+        self,
+        session: LazySession,
+        ttl: float = 24 * 3600,
+        negative_ttl: float = 3600,
+        max_entries: int = 100_000,
+        chunk_size: int = 10,
+        retries: int = 3,
+    ) -> None:
+        """Initialise resolver.
+
+        Args:
+            session (LazySession): session for the mojang api.
+            ttl (float, optional): seconds a resolved name is cached. Defaults to a day.
+            negative_ttl (float, optional): seconds a name without an account is
+                cached. Defaults to an hour.
+            max_entries (int, optional): maximum number of cached names.
+                Defaults to 100 000.
+            chunk_size (int, optional): names per request, mojang accepts at
+                most 10. Defaults to 10.
+            retries (int, optional): attempts of a request that is ratelimited.
+                Defaults to 3.
+        """
+        self.session = session
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self._entries: "OrderedDict[str, Tuple[float, Optional[uuid.UUID]]]" = OrderedDict()
+        self._names: Dict[uuid.UUID, str] = {}
+        self._inflight: Dict[str, "asyncio.Future[Optional[uuid.UUID]]"] = {}
+        self._lookups: Set["asyncio.Task[None]"] = set()
+
+    def __len__(self) -> int:
+        """Number of cached names."""
+        return len(self._entries)
+
+    def cached(self, name: str) -> Tuple[bool, Optional[uuid.UUID]]:
+        """Look a name up in the cache.
+
+        Args:
+            name (str): name of the player.
+
+        Returns:
+            Tuple[bool, Optional[uuid.UUID]]: whether the name is cached, and its
+                uuid, None if the name has no account.
+        """
+        key = name.lower()
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires, player_uuid = entry
+        if expires <= utils.monotonic():
+            self._evict(key)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, player_uuid
+
+    def name(self, player_uuid: uuid.UUID) -> Optional[str]:
+        """Get the cached name of a uuid.
+
+        Args:
+            player_uuid (uuid.UUID): uuid of the player.
+
+        Returns:
+            Optional[str]: name as spelt by mojang, None if it is not cached.
+        """
+        return self._names.get(player_uuid)
+
+    def store(self, name: str, player_uuid: Optional[uuid.UUID]) -> None:
+        """Cache a name, evicting the least recently used ones to make room.
+
+        Args:
+            name (str): name of the player.
+            player_uuid (Optional[uuid.UUID]): uuid of the player, None if the
+                name has no account.
+        """
+        key = name.lower()
+        self._evict(key)
+        ttl = self.negative_ttl if player_uuid is None else self.ttl
+        self._entries[key] = (utils.monotonic() + ttl, player_uuid)
+        if player_uuid is not None:
+            self._names[player_uuid] = name
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        """Remove a name from the cache.
+
+        Args:
+            key (str): lowercase name.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[1] is not None:
+            self._names.pop(entry[1], None)
+
+    async def resolve(self, names: Iterable[str]) -> Dict[str, Optional[uuid.UUID]]:
+        """Resolve names to uuids.
+
+        Args:
+            names (Iterable[str]): names of the players.
+
+        Raises:
+            RateLimitError: mojang is still ratelimiting after every retry.
+            ApiNoSuccessError: mojang returned an error.
+
+        Returns:
+            Dict[str, Optional[uuid.UUID]]: uuid of each name as given, None if
+                the name has no account.
+        """
+        results: Dict[str, Optional[uuid.UUID]] = {}
+        waiting: Dict[str, "asyncio.Future[Optional[uuid.UUID]]"] = {}
+        missing: List[str] = []
+        for name in names:
+            key = name.lower()
+            if name in results or name in waiting:
+                continue
+            if not _VALID_NAME.match(name):
+                results[name] = None
+                continue
+            hit, player_uuid = self.cached(name)
+            if hit:
+                results[name] = player_uuid
+                continue
+            future = self._inflight.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+                missing.append(name)
+            waiting[name] = future
+
+        for start in range(0, len(missing), self.chunk_size):
+            # Each chunk runs as its own task, so a cancelled caller does not
+            # cancel lookups other callers are waiting on.
+            task = asyncio.ensure_future(self._lookup(missing[start : start + self.chunk_size]))
+            self._lookups.add(task)
+            task.add_done_callback(self._lookups.discard)
+        outcomes = await asyncio.gather(
+            *(asyncio.shield(future) for future in waiting.values()), return_exceptions=True
+        )
+        for name, outcome in zip(waiting, outcomes):
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results[name] = outcome
+        return results
+
+    async def _lookup(self, names: List[str]) -> None:
+        """Look a chunk of names up, settling their in flight lookups.
+
+        Errors are set on the lookups rather than raised.
+
+        Args:
+            names (List[str]): names of the players.
+        """
+        futures = [self._inflight[name.lower()] for name in names]
+        try:
+            found = await self._request(names)
+        except Exception as error:
+            for future in futures:
+                future.set_exception(error)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        else:
+            for name, future in zip(names, futures):
+                spelling, player_uuid = found.get(name.lower(), (name, None))
+                self.store(spelling, player_uuid)
+                future.set_result(player_uuid)
+        finally:
+            for name in names:
+                del self._inflight[name.lower()]
+
+    async def _request(self, names: List[str]) -> Dict[str, Tuple[str, uuid.UUID]]:
+        """Send a bulk profiles request.
+
+        Args:
+            names (List[str]): names of the players.
+
+        Raises:
+            RateLimitError: mojang is still ratelimiting after every retry.
+            ApiNoSuccessError: mojang returned an error.
+
+        Returns:
+            Dict[str, Tuple[str, uuid.UUID]]: name as spelt by mojang and uuid of
+                each lowercase name with an account.
+        """
+        delay = 0.0
+        for attempt in range(self.retries):
+            if attempt:
+                await asyncio.sleep(delay)
+            async with self.session.session().post(PROFILES_URL, json=names) as response:
+                if response.status == 200:
+                    return {
+                        profile["name"].lower(): (profile["name"], uuid.UUID(profile["id"]))
+                        for profile in await response.json()
+                    }
+                if response.status != 429:
+                    raise ApiNoSuccessError("mojang profiles")
+                delay = float(response.headers.get("Retry-After", 2**attempt))
+        raise RateLimitError(datetime.datetime.now() + datetime.timedelta(seconds=delay))
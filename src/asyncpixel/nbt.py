@@ -0,0 +1,242 @@
+"""Decoding of the NBT item data returned by skyblock endpoints."""
+import asyncio
+import base64
+import gzip
+import struct
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import AuctionEndedItem, AuctionItem
+
+__all__ = ["decode_item_bytes", "decode_items", "decode_nbt"]
+
+ItemBytes = Union[str, Dict[str, Union[int, str]]]
+
+_BYTE = struct.Struct(">b")
+_SHORT = struct.Struct(">h")
+_USHORT = struct.Struct(">H")
+_INT = struct.Struct(">i")
+_LONG = struct.Struct(">q")
+_FLOAT = struct.Struct(">f")
+_DOUBLE = struct.Struct(">d")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+class _Reader:
+    """Big endian reader over an uncompressed NBT document."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialise reader.
+
+        Args:
+            data (bytes): uncompressed NBT document.
+        """
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> Any:
+        """Read a single value.
+
+        Args:
+            fmt (struct.Struct): format of the value.
+
+        Returns:
+            Any: value read.
+        """
+        (value,) = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return value
+
+    def array(self, code: str, size: int) -> List[Any]:
+        """Read a length prefixed array of numbers.
+
+        Args:
+            code (str): struct code of each element.
+            size (int): size of each element in bytes.
+
+        Returns:
+            List[Any]: values read.
+        """
+        length = self.unpack(_INT)
+        values = list(struct.unpack_from(f">{length}{code}", self.data, self.offset))
+        self.offset += length * size
+        return values
+
+    def string(self) -> str:
+        """Read a length prefixed string.
+
+        Returns:
+            str: string read.
+        """
+        length = self.unpack(_USHORT)
+        value = self.data[self.offset : self.offset + length].decode("utf-8", errors="replace")
+        self.offset += length
+        return value
+
+    def byte_array(self) -> bytes:
+        """Read a length prefixed byte array.
+
+        Returns:
+            bytes: bytes read.
+        """
+        length = self.unpack(_INT)
+        value = self.data[self.offset : self.offset + length]
+        self.offset += length
+        return value
+
+    def payload(self, tag: int) -> Any:
+        """Read the payload of a tag.
+
+        Args:
+            tag (int): tag type.
+
+        Raises:
+            ValueError: unknown tag type.
+
+        Returns:
+            Any: decoded payload.
+        """
+        if tag not in _PAYLOADS:
+            raise ValueError(f"Unknown NBT tag type {tag}")
+        return _PAYLOADS[tag](self)
+
+    def list_tag(self) -> List[Any]:
+        """Read a list tag.
+
+        Returns:
+            List[Any]: decoded elements.
+        """
+        tag = self.unpack(_BYTE)
+        length = self.unpack(_INT)
+        return [self.payload(tag) for _ in range(length)]
+
+    def compound_tag(self) -> Dict[str, Any]:
+        """Read a compound tag.
+
+        Returns:
+            Dict[str, Any]: decoded named tags.
+        """
+        out: Dict[str, Any] = {}
+        while True:
+            tag = self.unpack(_BYTE)
+            if tag == 0:
+                return out
+            name = self.string()
+            out[name] = self.payload(tag)
+
+
+_PAYLOADS: Dict[int, Callable[[_Reader], Any]] = {
+    1: lambda reader: reader.unpack(_BYTE),
+    2: lambda reader: reader.unpack(_SHORT),
+    3: lambda reader: reader.unpack(_INT),
+    4: lambda reader: reader.unpack(_LONG),
+    5: lambda reader: reader.unpack(_FLOAT),
+    6: lambda reader: reader.unpack(_DOUBLE),
+    7: _Reader.byte_array,
+    8: _Reader.string,
+    9: _Reader.list_tag,
+    10: _Reader.compound_tag,
+    11: lambda reader: reader.array("i", 4),
+    12: lambda reader: reader.array("q", 8),
+}
+
+
+def decode_nbt(data: bytes) -> Dict[str, Any]:
+    """Decode an uncompressed NBT document.
+
+    Args:
+        data (bytes): NBT document starting with a named root compound.
+
+    Raises:
+        ValueError: document is not a valid NBT document.
+
+    Returns:
+        Dict[str, Any]: payload of the root compound.
+    """
+    reader = _Reader(data)
+    try:
+        if reader.unpack(_BYTE) != 10:
+            raise ValueError("NBT document does not start with a compound")
+        reader.string()
+        return reader.compound_tag()
+    except struct.error as e:
+        raise ValueError("Truncated NBT document") from e
+
+
+def decode_item_bytes(item_bytes: ItemBytes) -> Dict[str, Any]:
+    """Decode the base64 encoded gzipped NBT of an item.
+
+    Args:
+        item_bytes (Union[str, Dict[str, Union[int, str]]]): item bytes as
+            returned by hypixel, either the encoded string or an object holding
+            it under ``data``.
+
+    Returns:
+        Dict[str, Any]: decoded NBT.
+    """
+    if isinstance(item_bytes, dict):
+        item_bytes = str(item_bytes["data"])
+    return decode_nbt(gzip.decompress(base64.b64decode(item_bytes)))
+
+
+def _decode_many(items: Sequence[ItemBytes]) -> List[Dict[str, Any]]:
+    """Decode a chunk of item bytes.
+
+    Args:
+        items (Sequence[ItemBytes]): item bytes to decode.
+
+    Returns:
+        List[Dict[str, Any]]: decoded NBT of each item.
+    """
+    return [decode_item_bytes(item_bytes) for item_bytes in items]
+
+
+def _default_executor() -> ProcessPoolExecutor:
+    """Get the process pool shared by calls without an executor.
+
+    Returns:
+        ProcessPoolExecutor: pool, created on first use and kept for the life
+            of the process.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor()
+    return _pool
+
+
+async def decode_items(
+    items: Sequence[Union["AuctionItem", "AuctionEndedItem"]],
+    executor: Optional[Executor] = None,
+    chunksize: int = 500,
+) -> None:
+    """Decode the NBT of many auctions off the event loop.
+
+    The items are split into chunks that are decoded in parallel in an
+    executor, each result is then cached on its item so accessing ``nbt``
+    does not decode again.
+
+    Args:
+        items (Sequence[Union[AuctionItem, AuctionEndedItem]]): auctions to decode.
+        executor (Optional[Executor], optional): executor to decode in.
+            Defaults to a ProcessPoolExecutor shared by every call, its worker
+            processes are started by the first call and then reused.
+        chunksize (int, optional): number of items sent to a worker at once.
+            Defaults to 500.
+    """
+    pending = [item for item in items if "nbt" not in item.__dict__]
+    if not pending:
+        return
+    loop = asyncio.get_running_loop()
+    pool = executor or _default_executor()
+    chunks: List[Tuple[int, "asyncio.Future[List[Dict[str, Any]]]"]] = [
+        (
+            start,
+            loop.run_in_executor(pool, _decode_many, [item.item_bytes for item in pending[start : start + chunksize]]),
+        )
+        for start in range(0, len(pending), chunksize)
+    ]
+    for start, future in chunks:
+        for item, nbt in zip(pending[start : start + chunksize], await future):
+            item.__dict__["nbt"] = nbt
@@ -0,0 +1,269 @@
+"""Ratelimit handling for the hypixel api."""
+import asyncio
+import datetime
+import sys
+import uuid
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .exceptions import InvalidApiKeyError, RateLimitError
+
+__all__ = ["KeyPool", "RateLimiter"]
+
+EPOCH = datetime.datetime(1998, 1, 1)
+WINDOW = datetime.timedelta(minutes=5)
+
+
+def _now() -> datetime.datetime:
+    """Get the current time.
+
+    Returns:
+        datetime.datetime: current local time.
+    """
+    return datetime.datetime.now()
+
+
+class RateLimiter:
+    """Ratelimit state of a single api key.
+
+    The budget is learnt from the ``RateLimit-*`` headers returned by hypixel.
+    In waiting mode callers queue up in :meth:`acquire` in FIFO order and are
+    released one at a time, spaced evenly over what is left of the window.
+    """
+
+    def __init__(self) -> None:
+        """Initialise ratelimit state."""
+        self.limit: int = 0
+        self.remaining: int = -1
+        self.reset: datetime.datetime = EPOCH
+        self.retry_after: datetime.datetime = EPOCH
+        self._pending: int = 0
+        self._queued: int = 0
+        self._next_slot: datetime.datetime = EPOCH
+        self._lock: Optional[asyncio.Lock] = None
+        self._probe: Optional[asyncio.Event] = None
+
+    def check(self) -> None:
+        """Raise if the ratelimit has been reached.
+
+        Raises:
+            RateLimitError: ratelimit has been reached.
+        """
+        now = _now()
+        if self.retry_after > now:
+            raise RateLimitError(self.retry_after)
+        if self.remaining == 0 and self.reset > now:
+            raise RateLimitError(self.reset)
+
+    @property
+    def headroom(self) -> int:
+        """Requests that can still be sent in the current window.
+
+        Returns:
+            int: remaining budget minus requests in flight and callers queued
+                in :meth:`acquire`, -1 if throttled.
+        """
+        now = _now()
+        if self.retry_after > now:
+            return -1
+        if self.remaining == -1:
+            budget = (self.limit or sys.maxsize) - self._pending
+        elif self.reset <= now:
+            budget = self.limit - self._pending
+        else:
+            budget = self.remaining
+        return budget - self._queued
+
+    @property
+    def ready_at(self) -> datetime.datetime:
+        """Time the key is expected to have budget again.
+
+        Returns:
+            datetime.datetime: end of a throttle or of a drained window, a time
+                in the past if the key can be used.
+        """
+        return max(self.retry_after, self.reset if self.remaining == 0 else EPOCH)
+
+    async def acquire(self, wait: bool = True) -> None:
+        """Reserve a request, waiting until it can be sent within the ratelimit.
+
+        Waiters are served in the order they arrived. Until the budget is known
+        only a single request is let through so that it can be learnt from its
+        headers.
+
+        Args:
+            wait (bool): wait for the ratelimit instead of raising. Defaults to True.
+
+        Raises:
+            RateLimitError: ratelimit has been reached and wait is False.
+        """
+        if not wait:
+            self.check()
+            if self.remaining > 0 and self.reset > _now():
+                self.remaining -= 1
+            self._pending += 1
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # Callers waiting here count against the headroom of the key, so a pool
+        # spreads a burst over its keys instead of queueing it all on one.
+        self._queued += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = _now()
+                    if self.retry_after > now:
+                        await asyncio.sleep((self.retry_after - now).total_seconds())
+                        continue
+                    if self.remaining == -1:
+                        if self._probe is not None:
+                            await self._probe.wait()
+                            continue
+                        self._probe = asyncio.Event()
+                        break
+                    if self.reset <= now:
+                        # The window has rolled over, assume a full budget again.
+                        self.remaining = max(self.limit - self._pending, 0)
+                        self.reset = now + WINDOW
+                    if self.remaining <= 0:
+                        await asyncio.sleep((self.reset - now).total_seconds())
+                        continue
+                    if self._next_slot > now:
+                        await asyncio.sleep((self._next_slot - now).total_seconds())
+                        continue
+                    self._next_slot = now + (self.reset - now) / self.remaining
+                    self.remaining -= 1
+                    break
+                self._pending += 1
+        finally:
+            self._queued -= 1
+
+    async def wait_throttle(self) -> None:
+        """Wait until a throttle set by :meth:`throttle` is over."""
+        now = _now()
+        if self.retry_after > now:
+            await asyncio.sleep((self.retry_after - now).total_seconds())
+
+    def release(self) -> None:
+        """Mark a request reserved with :meth:`acquire` as finished."""
+        self._pending = max(self._pending - 1, 0)
+        if self._probe is not None:
+            self._probe.set()
+            self._probe = None
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update state from the headers of a response.
+
+        Args:
+            headers (Mapping[str, str]): response headers.
+        """
+        if "RateLimit-Limit" not in headers:
+            return
+        if self.limit == 0:
+            self.limit = int(headers["RateLimit-Limit"])
+        # Requests still in flight have not been counted by hypixel yet.
+        self.remaining = max(int(headers["RateLimit-Remaining"]) - max(self._pending - 1, 0), 0)
+        self.reset = _now() + datetime.timedelta(seconds=int(headers["RateLimit-Reset"]))
+
+    def throttle(self, retry_after: int) -> datetime.datetime:
+        """Record that hypixel has throttled the key.
+
+        Args:
+            retry_after (int): seconds until requests may be sent again.
+
+        Returns:
+            datetime.datetime: time requests may be sent again.
+        """
+        self.remaining = 0 if self.limit else -1
+        self.retry_after = _now() + datetime.timedelta(seconds=retry_after)
+        self.reset = self.retry_after
+        self._next_slot = EPOCH
+        return self.retry_after
+
+
+class KeyPool:
+    """Pool of api keys each with their own ratelimit state."""
+
+    def __init__(self, keys: Iterable[Union[str, uuid.UUID]] = ()) -> None:
+        """Initialise pool.
+
+        Args:
+            keys (Iterable[Union[str, uuid.UUID]]): api keys in the pool.
+        """
+        self._limiters: Dict[uuid.UUID, RateLimiter] = {uuid.UUID(str(key)): RateLimiter() for key in keys}
+        self._turn = 0
+
+    def __len__(self) -> int:
+        """Number of keys in the pool."""
+        return len(self._limiters)
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        """Iterate over the keys in the pool."""
+        return iter(self._limiters)
+
+    @property
+    def limiters(self) -> List[RateLimiter]:
+        """Ratelimit state of every key in the pool."""
+        return list(self._limiters.values())
+
+    def select(self) -> Tuple[uuid.UUID, RateLimiter]:
+        """Pick the key with the most headroom.
+
+        Ties are broken in turn, each pick starting from the next key of the pool.
+
+        Raises:
+            InvalidApiKeyError: the pool is empty.
+
+        Returns:
+            Tuple[uuid.UUID, RateLimiter]: key and its ratelimit state.
+        """
+        if not self._limiters:
+            raise InvalidApiKeyError("No API key provided")
+        items = list(self._limiters.items())
+        start = self._turn % len(items)
+        self._turn += 1
+        return max(items[start:] + items[:start], key=lambda item: item[1].headroom)
+
+    async def acquire(self, wait: bool = True) -> Tuple[uuid.UUID, RateLimiter]:
+        """Pick a key and reserve a request on it.
+
+        In waiting mode a pool of several keys whose keys are all drained waits
+        until the first of them has budget again and then picks a key afresh,
+        so requests do not queue on a drained key while another has headroom.
+
+        Args:
+            wait (bool): wait for the ratelimit instead of raising. Defaults to True.
+
+        Raises:
+            InvalidApiKeyError: the pool is empty.
+            RateLimitError: ratelimit has been reached and wait is False.
+
+        Returns:
+            Tuple[uuid.UUID, RateLimiter]: key and its ratelimit state.
+        """
+        while True:
+            key, limiter = self.select()
+            if wait and len(self._limiters) > 1 and limiter.headroom <= 0:
+                ready = min(other.ready_at for other in self._limiters.values())
+                delay = (ready - _now()).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+            await limiter.acquire(wait)
+            return key, limiter
+
+    def remove(self, key: uuid.UUID) -> bool:
+        """Drop a key from the pool, unless it is the last one.
+
+        The last key is kept so that later requests keep failing with the
+        error hypixel gives for it.
+
+        Args:
+            key (uuid.UUID): api key.
+
+        Returns:
+            bool: whether the key was dropped.
+        """
+        if key not in self._limiters or len(self._limiters) == 1:
+            return False
+        del self._limiters[key]
+        return True
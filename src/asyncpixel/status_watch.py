@@ -0,0 +1,222 @@
+"""Polling of the online status of a watchlist of players."""
+import asyncio
+import datetime
+import heapq
+import uuid
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from . import utils
+from .hypixel import UUID, Hypixel
+from .models import Status, StatusChange
+from .ratelimit import WINDOW
+
+__all__ = ["StatusWatcher"]
+
+
+def _state(status: Optional[Status]) -> Tuple[bool, Optional[int]]:
+    """Get the part of a status that is reported when it changes.
+
+    Args:
+        status (Optional[Status]): status of a player.
+
+    Returns:
+        Tuple[bool, Optional[int]]: whether the player is online and the id of
+            the game they are playing.
+    """
+    if status is None or not status.online:
+        return False, None
+    return True, None if status.game_type is None else status.game_type.id
+
+
+class StatusWatcher:
+    """Poll the status of a watchlist of players and report what changes.
+
+    Players are polled every ``min_interval`` seconds while they are online
+    and right after they change. Each poll that finds a player still offline
+    multiplies their interval by ``backoff``, up to ``max_interval``, so
+    players who have been dormant for a long time are polled least. Requests
+    are spaced to use at most ``share`` of the ratelimit of the client's keys,
+    when polls are due faster than that they are sent in order of when they
+    were due.
+
+    The first poll of a player records their status without reporting it.
+    Failed polls are counted in errors and retried after the player's
+    interval.
+    """
+
+    def __init__(
+        self,
+        client: Hypixel,
+        uuids: Iterable[UUID] = (),
+        min_interval: float = 30.0,
+        max_interval: float = 1800.0,
+        backoff: float = 2.0,
+        share: float = 1.0,
+        concurrency: int = 10,
+    ) -> None:
+        """Initialise watcher.
+
+        Args:
+            client (Hypixel): client used to fetch statuses.
+            uuids (Iterable[UUID], optional): uuids of the players to watch.
+                Defaults to none.
+            min_interval (float, optional): seconds between polls of an active
+                player. Defaults to 30.0.
+            max_interval (float, optional): seconds between polls of a dormant
+                player. Defaults to 1800.0.
+            backoff (float, optional): factor the interval of an offline player
+                grows by each poll. Defaults to 2.0.
+            share (float, optional): fraction of the ratelimit of the keys used.
+                Defaults to 1.0.
+            concurrency (int, optional): Maximum number of statuses fetched at
+                once. Defaults to 10.
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.share = share
+        self.concurrency = concurrency
+        self.statuses: Dict[uuid.UUID, Optional[Status]] = {}
+        self.errors = 0
+        self._intervals: Dict[uuid.UUID, float] = {}
+        self._entries: Dict[uuid.UUID, int] = {}
+        self._queue: List[Tuple[float, int, uuid.UUID]] = []
+        self._pushed = 0
+        self._next_request = 0.0
+        self.add(uuids)
+
+    def __len__(self) -> int:
+        """Number of players watched."""
+        return len(self._intervals)
+
+    def add(self, uuids: Iterable[UUID]) -> None:
+        """Watch players, they are polled as soon as possible.
+
+        Args:
+            uuids (Iterable[UUID]): uuids of the players.
+        """
+        now = utils.monotonic()
+        for player_uuid in utils.unique_uuids(uuids):
+            if player_uuid not in self._intervals:
+                self._intervals[player_uuid] = self.min_interval
+                self._schedule(player_uuid, now)
+
+    def remove(self, uuids: Iterable[UUID]) -> None:
+        """Stop watching players.
+
+        Args:
+            uuids (Iterable[UUID]): uuids of the players.
+        """
+        for player_uuid in utils.unique_uuids(uuids):
+            self._intervals.pop(player_uuid, None)
+            self._entries.pop(player_uuid, None)
+            self.statuses.pop(player_uuid, None)
+
+    def interval(self, player_uuid: UUID) -> Optional[float]:
+        """Get the seconds between polls of a player.
+
+        Args:
+            player_uuid (UUID): uuid of the player.
+
+        Returns:
+            Optional[float]: current interval, None if the player is not watched.
+        """
+        return self._intervals.get(player_uuid if isinstance(player_uuid, uuid.UUID) else uuid.UUID(player_uuid))
+
+    def _schedule(self, player_uuid: uuid.UUID, due: float) -> None:
+        """Queue the next poll of a player, replacing any queued before.
+
+        Args:
+            player_uuid (uuid.UUID): uuid of the player.
+            due (float): monotonic time the poll is due.
+        """
+        self._entries[player_uuid] = self._pushed
+        heapq.heappush(self._queue, (due, self._pushed, player_uuid))
+        self._pushed += 1
+
+    def _spacing(self) -> float:
+        """Get the seconds between requests allowed by the ratelimit.
+
+        Returns:
+            float: spacing, 0 until the ratelimit of the keys is known.
+        """
+        limit = self.client.total_requests * self.share
+        return WINDOW.total_seconds() / limit if limit else 0.0
+
+    def observe(self, player_uuid: uuid.UUID, status: Optional[Status]) -> Optional[StatusChange]:
+        """Record a polled status and schedule the next poll of the player.
+
+        Args:
+            player_uuid (uuid.UUID): uuid of the player.
+            status (Optional[Status]): status polled, None if the player has no
+                session.
+
+        Returns:
+            Optional[StatusChange]: change since the previous poll, None if the
+                player is unchanged or was polled for the first time.
+        """
+        seen = player_uuid in self.statuses
+        previous = self.statuses.get(player_uuid)
+        self.statuses[player_uuid] = status
+        state = _state(status)
+        changed = seen and _state(previous) != state
+        interval = self.min_interval
+        if seen and not changed and not state[0]:
+            interval = min(self._intervals[player_uuid] * self.backoff, self.max_interval)
+        self._intervals[player_uuid] = interval
+        self._schedule(player_uuid, utils.monotonic() + interval)
+        if not changed:
+            return None
+        return StatusChange(uuid=player_uuid, previous=previous, current=status, time=datetime.datetime.now())
+
+    async def watch(self) -> AsyncIterator[StatusChange]:
+        """Poll the players for as long as the iterator is consumed.
+
+        Players added while watching are polled within ``min_interval``.
+
+        Yields:
+            StatusChange: players coming online, going offline or changing game.
+        """
+        tasks: Dict["asyncio.Future[Optional[Status]]", uuid.UUID] = {}
+        try:
+            while True:
+                now = utils.monotonic()
+                while self._queue and len(tasks) < self.concurrency:
+                    due, entry, player_uuid = self._queue[0]
+                    if self._entries.get(player_uuid) != entry:
+                        heapq.heappop(self._queue)
+                        continue
+                    if max(due, self._next_request) > now:
+                        break
+                    heapq.heappop(self._queue)
+                    del self._entries[player_uuid]
+                    self._next_request = max(self._next_request, now) + self._spacing()
+                    tasks[asyncio.ensure_future(self.client.player_status(player_uuid))] = player_uuid
+
+                delay: Optional[float] = self.min_interval
+                if len(tasks) >= self.concurrency:
+                    delay = None
+                elif self._queue:
+                    delay = max(self._queue[0][0], self._next_request) - now
+                if not tasks:
+                    await asyncio.sleep(delay or 0)
+                    continue
+                done, _ = await asyncio.wait(tasks, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    player_uuid = tasks.pop(task)
+                    if player_uuid not in self._intervals or player_uuid in self._entries:
+                        # Removed, or removed and added again, while it was polled.
+                        continue
+                    try:
+                        status = task.result()
+                    except Exception:
+                        self.errors += 1
+                        self._schedule(player_uuid, utils.monotonic() + self._intervals[player_uuid])
+                        continue
+                    change = self.observe(player_uuid, status)
+                    if change is not None:
+                        yield change
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,164 @@
+"""Incremental parsing of large json responses."""
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+__all__ = ["ArrayItems"]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_START = "start"
+_FIRST_KEY = "first key"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_NEXT = "next"
+_FIRST_ITEM = "first item"
+_ITEM = "item"
+_NEXT_ITEM = "next item"
+_END = "end"
+
+# Structural characters moving the parser from one state to the next.
+_TRANSITIONS = {
+    (_START, "{"): _FIRST_KEY,
+    (_FIRST_KEY, "}"): _END,
+    (_COLON, ":"): _VALUE,
+    (_VALUE, "["): _FIRST_ITEM,
+    (_NEXT, ","): _KEY,
+    (_NEXT, "}"): _END,
+    (_FIRST_ITEM, "]"): _NEXT,
+    (_NEXT_ITEM, ","): _ITEM,
+    (_NEXT_ITEM, "]"): _NEXT,
+}
+
+
+class ArrayItems:
+    """Parse the items of an array in a json object while the bytes arrive.
+
+    Only the array under ``key`` is split into items, the other values of the
+    object are decoded whole into :attr:`fields`. Only the bytes of the item
+    being received are buffered, so a large array never has to be held in
+    memory at once.
+
+    Example:
+        parser = ArrayItems("auctions")
+        async for chunk in response.content.iter_any():
+            for item in parser.feed(chunk):
+                ...
+        parser.feed(b"", final=True)
+    """
+
+    def __init__(self, key: str) -> None:
+        """Initialise parser.
+
+        Args:
+            key (str): key of the array to split into items.
+        """
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._name = ""
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        """Parse the next bytes of the response.
+
+        Args:
+            chunk (bytes): next bytes of the json.
+            final (bool, optional): whether these are the last bytes. Defaults to False.
+
+        Raises:
+            ValueError: json is malformed or ends before the object is complete.
+
+        Returns:
+            List[Any]: items of the array completed by these bytes.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(chunk, final)
+        self._pos = 0
+        items: List[Any] = []
+        while self._step(items, final):
+            pass
+        if final and self._state != _END:
+            raise ValueError(f"Json ended before the object was complete, expecting {self._state}")
+        return items
+
+    def _token(self) -> str:
+        """Skip whitespace and peek at the next character.
+
+        Returns:
+            str: next character, empty if more bytes are needed.
+        """
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        return self._buffer[self._pos : self._pos + 1]
+
+    def _value(self, final: bool) -> Tuple[bool, Any]:
+        """Decode the next json value.
+
+        A value running up to the end of the buffer is only accepted once the
+        bytes are final, as more digits of a number could still be coming.
+
+        Args:
+            final (bool): whether the buffer holds the last bytes.
+
+        Raises:
+            ValueError: value is malformed.
+
+        Returns:
+            Tuple[bool, Any]: whether a value was decoded and the value.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        if end == len(self._buffer) and not final:
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _step(self, items: List[Any], final: bool) -> bool:
+        """Advance the parser by one token or value.
+
+        Args:
+            items (List[Any]): completed items of the array are appended to it.
+            final (bool): whether the buffer holds the last bytes.
+
+        Raises:
+            ValueError: unexpected character.
+
+        Returns:
+            bool: whether the parser advanced, False if more bytes are needed.
+        """
+        token = self._token()
+        if not token:
+            return False
+        state = self._state
+        if state == _ITEM or (state == _VALUE and not (self._name == self.key and token == "[")):
+            done, value = self._value(final)
+            if not done:
+                return False
+            if state == _ITEM:
+                items.append(value)
+                self._state = _NEXT_ITEM
+            else:
+                self.fields[self._name] = value
+                self._state = _NEXT
+        elif state in (_FIRST_KEY, _KEY) and token == '"':
+            done, name = self._value(final)
+            if not done:
+                return False
+            self._name = name
+            self._state = _COLON
+        elif (state, token) in _TRANSITIONS:
+            self._pos += 1
+            self._state = _TRANSITIONS[state, token]
+        elif state == _FIRST_ITEM:
+            self._state = _ITEM
+        else:
+            raise ValueError(f"Expecting {state} at character {self._pos}, got {token!r}")
+        return True
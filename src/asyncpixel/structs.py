@@ -0,0 +1,298 @@
+"""Compact msgspec structs for the bulk endpoints.
+
+The structs mirror the attributes of the pydantic models of the same name
+but are slotted, skip per object validation machinery and decode straight
+from json bytes, which makes them several times faster to build and
+smaller in memory. They need msgspec, install it with
+``pip install asyncpixel[msgspec]``.
+"""
+import datetime
+from functools import cached_property
+from math import floor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union
+from uuid import UUID
+
+import msgspec
+
+from .nbt import decode_item_bytes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .hypixel import Hypixel
+    from .models import GuildWithPlayers
+
+__all__ = [
+    "Auction",
+    "AuctionEnded",
+    "AuctionEndedItem",
+    "AuctionItem",
+    "Bazaar",
+    "BazaarItem",
+    "BazaarQuickStatus",
+    "BazaarSummary",
+    "Bids",
+    "Guild",
+    "GuildMembers",
+    "Rank",
+    "Timestamp",
+    "bazaar",
+    "convert",
+    "decode",
+]
+
+T = TypeVar("T")
+
+# Numbers above this are read as milliseconds, the same rule pydantic uses.
+_MS_THRESHOLD = 2e10
+
+
+class Timestamp(datetime.datetime):
+    """Timezone aware datetime sent as seconds or milliseconds since the epoch."""
+
+
+def _dec_hook(type_: Type[Any], obj: Any) -> Any:
+    """Decode the types msgspec does not support natively.
+
+    Args:
+        type_ (Type[Any]): type to decode to.
+        obj (Any): json value.
+
+    Raises:
+        NotImplementedError: type is not supported.
+
+    Returns:
+        Any: decoded value.
+    """
+    if type_ is Timestamp:
+        if isinstance(obj, (int, float)):
+            seconds = obj / 1000 if abs(obj) > _MS_THRESHOLD else obj
+            return Timestamp.fromtimestamp(seconds, datetime.timezone.utc)
+        value = msgspec.convert(obj, datetime.datetime)
+        return Timestamp.fromtimestamp(value.timestamp(), value.tzinfo)
+    raise NotImplementedError(type_)
+
+
+def decode(body: bytes, type: Type[T]) -> T:
+    """Decode json bytes into a struct.
+
+    Args:
+        body (bytes): encoded json.
+        type (Type[T]): type to decode to.
+
+    Returns:
+        T: decoded value.
+    """
+    return msgspec.json.decode(body, type=type, dec_hook=_dec_hook)
+
+
+def convert(data: Any, type: Type[T]) -> T:
+    """Convert decoded json into a struct.
+
+    Args:
+        data (Any): decoded json.
+        type (Type[T]): type to convert to.
+
+    Returns:
+        T: converted value.
+    """
+    return msgspec.convert(data, type=type, dec_hook=_dec_hook)
+
+
+class _Struct(msgspec.Struct, gc=False):
+    """Base of the structs, none of them can be part of a reference cycle.
+
+    Structs caching nbt need a __dict__, which msgspec only allows with gc.
+    """
+
+
+class Bids(_Struct, kw_only=True):
+    """Bid on an auction, see :class:`asyncpixel.models.Bids`."""
+
+    auction_id: UUID
+    bidder: UUID
+    profile_id: Optional[UUID] = None
+    amount: int
+    timestamp: Timestamp
+
+
+class AuctionItem(_Struct, kw_only=True, gc=True, dict=True):
+    """Auction, see :class:`asyncpixel.models.AuctionItem`."""
+
+    uuid: UUID
+    auctioneer: UUID
+    profile_id: UUID
+    coop: List[UUID]
+    start: Timestamp
+    end: Timestamp
+    item_name: str
+    item_lore: str
+    extra: str
+    category: str
+    tier: str
+    starting_bid: int
+    item_bytes: Union[str, Dict[str, Union[int, str]]]
+    claimed: bool
+    claimed_bidders: Optional[List[UUID]] = None
+    highest_bid_amount: int
+    bids: List[Bids]
+    id: Optional[str] = msgspec.field(name="_id", default=None)
+    bin: bool = False
+
+    @cached_property
+    def nbt(self) -> Dict[str, Any]:
+        """NBT data of the item, decoded from item_bytes on first access."""
+        return decode_item_bytes(self.item_bytes)
+
+    def active(self) -> bool:
+        """Return if auction is active - you can bid on it."""
+        return not self.claimed and datetime.datetime.now(tz=self.end.astimezone().tzinfo) < self.end
+
+    def lowest_possible_bid(self) -> int:
+        """Returns next lowest possible bid."""
+        current_price = max(self.starting_bid, self.highest_bid_amount)
+
+        if 1 <= current_price <= 3:
+            return floor(current_price) + 1
+
+        return floor(current_price * 1.15)
+
+
+class Auction(_Struct, kw_only=True, rename="camel"):
+    """Page of auctions, see :class:`asyncpixel.models.Auction`."""
+
+    page: int
+    total_pages: int
+    total_auctions: int
+    last_updated: Timestamp
+    auctions: List[AuctionItem]
+
+
+class AuctionEndedItem(_Struct, kw_only=True, gc=True, dict=True):
+    """Ended auction, see :class:`asyncpixel.models.AuctionEndedItem`."""
+
+    auction_id: UUID
+    seller: UUID
+    seller_profile: UUID
+    buyer: UUID
+    timestamp: Timestamp
+    bin: bool = False
+    item_bytes: Union[str, Dict[str, Union[int, str]]]
+    price: int
+
+    @cached_property
+    def nbt(self) -> Dict[str, Any]:
+        """NBT data of the item, decoded from item_bytes on first access."""
+        return decode_item_bytes(self.item_bytes)
+
+
+class AuctionEnded(_Struct, kw_only=True, rename="camel"):
+    """Recently ended auctions, see :class:`asyncpixel.models.AuctionEnded`."""
+
+    last_updated: Timestamp
+    auctions: List[AuctionEndedItem]
+
+
+class BazaarSummary(_Struct, kw_only=True, rename="camel"):
+    """Bazaar order summary, see :class:`asyncpixel.models.BazaarSummary`."""
+
+    amount: int
+    price_per_unit: float
+    orders: int
+
+
+class BazaarQuickStatus(_Struct, kw_only=True, rename="camel"):
+    """Bazaar quick status, see :class:`asyncpixel.models.BazaarQuickStatus`."""
+
+    product_id: str
+    sell_price: float
+    sell_volume: int
+    sell_moving_week: int
+    sell_orders: int
+    buy_price: float
+    buy_volume: int
+    buy_moving_week: int
+    buy_orders: int
+
+
+class BazaarItem(_Struct, kw_only=True):
+    """Bazaar product, see :class:`asyncpixel.models.BazaarItem`."""
+
+    product_id: str
+    sell_summary: List[BazaarSummary]
+    buy_summary: List[BazaarSummary]
+    quick_status: BazaarQuickStatus
+
+
+class Bazaar(_Struct, kw_only=True):
+    """Bazaar, see :class:`asyncpixel.models.Bazaar`."""
+
+    last_updated: Timestamp
+    bazaar_items: List[BazaarItem]
+
+
+class _BazaarResponse(_Struct, kw_only=True, rename="camel"):
+    """Bazaar as sent by hypixel."""
+
+    last_updated: Timestamp
+    products: Dict[str, BazaarItem]
+
+
+def bazaar(data: Any) -> Bazaar:
+    """Convert a decoded bazaar response.
+
+    Args:
+        data (Any): decoded json of the response.
+
+    Returns:
+        Bazaar: bazaar.
+    """
+    response = convert(data, _BazaarResponse)
+    return Bazaar(last_updated=response.last_updated, bazaar_items=list(response.products.values()))
+
+
+class GuildMembers(_Struct, kw_only=True, rename="camel"):
+    """Guild member, see :class:`asyncpixel.models.GuildMembers`."""
+
+    uuid: UUID
+    rank: str
+    joined: Timestamp
+    exp_history: Optional[Dict[str, int]] = None
+    quest_participation: Optional[int] = None
+    muted_till: Optional[Timestamp] = None
+
+
+class Rank(_Struct, kw_only=True):
+    """Guild rank, see :class:`asyncpixel.models.Rank`."""
+
+    name: str
+    default: bool
+    created: int
+    priority: int
+    tag: Optional[str] = None
+
+
+class Guild(_Struct, kw_only=True, rename="camel"):
+    """Guild, see :class:`asyncpixel.models.Guild`."""
+
+    id: str = msgspec.field(name="_id")
+    created: Timestamp
+    name: str
+    name_lower: str = msgspec.field(name="name_lower")
+    description: Optional[str] = None
+    tag: Optional[str] = None
+    exp: int
+    members: List[GuildMembers]
+    achievements: Dict[str, int]
+    ranks: Optional[List[Rank]] = None
+    joinable: bool = False
+    legacy_ranking: Optional[int] = None
+    publicly_listed: Optional[bool] = None
+    preferred_games: Optional[List[str]] = None
+    chat_mute: Optional[Timestamp] = None
+    guild_exp_by_game_type: Optional[Dict[str, int]] = None
+    tag_color: Optional[str] = None
+
+    async def expand(
+        self, client: "Hypixel", timeout: Optional[float] = None, concurrency: int = 10
+    ) -> "GuildWithPlayers":
+        """Fetch the players of every member, see :meth:`asyncpixel.models.Guild.expand`."""
+        return await client.guild_players(self, timeout=timeout, concurrency=concurrency)  # type: ignore[arg-type]
@@ -1,8 +1,10 @@
 """Utils."""
 import re
-from typing import Optional, Union
+import time
+import uuid
+from typing import Iterable, Iterator, Optional, Set, Union
 
-from asyncpixel.constants import GameType, get_game_types
+from asyncpixel.constants import GameType, get_game_type_index
 
 ranks = {
     "NONE": None,
@@ -75,12 +77,41 @@ def validate_game_type(game_type: Union[str, int]) -> GameType:
     """Validate and convert game type.
 
     Args:
-        type (Union[str, int]): Game name or id.
+        game_type (Union[str, int]): Game id, or its type, database or clean name.
+
+    Raises:
+        ValueError: no game type matches.
 
     Returns:
-        GameType: GameType object
+        GameType: shared GameType object
+    """
+    return get_game_type_index().get(game_type)
+
+
+def monotonic() -> float:
+    """Get the time of the clock used for expiry and scheduling.
+
+    Returns:
+        float: monotonic time in seconds.
+    """
+    return time.monotonic()
+
+
+def unique_uuids(uuids: Iterable[Union[str, uuid.UUID]]) -> Iterator[uuid.UUID]:
+    """Parse uuids, skipping repeats.
+
+    Args:
+        uuids (Iterable[Union[str, uuid.UUID]]): uuids as strings or objects.
+
+    Raises:
+        ValueError: a uuid is malformed.
+
+    Yields:
+        uuid.UUID: each uuid the first time it is seen.
     """
-    if type(game_type) is int:
-        return next(game for game in get_game_types() if game.id == game_type)
-    else:
-        return next(game for game in get_game_types() if game.type_name == game_type)
+    seen: Set[uuid.UUID] = set()
+    for value in uuids:
+        parsed = value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+        if parsed not in seen:
+            seen.add(parsed)
+            yield parsed
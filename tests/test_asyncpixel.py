@@ -1,10 +1,12 @@
 """Main tests."""
+import asyncio
 from uuid import UUID
 
 import pytest
 from aioresponses import aioresponses
 
 import asyncpixel
+from asyncpixel.mojang import PROFILES_URL
 
 from .utils import generate_key
 
@@ -112,10 +114,9 @@ async def test_saved_rate_max() -> None:
 async def test_get_uuid() -> None:
     """Test get uuid."""
     with aioresponses() as m:
-        m.get(
-            "https://api.mojang.com/users/profiles/minecraft/Technoblade",
-            status=200,
-            payload={"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"},
+        m.post(
+            PROFILES_URL,
+            payload=[{"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"}],
         )
         client = asyncpixel.Hypixel()
         uuid = await client.uuid_from_name("Technoblade")
@@ -127,10 +128,7 @@ async def test_get_uuid() -> None:
 async def test_get_uuid_fail() -> None:
     """Test get uuid."""
     with aioresponses() as m:
-        m.get(
-            "https://api.mojang.com/users/profiles/minecraft/Technoblade",
-            status=404,
-        )
+        m.post(PROFILES_URL, payload=[])
         client = asyncpixel.Hypixel()
         uuid = await client.uuid_from_name("Technoblade")
         assert uuid is None
@@ -140,11 +138,31 @@ async def test_get_uuid_fail() -> None:
 async def test_context_manager() -> None:
     """Test context manager."""
     with aioresponses() as m:
-        m.get(
-            "https://api.mojang.com/users/profiles/minecraft/Technoblade",
-            status=200,
-            payload={"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"},
+        m.post(
+            PROFILES_URL,
+            payload=[{"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"}],
         )
         async with asyncpixel.Hypixel() as client:
             uuid = await client.uuid_from_name("Technoblade")
             assert uuid == UUID("b876ec32e396476ba1158438d83c67d4")
+
+
+@pytest.mark.asyncio
+async def test_coalesce_requests() -> None:
+    """Test identical concurrent requests share one response."""
+    key = generate_key()
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/test?key={key!s}&a=1", status=200, payload={"success": True})
+        m.get(f"https://api.hypixel.net/test?key={key!s}&a=2", status=502, payload={"success": False})
+        client = asyncpixel.Hypixel(api_key=str(key))
+        first, second = await asyncio.gather(client._get("test", {"a": 1}), client._get("test", {"a": "1"}))
+        assert first is second
+        assert sum(len(calls) for calls in m.requests.values()) == 1
+
+        results = await asyncio.gather(
+            client._get("test", {"a": 2}), client._get("test", {"a": 2}), return_exceptions=True
+        )
+        assert all(isinstance(result, asyncpixel.exceptions.ApiNoSuccessError) for result in results)
+        assert sum(len(calls) for calls in m.requests.values()) == 2
+        assert not client._inflight
+        await client.close()
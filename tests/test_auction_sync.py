@@ -0,0 +1,95 @@
+"""Test auction sync."""
+import asyncio
+import uuid
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel
+from asyncpixel.auction_sync import AuctionSync
+from asyncpixel.exceptions import ApiNoSuccessError
+from tests.utils import auction_item, auction_page
+
+URL = "https://api.hypixel.net/skyblock/auctions?page={}"
+
+
+@pytest.mark.asyncio
+async def test_refresh() -> None:
+    """Test refreshes report new, changed and removed auctions."""
+    kept, bid_on, ended, listed = (uuid.uuid4() for _ in range(4))
+    with aioresponses() as m:
+        m.get(URL.format(0), payload=auction_page(0, 2, [auction_item(kept)], last_updated=1))
+        m.get(URL.format(1), payload=auction_page(1, 2, [auction_item(bid_on), auction_item(ended)], last_updated=1))
+        m.get(URL.format(0), payload=auction_page(0, 2, [auction_item(kept)], last_updated=1))
+        m.get(URL.format(0), payload=auction_page(0, 2, [auction_item(kept)], last_updated=2))
+        m.get(
+            URL.format(1),
+            payload=auction_page(1, 2, [auction_item(bid_on, bids=1), auction_item(listed)], last_updated=2),
+        )
+        client = Hypixel()
+        sync = AuctionSync(client)
+
+        diff = await sync.refresh()
+        assert diff is not None
+        assert {item.uuid for item in diff.new} == {kept, bid_on, ended}
+
+        assert await sync.refresh() is None
+
+        diff = await sync.refresh()
+        assert diff is not None
+        assert [item.uuid for item in diff.new] == [listed]
+        assert [item.uuid for item in diff.changed] == [bid_on]
+        assert [item.uuid for item in diff.removed] == [ended]
+        assert set(sync.auctions) == {kept, bid_on, listed}
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_mid_crawl() -> None:
+    """Test a crawl spanning two updates is started over."""
+    kept, moved = uuid.uuid4(), uuid.uuid4()
+    with aioresponses() as m:
+        m.get(URL.format(0), payload=auction_page(0, 2, [auction_item(kept)], last_updated=1))
+        m.get(URL.format(1), payload=auction_page(1, 2, [auction_item(kept)], last_updated=2))
+        m.get(URL.format(0), payload=auction_page(0, 2, [auction_item(kept)], last_updated=2))
+        m.get(URL.format(1), payload=auction_page(1, 2, [auction_item(moved)], last_updated=2))
+        client = Hypixel()
+        sync = AuctionSync(client, restarts=1)
+
+        diff = await sync.refresh()
+        assert diff is not None
+        assert diff.last_updated == sync.last_updated
+        assert {item.uuid for item in diff.new} == {kept, moved}
+
+        m.get(URL.format(0), payload=auction_page(0, 2, [], last_updated=3), repeat=True)
+        m.get(URL.format(1), payload=auction_page(1, 2, [], last_updated=4), repeat=True)
+        with pytest.raises(ApiNoSuccessError):
+            await sync.refresh()
+        assert set(sync.auctions) == {kept, moved}
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_watch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test watch polls until the auction house is updated."""
+    delays = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(delay: float, *args: Any) -> None:
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    with aioresponses() as m:
+        m.get(URL.format(0), payload=auction_page(0, 1, [auction_item()], last_updated=1))
+        m.get(URL.format(0), payload=auction_page(0, 1, [auction_item()], last_updated=1))
+        m.get(URL.format(0), payload=auction_page(0, 1, [], last_updated=2))
+        client = Hypixel()
+        sync = AuctionSync(client)
+        watch = sync.watch(interval=0.5)
+        assert len((await watch.__anext__()).new) == 1
+        assert len((await watch.__anext__()).removed) == 1
+        await watch.aclose()
+        assert delays == [0.5, 0.5]
+        await client.close()
@@ -7,6 +7,8 @@ import pytest
 from aioresponses import aioresponses
 
 from asyncpixel import Hypixel
+from asyncpixel.exceptions import ApiNoSuccessError
+from tests.utils import auction_page
 
 
 @pytest.mark.asyncio
@@ -111,3 +113,24 @@ async def test_auctions(hypixel_client: AsyncGenerator[Hypixel, None]) -> None:
         assert data.auctions[0].bids[0].timestamp == datetime.datetime.fromtimestamp(
             1571065921.089, tz=datetime.timezone.utc
         )
+
+
+@pytest.mark.asyncio
+async def test_auctions_all() -> None:
+    """Test every page of the auction house is fetched."""
+    with aioresponses() as m:
+        m.get("https://api.hypixel.net/skyblock/auctions?page=0", status=200, payload=auction_page(0, 3))
+        m.get("https://api.hypixel.net/skyblock/auctions?page=1", status=502, payload={"success": False})
+        m.get("https://api.hypixel.net/skyblock/auctions?page=1", status=200, payload=auction_page(1, 3))
+        m.get("https://api.hypixel.net/skyblock/auctions?page=2", status=200, payload=auction_page(2, 3))
+        client = Hypixel()
+        pages = [auction.page async for auction in client.auctions_all(concurrency=2)]
+        assert pages[0] == 0
+        assert sorted(pages) == [0, 1, 2]
+
+        m.get("https://api.hypixel.net/skyblock/auctions?page=0", status=200, payload=auction_page(0, 2))
+        m.get("https://api.hypixel.net/skyblock/auctions?page=1", status=502, payload={"success": False})
+        with pytest.raises(ApiNoSuccessError):
+            async for _ in client.auctions_all(retry=1):
+                pass
+        await client.close()
@@ -0,0 +1,74 @@
+"""Test bin index."""
+import datetime
+import uuid
+
+from asyncpixel.bin_index import BinIndex, normalize_name
+from asyncpixel.models import AuctionDiff, AuctionItem
+from tests.utils import auction_item
+
+
+def auction(name: str, price: int, bin: bool = True, bids: int = 0) -> AuctionItem:
+    """Build an auction."""
+    return AuctionItem.model_validate(auction_item(item_name=name, starting_bid=price, bin=bin, bids=bids))
+
+
+def test_normalize_name() -> None:
+    """Test item names are normalized."""
+    assert normalize_name("§6Hyperion ✪✪✪✪✪➋") == "hyperion"
+    assert normalize_name("  Magical   Mushroom Soup ") == "magical mushroom soup"
+
+
+def test_queries() -> None:
+    """Test lowest, cheapest and percentile queries."""
+    auctions = [auction("§dHyperion", price) for price in (500, 100, 300, 200, 400)]
+    index = BinIndex.from_auctions([*auctions, auction("Hyperion", 50, bin=False), auction("Hyperion", 60, bids=1)])
+    assert len(index) == 5
+    assert "HYPERION" in index
+    assert 5 not in index
+    assert list(index) == ["hyperion"]
+    assert index.lowest("Hyperion") == 100
+    assert index.lowest("Terminator") is None
+    assert index.cheapest("hyperion", 2) == [(100, auctions[1].uuid), (200, auctions[3].uuid)]
+    assert index.cheapest("terminator", 2) == []
+    assert index.percentile("hyperion", 0) == 100
+    assert index.percentile("hyperion", 50) == 300
+    assert index.percentile("hyperion", 100) == 500
+    assert index.percentile("terminator", 50) is None
+
+    index.remove(auctions[1].uuid)
+    assert index.lowest("hyperion") == 200
+
+
+def test_incremental_updates() -> None:
+    """Test auctions are added and removed incrementally."""
+    index = BinIndex()
+    cheap, expensive = auction("Hyperion", 100), auction("Hyperion", 200)
+    index.add(cheap)
+    index.add(auction("Hyperion", 50, bin=False))
+    index.apply(AuctionDiff(last_updated=datetime.datetime.now(), new=[expensive], removed=[cheap]))
+    assert index.lowest("hyperion") == 200
+
+    relisted = expensive.model_copy(update={"starting_bid": 150})
+    index.apply(AuctionDiff(last_updated=datetime.datetime.now(), changed=[relisted]))
+    assert index.cheapest("hyperion", 5) == [(150, expensive.uuid)]
+
+    index.remove(uuid.uuid4())
+    index.remove(expensive.uuid)
+    assert "hyperion" not in index
+    assert len(index) == 0
+
+
+def test_sold_auctions() -> None:
+    """Test a BIN auction that sells drops out of the index."""
+    cheap, expensive = auction("Hyperion", 100), auction("Hyperion", 200)
+    index = BinIndex.from_auctions([cheap, expensive])
+    assert index.lowest("hyperion") == 100
+
+    sold = AuctionItem.model_validate(auction_item(cheap.uuid, "Hyperion", 100, bids=1))
+    index.apply(AuctionDiff(last_updated=datetime.datetime.now(), changed=[sold]))
+    assert index.lowest("hyperion") == 200
+    assert len(index) == 1
+
+    claimed = expensive.model_copy(update={"claimed": True})
+    index.apply(AuctionDiff(last_updated=datetime.datetime.now(), changed=[claimed]))
+    assert "hyperion" not in index
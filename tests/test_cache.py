@@ -0,0 +1,149 @@
+"""Test cache."""
+import asyncio
+import pathlib
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel, cache, utils
+from asyncpixel.cache import BaseCache, MemoryCache, SQLiteCache
+from tests.utils import generate_key
+
+
+@pytest.mark.asyncio
+async def test_ttl_for() -> None:
+    """Test time to live lookup per endpoint."""
+    memory = MemoryCache(ttl={"resources/skyblock": 5, "player": 0})
+    assert memory.ttl_for("resources/quests") == 6 * 3600
+    assert memory.ttl_for("resources/skyblock/skills") == 5
+    assert memory.ttl_for("skyblock/bazaar") == 10
+    assert memory.ttl_for("player") == 0
+    assert memory.ttl_for("key") == 0
+    assert memory.key("player", {"uuid": "a", "b": 1}) == "player?b=1&uuid=a"
+
+
+def test_incomplete_backend() -> None:
+    """Test a backend missing part of the interface cannot be created."""
+
+    class Incomplete(BaseCache):
+        async def clear(self) -> None:
+            """Remove every cached response."""
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
+
+
+@pytest.mark.asyncio
+async def test_memory_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test entries expire and are counted."""
+    now = [0.0]
+    monkeypatch.setattr(utils, "monotonic", lambda: now[0])
+    memory = MemoryCache()
+    assert await memory.get("key", {}) is None
+    await memory.set("key", {}, {"a": 1}, 10)
+    assert len(memory) == 0
+
+    assert await memory.get("skyblock/bazaar", {}) is None
+    await memory.set("skyblock/bazaar", {}, {"a": 1}, 10)
+    await memory.set("skyblock/bazaar", {}, {"a": 2}, 20)
+    assert memory.size == 20
+    assert await memory.get("skyblock/bazaar", {}) == {"a": 2}
+    now[0] = 10
+    assert await memory.get("skyblock/bazaar", {}) is None
+    assert memory.size == 0
+    assert (memory.hits, memory.misses) == (1, 2)
+
+    await memory.set("player", {"uuid": 1}, {}, 10)
+    await memory.clear()
+    assert len(memory) == 0
+    assert memory.size == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_eviction() -> None:
+    """Test least recently used entries are evicted."""
+    memory = MemoryCache(max_entries=2, max_bytes=100)
+    await memory.set("player", {"uuid": 1}, {"uuid": 1}, 10)
+    await memory.set("player", {"uuid": 2}, {"uuid": 2}, 10)
+    assert await memory.get("player", {"uuid": 1}) is not None
+    await memory.set("player", {"uuid": 3}, {"uuid": 3}, 10)
+    assert await memory.get("player", {"uuid": 2}) is None
+    assert memory.evictions == 1
+
+    await memory.set("player", {"uuid": 4}, {"uuid": 4}, 101)
+    assert await memory.get("player", {"uuid": 4}) is None
+    await memory.set("player", {"uuid": 5}, {"uuid": 5}, 95)
+    assert len(memory) == 1
+    assert memory.size == 95
+    assert memory.evictions == 3
+
+
+@pytest.mark.asyncio
+async def test_client_cache() -> None:
+    """Test the client serves repeated requests from the cache."""
+    key = generate_key()
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/playerCount?key={key!s}", status=200, payload={"playerCount": 5})
+        client = Hypixel(api_key=key, cache=MemoryCache())
+        assert await client.player_count() == 5
+        assert await client.player_count() == 5
+        assert client.cache is not None
+        assert client.cache.hits == 1
+        assert client.cache.misses == 1
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test responses persist in the database."""
+    assert cache._timestamp() > 0
+    now = [0.0]
+    monkeypatch.setattr(cache, "_timestamp", lambda: now[0])
+    path = tmp_path / "cache.sqlite"
+    sqlite = SQLiteCache(path)
+    await sqlite.set("resources/quests", {}, {"quests": {"a": [1, 2]}}, 10)
+    await sqlite.set("skyblock/bazaar", {}, {"products": {}}, 10, b'{"products": {}}')
+    sqlite.close()
+
+    sqlite = SQLiteCache(path)
+    assert await sqlite.get("resources/quests", {}) == {"quests": {"a": [1, 2]}}
+    assert await sqlite.get("resources/quests", {"a": 1}) is None
+    assert await sqlite.get("skyblock/bazaar", {}) == {"products": {}}
+    now[0] = 20
+    assert await sqlite.get("skyblock/bazaar", {}) is None
+    assert (sqlite.hits, sqlite.misses) == (2, 2)
+    assert await sqlite.purge() == 1
+    assert sqlite.evictions == 1
+    await sqlite.clear()
+    assert await sqlite.get("resources/quests", {}) is None
+    sqlite.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_decoder(tmp_path: pathlib.Path) -> None:
+    """Test entries are decoded with the chosen json backend."""
+    bodies = []
+
+    def decode(body: bytes) -> Any:
+        bodies.append(body)
+        return {"decoded": True}
+
+    sqlite = SQLiteCache(tmp_path / "cache.sqlite", json_decoder=decode)
+    await sqlite.set("player", {}, {"player": None}, 10)
+    assert await sqlite.get("player", {}) == {"decoded": True}
+    assert bodies == [b'{"player":null}']
+    sqlite.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_concurrent(tmp_path: pathlib.Path) -> None:
+    """Test concurrent reads and writes from the executor threads."""
+    sqlite = SQLiteCache(tmp_path / "cache.sqlite")
+
+    async def roundtrip(index: int) -> None:
+        await sqlite.set("player", {"uuid": index}, {"uuid": index}, 12)
+        assert await sqlite.get("player", {"uuid": index}) == {"uuid": index}
+
+    await asyncio.gather(*(roundtrip(index) for index in range(200)))
+    sqlite.close()
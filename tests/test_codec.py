@@ -0,0 +1,47 @@
+"""Test codec."""
+from typing import Any, List
+
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel, codec
+from tests.utils import generate_key
+
+BODY = b'{"success":true,"items":[1,2.5,"\\u00a7a"],"nested":{"a":null}}'
+
+
+@pytest.mark.asyncio
+async def test_decoders() -> None:
+    """Test every installed decoder decodes the same."""
+    expected = {"success": True, "items": [1, 2.5, "§a"], "nested": {"a": None}}
+    for decode in codec.DECODERS.values():
+        assert decode(BODY) == expected
+    assert codec.decode_stdlib(codec.encode(expected)) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_decoder() -> None:
+    """Test decoders are chosen by name or passed through."""
+    assert codec.get_decoder("json") is codec.decode_stdlib
+    assert codec.get_decoder() in codec.DECODERS.values()
+    assert codec.get_decoder(len) is len
+    with pytest.raises(ValueError, match="not installed"):
+        codec.get_decoder("simdjson")
+
+
+@pytest.mark.asyncio
+async def test_client_decoder() -> None:
+    """Test the client decodes responses with its decoder."""
+    key = generate_key()
+    bodies: List[bytes] = []
+
+    def decode(body: bytes) -> Any:
+        bodies.append(body)
+        return codec.decode_stdlib(body)
+
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/playerCount?key={key!s}", status=200, body=b'{"playerCount": 5}')
+        client = Hypixel(api_key=key, json_decoder=decode)
+        assert await client.player_count() == 5
+        await client.close()
+    assert bodies == [b'{"playerCount": 5}']
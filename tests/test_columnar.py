@@ -0,0 +1,61 @@
+"""Test columnar auctions."""
+import uuid
+
+import pytest
+
+from asyncpixel import columnar
+from asyncpixel.columnar import AuctionColumns
+from asyncpixel.models import AuctionItem
+from tests.utils import auction_item
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with numpy and with the pure Python fallback."""
+    if request.param == "python":
+        monkeypatch.setattr(columnar, "numpy", None)
+    elif columnar.numpy is None:  # pragma: no cover
+        pytest.skip("numpy is not installed")
+    return str(request.param)
+
+
+def test_columns(backend: str) -> None:
+    """Test snapshots built from json and models match."""
+    auction_id = uuid.uuid4()
+    base = 1_700_000_000
+    raw = [
+        auction_item(auction_id, "Hyperion", 100, end=(base + 10) * 1000),
+        auction_item(item_name="Hyperion", starting_bid=300, end=(base + 20) * 1000),
+        auction_item(
+            item_name="Hyperion", starting_bid=50, bids=2, bin=False, tier="LEGENDARY", end=(base + 60) * 1000
+        ),
+        auction_item(item_name="Terminator", starting_bid=10, end=(base + 5) * 1000),
+    ]
+    from_json = AuctionColumns.from_json(raw)
+    from_models = AuctionColumns.from_auctions(AuctionItem.model_validate(item) for item in raw)
+    for columns in (from_json, from_models):
+        assert len(columns) == 4
+        assert list(columns.prices) == [100, 300, 51, 10]
+        assert list(columns.ends) == [(base + offset) * 1000 for offset in (10, 20, 60, 5)]
+        assert columns.uuid(0) == auction_id
+        assert columns.name(2) == "Hyperion"
+        assert columns.tier(2) == "LEGENDARY"
+
+        assert columns.where(bin=True, name="Hyperion") == [0, 1]
+        assert columns.where(tier="LEGENDARY") == [2]
+        assert columns.where(category="consumables", max_price=100) == [0, 2, 3]
+        assert columns.where(name="Unknown") == []
+        assert columns.where(rows=[1, 3]) == [1, 3]
+        assert columns.where(name="Hyperion", rows=[3, 1, 0]) == [1, 0]
+
+        assert columns.ending_within(15, now=base + 5) == [0, 1, 3]
+        assert columns.ending_within(60, now=base + 30) == [2]
+        assert columns.ending_within(60) == []
+
+        assert columns.median_prices() == {"Hyperion": 100, "Terminator": 10}
+        assert columns.median_prices(columns.where(bin=True)) == {"Hyperion": 200, "Terminator": 10}
+
+    empty = AuctionColumns()
+    assert empty.where(bin=True) == []
+    assert empty.ending_within(60) == []
+    assert empty.median_prices() == {}
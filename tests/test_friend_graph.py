@@ -0,0 +1,168 @@
+"""Test friend graph crawling."""
+import asyncio
+import pathlib
+import sys
+import threading
+import uuid
+from typing import Dict, List, Optional
+
+import pytest
+
+from asyncpixel import Hypixel
+from asyncpixel.exceptions import ApiNoSuccessError
+from asyncpixel.friend_graph import CRAWLED, FAILED, FriendCrawler, FriendGraph
+from asyncpixel.models import Friend
+
+A, B, C, D, E = (uuid.UUID(int=index, version=4) for index in range(1, 6))
+EDGES = [(A, B), (A, C), (B, D), (D, E)]
+
+
+def client_for(edges: List[tuple], failing: Optional[set] = None) -> Hypixel:
+    """Build a client answering friend lists from edges."""
+    friends: Dict[uuid.UUID, List[Friend]] = {}
+    for index, (sender, receiver) in enumerate(edges):
+        friend = Friend.model_validate(
+            {"_id": str(index), "uuidSender": sender, "uuidReceiver": receiver, "started": 1589214487454}
+        )
+        friends.setdefault(sender, []).append(friend)
+        friends.setdefault(receiver, []).append(friend)
+    client = Hypixel()
+    client.calls = []  # type: ignore[attr-defined]
+
+    async def player_friends(
+        player_uuid: uuid.UUID, wait_for_ratelimit: Optional[bool] = None
+    ) -> Optional[List[Friend]]:
+        assert wait_for_ratelimit
+        client.calls.append(player_uuid)  # type: ignore[attr-defined]
+        if failing and player_uuid in failing:
+            raise ApiNoSuccessError("friends")
+        return friends.get(player_uuid)
+
+    client.player_friends = player_friends  # type: ignore[method-assign]
+    return client
+
+
+@pytest.mark.asyncio
+async def test_crawl() -> None:
+    """Test players are crawled breadth first up to the depth limit."""
+    client = client_for(EDGES)
+    graph = await FriendCrawler(client, max_depth=2, concurrency=1).crawl([str(A)])
+
+    assert client.calls == [A, B, C]  # type: ignore[attr-defined]
+    assert len(graph) == 4
+    assert graph.edge_count == 3
+    assert [graph.depths[graph.node(player)] for player in (A, B, C, D)] == [0, 1, 1, 2]  # type: ignore[index]
+    assert graph.node(E) is None
+    assert sorted(graph.friends(A)) == [B, C]
+    assert graph.friends(D) == [B]
+    assert graph.friends(E) == []
+    offsets, targets = graph.csr()
+    assert list(offsets) == [0, 2, 4, 5, 6]
+    assert len(targets) == 6
+    assert graph.started[0] == 1589214487454
+
+
+@pytest.mark.asyncio
+async def test_priority_and_budget() -> None:
+    """Test the priority orders the crawl and the budget stops it."""
+    client = client_for(EDGES)
+    crawler = FriendCrawler(client, max_depth=3, max_nodes=3, concurrency=1, priority=lambda player, depth: -player.int)
+    graph = await crawler.crawl([A])
+    assert client.calls == [A, C, B]  # type: ignore[attr-defined]
+    assert graph.states.count(CRAWLED) == 3
+
+
+@pytest.mark.asyncio
+async def test_resume(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a crawl resumes from its checkpoint and retries failures."""
+    path = tmp_path / "graph.bin"
+    client = client_for(EDGES, failing={C})
+    crawler = FriendCrawler(client, max_nodes=3, checkpoint=path, checkpoint_every=1)
+    save = FriendGraph.save
+    threads = []
+
+    def record(graph: FriendGraph, path: pathlib.Path) -> None:
+        threads.append(threading.current_thread())
+        save(graph, path)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(FriendGraph, "save", record)
+        graph = await crawler.crawl([A])
+    # Checkpoints are written off the event loop.
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+    assert crawler.errors == 1
+    assert graph.states[graph.node(C)] == FAILED  # type: ignore[index]
+
+    client = client_for(EDGES)
+    resumed = FriendCrawler.resume(client, path, max_depth=4)
+    graph = await resumed.crawl()
+    assert sorted(client.calls) == [C, D, E]  # type: ignore[attr-defined]
+    assert len(graph) == 5
+    assert graph.edge_count == 4
+    assert FriendGraph.load(path).friends(E) == [D]
+
+
+@pytest.mark.asyncio
+async def test_failures_not_budgeted() -> None:
+    """Test failed fetches do not use up the budget of friend lists."""
+    client = client_for(EDGES, failing={B})
+    crawler = FriendCrawler(client, max_nodes=2, concurrency=1)
+    graph = await crawler.crawl([A])
+    assert client.calls == [A, B, C]  # type: ignore[attr-defined]
+    assert graph.states.count(CRAWLED) == 2
+    assert crawler.errors == 1
+
+
+def test_byteorder(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test checkpoints written on the other byte order are read."""
+    graph = FriendGraph()
+    first, _ = graph.add_node(A, 0)
+    second, _ = graph.add_node(B, 1)
+    graph.add_edge(first, second, 1589214487454)
+    for values in (graph.depths, graph.sources, graph.targets, graph.started):
+        values.byteswap()
+    with monkeypatch.context() as patch:
+        patch.setattr(sys, "byteorder", "big" if sys.byteorder == "little" else "little")
+        graph.save(tmp_path / "graph.bin")
+
+    loaded = FriendGraph.load(tmp_path / "graph.bin")
+    assert list(loaded.depths) == [0, 1]
+    assert list(loaded.started) == [1589214487454]
+    assert loaded.friends(B) == [A]
+
+
+@pytest.mark.asyncio
+async def test_new_seeds() -> None:
+    """Test seeds found by an earlier crawl are moved closer and not crawled twice."""
+    client = client_for(EDGES)
+    crawler = FriendCrawler(client, max_nodes=1, concurrency=1)
+    graph = await crawler.crawl([A])
+    assert graph.depths[graph.node(C)] == 1  # type: ignore[index]
+
+    crawler.max_nodes = 10
+    await crawler.crawl([C])
+    assert client.calls == [A, C, B]  # type: ignore[attr-defined]
+    assert graph.depths[graph.node(C)] == 0  # type: ignore[index]
+    assert graph.edge_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cancel(tmp_path: pathlib.Path) -> None:
+    """Test a cancelled crawl cancels its fetches and saves its checkpoint."""
+    client = Hypixel()
+    stalled = asyncio.Event()
+
+    async def player_friends(
+        player_uuid: uuid.UUID, wait_for_ratelimit: Optional[bool] = None
+    ) -> Optional[List[Friend]]:
+        await stalled.wait()
+        return None  # pragma: no cover
+
+    client.player_friends = player_friends  # type: ignore[method-assign]
+    task = asyncio.ensure_future(FriendCrawler(client, checkpoint=tmp_path / "graph.bin").crawl([A]))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert len(FriendGraph.load(tmp_path / "graph.bin")) == 1
@@ -0,0 +1,98 @@
+"""Test fetching the players of a guild."""
+import asyncio
+import uuid
+from typing import Any, Dict, Optional
+
+import pytest
+
+from asyncpixel import Hypixel
+from asyncpixel.exceptions import ApiNoSuccessError
+
+
+def guild(*members: uuid.UUID) -> Dict[str, Any]:
+    """Build a guild response."""
+    return {
+        "success": True,
+        "guild": {
+            "_id": "52e57a1c0cf2e250d1cd00f8",
+            "created": 1390770716373,
+            "name": "The Sloths",
+            "name_lower": "the sloths",
+            "exp": 2238673,
+            "members": [{"uuid": member.hex, "rank": "Member", "joined": 1390770716373} for member in members],
+            "achievements": {},
+        },
+    }
+
+
+def client_for(found: uuid.UUID, missing: uuid.UUID, failing: uuid.UUID, stalled: uuid.UUID) -> Hypixel:
+    """Build a client answering each member differently."""
+    client = Hypixel(api_key=uuid.uuid4())
+
+    async def get(path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Dict[str, Any]:
+        assert params is not None
+        if path == "guild" and params["id"] == "52e57a1c0cf2e250d1cd00f8":
+            return guild(found, missing, failing, stalled)
+        if path == "guild":
+            return {"success": True, "guild": None}
+        player_uuid = uuid.UUID(params["uuid"])
+        if player_uuid == failing:
+            raise ApiNoSuccessError(path)
+        if player_uuid == stalled:
+            await asyncio.Event().wait()
+        if player_uuid == missing:
+            return {"success": True, "player": None}
+        return {"success": True, "player": {"uuid": found.hex, "firstLogin": 1390770716373, "stats": {}}}
+
+    client._get = get  # type: ignore[method-assign]
+    return client
+
+
+@pytest.mark.asyncio
+async def test_guild_with_players() -> None:
+    """Test members are fetched until the deadline."""
+    found, missing, failing, stalled = (uuid.uuid4() for _ in range(4))
+    client = client_for(found, missing, failing, stalled)
+
+    data = await client.guild_with_players("52e57a1c0cf2e250d1cd00f8", timeout=0.05)
+    assert data is not None
+    assert data.guild.name == "The Sloths"
+    assert data.players[found] is not None
+    assert data.players[found].uuid == found
+    assert data.players[missing] is None
+    assert isinstance(data.errors[failing], ApiNoSuccessError)
+    assert data.pending == [stalled]
+    assert not data.complete
+
+    assert await client.guild_with_players("missing") is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_expand() -> None:
+    """Test guilds expand to their players."""
+    found, missing = uuid.uuid4(), uuid.uuid4()
+    client = client_for(found, missing, uuid.uuid4(), uuid.uuid4())
+    data = await client.guild_by_id("52e57a1c0cf2e250d1cd00f8")
+    assert data is not None
+    data.members = data.members[:2]
+
+    expanded = await data.expand(client)
+    assert expanded.guild is data
+    assert set(expanded.players) == {found, missing}
+    assert expanded.complete
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_expand_struct() -> None:
+    """Test guild structs expand to their players."""
+    structs = pytest.importorskip("asyncpixel.structs")
+    found = uuid.uuid4()
+    client = client_for(found, uuid.uuid4(), uuid.uuid4(), uuid.uuid4())
+    data = structs.convert(guild(found)["guild"], structs.Guild)
+
+    expanded = await data.expand(client)
+    assert expanded.guild is data
+    assert expanded.players[found] is not None
+    await client.close()
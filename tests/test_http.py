@@ -0,0 +1,180 @@
+"""Test http settings."""
+import asyncio
+import gc
+import threading
+import warnings
+from uuid import UUID
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel
+from asyncpixel.http import HttpConfig, LazySession
+from asyncpixel.mojang import PROFILES_URL
+
+
+@pytest.mark.asyncio
+async def test_session() -> None:
+    """Test sessions are built from the settings."""
+    config = HttpConfig(limit=5, limit_per_host=2, ttl_dns_cache=None, total_timeout=3, headers={"User-Agent": "test"})
+    session = config.session()
+    assert isinstance(session.connector, aiohttp.TCPConnector)
+    assert session.connector.limit == 5
+    assert session.connector.limit_per_host == 2
+    assert session.timeout.total == 3
+    assert session.headers["User-Agent"] == "test"
+    assert "Accept-Encoding" not in session.headers
+    await session.close()
+    assert session.connector is None
+
+
+@pytest.mark.asyncio
+async def test_connector() -> None:
+    """Test a connector passed in is shared and left open."""
+    connector = aiohttp.TCPConnector()
+    session = HttpConfig(compress=False, connector=connector).session()
+    assert session.connector is connector
+    assert session.headers["Accept-Encoding"] == "identity"
+    await session.close()
+    assert not connector.closed
+    await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_client_sessions() -> None:
+    """Test the client closes only the sessions it built."""
+    client = Hypixel(http=HttpConfig(limit=7))
+    session = client._session.session()
+    mojang_session = client._mojang_session.session()
+    assert session.connector is not None
+    assert session.connector.limit == 7
+    assert mojang_session.connector is not None
+    assert mojang_session.connector.limit == 10
+    await client.close()
+    assert session.closed
+    assert mojang_session.closed
+
+    session = aiohttp.ClientSession()
+    mojang_session = aiohttp.ClientSession()
+    client = Hypixel(session=session, mojang_session=mojang_session)
+    with aioresponses() as m:
+        m.post(
+            PROFILES_URL,
+            payload=[{"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"}],
+        )
+        assert await client.uuid_from_name("Technoblade") == UUID("b876ec32e396476ba1158438d83c67d4")
+    await client.close()
+    assert not session.closed
+    assert not mojang_session.closed
+    await session.close()
+    await mojang_session.close()
+
+
+def test_lazy_session() -> None:
+    """Test sessions are created on first use in the running loop."""
+    lazy = LazySession(HttpConfig())
+    assert lazy._session is None
+
+    async def use() -> aiohttp.ClientSession:
+        session = lazy.session()
+        assert lazy.session() is session
+        return session
+
+    first = asyncio.run(use())
+    second = asyncio.run(use())
+    assert second is not first
+
+    async def reopen() -> None:
+        session = lazy.session()
+        await lazy.close()
+        assert session.closed
+        assert lazy.session() is not session
+        await lazy.close()
+        await lazy.close()
+
+    asyncio.run(reopen())
+
+
+def test_client_across_loops() -> None:
+    """Test a client built outside a coroutine works in successive loops."""
+    client = Hypixel()
+
+    async def lookup() -> None:
+        with aioresponses() as m:
+            m.post(
+                PROFILES_URL,
+                payload=[{"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"}],
+            )
+            assert await client.uuid_from_name("Technoblade") == UUID("b876ec32e396476ba1158438d83c67d4")
+        await client.close()
+
+    asyncio.run(lookup())
+    asyncio.run(lookup())
+
+
+def test_client_reused_across_loops() -> None:
+    """Test sessions of finished loops are closed when the client moves on."""
+    client = Hypixel()
+    sessions = []
+    # Collect sessions leaked by other tests so only these are reported.
+    gc.collect()
+
+    async def lookup() -> None:
+        with aioresponses() as m:
+            m.post(
+                PROFILES_URL,
+                payload=[{"name": "Technoblade", "id": "b876ec32e396476ba1158438d83c67d4"}],
+            )
+            await client.uuid_from_name("Technoblade")
+        sessions.append(client._mojang_session.session())
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        asyncio.run(lookup())
+        asyncio.run(lookup())
+        assert sessions[0].closed
+        assert sessions[0].connector is None
+        asyncio.run(client.close())
+        sessions.clear()
+        gc.collect()
+    assert not [warning for warning in caught if "Unclosed" in str(warning.message)]
+
+
+@pytest.mark.asyncio
+async def test_discard_shared_connector() -> None:
+    """Test discarding a session leaves a connector it does not own open."""
+    connector = aiohttp.TCPConnector()
+    session = HttpConfig(connector=connector).session()
+    finished = asyncio.new_event_loop()
+    finished.close()
+    LazySession._discard(session, finished)
+    assert session.closed
+    assert not connector.closed
+    await connector.close()
+
+
+def test_discard_running_loop() -> None:
+    """Test sessions of a loop that still runs are closed in that loop."""
+    lazy = LazySession(HttpConfig())
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+
+    async def session() -> aiohttp.ClientSession:
+        return lazy.session()
+
+    async def switch() -> None:
+        lazy.session()
+        await lazy.close()
+
+    try:
+        first = asyncio.run_coroutine_threadsafe(session(), loop).result()
+        asyncio.run(switch())
+        for _ in range(10):
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), loop).result()
+        assert first.closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,162 @@
+"""Test mojang name resolution."""
+import asyncio
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from asyncpixel import Hypixel, utils
+from asyncpixel.exceptions import ApiNoSuccessError, RateLimitError
+from asyncpixel.http import HttpConfig, LazySession
+from asyncpixel.mojang import PROFILES_URL, NameResolver
+
+
+def profiles(*names: str) -> List[Dict[str, Any]]:
+    """Build the response for names with an account."""
+    return [{"id": uuid.uuid5(uuid.NAMESPACE_DNS, name.lower()).hex, "name": name} for name in names]
+
+
+def uuid_of(name: str) -> uuid.UUID:
+    """Uuid given to a name by profiles."""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, name.lower())
+
+
+@pytest.mark.asyncio
+async def test_resolve(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test names are resolved in chunks and cached."""
+    now = 0.0
+    monkeypatch.setattr(utils, "monotonic", lambda: now)
+    names = [f"player{index}" for index in range(12)]
+    resolver = NameResolver(LazySession(HttpConfig()), ttl=100, negative_ttl=10)
+    with aioresponses() as m:
+        m.post(PROFILES_URL, payload=profiles(*(name.upper() for name in names[:10])))
+        m.post(PROFILES_URL, payload=profiles(names[10]))
+
+        result = await resolver.resolve([*names, "PLAYER0", "not a name!", names[0]])
+        assert len(m.requests[("POST", URL(PROFILES_URL))]) == 2
+        assert result == {
+            **{name: uuid_of(name) for name in names[:11]},
+            names[11]: None,
+            "PLAYER0": uuid_of(names[0]),
+            "not a name!": None,
+        }
+        assert resolver.name(uuid_of(names[0])) == "PLAYER0"
+
+        now = 5
+        assert await resolver.resolve([names[0], names[11]]) == {names[0]: uuid_of(names[0]), names[11]: None}
+
+        m.post(PROFILES_URL, payload=profiles(names[11]))
+        now = 50
+        assert await resolver.resolve([names[11]]) == {names[11]: uuid_of(names[11])}
+        assert len(resolver) == 12
+    await resolver.session.close()
+
+
+def test_eviction() -> None:
+    """Test the least recently used names are evicted."""
+    resolver = NameResolver(LazySession(HttpConfig()), max_entries=2)
+    resolver.store("a", uuid_of("a"))
+    resolver.store("b", None)
+    assert resolver.cached("A") == (True, uuid_of("a"))
+    resolver.store("c", uuid_of("c"))
+    assert resolver.cached("b") == (False, None)
+    assert resolver.name(uuid_of("a")) == "a"
+    resolver.store("d", None)
+    assert resolver.cached("a") == (False, None)
+    assert resolver.name(uuid_of("a")) is None
+    assert len(resolver) == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce() -> None:
+    """Test concurrent lookups of a name share one request."""
+    resolver = NameResolver(LazySession(HttpConfig()))
+    with aioresponses() as m:
+        m.post(PROFILES_URL, payload=profiles("Technoblade"))
+        m.post(PROFILES_URL, payload=[])
+        first, second = await asyncio.gather(
+            resolver.resolve(["Technoblade"]), resolver.resolve(["technoblade", "Dream"])
+        )
+        bodies = [call.kwargs["json"] for call in m.requests[("POST", URL(PROFILES_URL))]]
+        assert bodies == [["Technoblade"], ["Dream"]]
+        assert first == {"Technoblade": uuid_of("Technoblade")}
+        assert second == {"technoblade": uuid_of("Technoblade"), "Dream": None}
+    await resolver.session.close()
+
+
+@pytest.mark.asyncio
+async def test_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ratelimited requests are retried and errors raised."""
+    delays = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    resolver = NameResolver(LazySession(HttpConfig()), retries=2)
+    with aioresponses() as m:
+        m.post(PROFILES_URL, status=429, headers={"Retry-After": "5"})
+        m.post(PROFILES_URL, payload=profiles("Technoblade"))
+        assert await resolver.resolve(["Technoblade"]) == {"Technoblade": uuid_of("Technoblade")}
+        assert delays == [5]
+
+        m.post(PROFILES_URL, status=429)
+        m.post(PROFILES_URL, status=429)
+        with pytest.raises(RateLimitError):
+            await resolver.resolve(["Dream"])
+        assert delays == [5, 1]
+
+        m.post(PROFILES_URL, status=400)
+        with pytest.raises(ApiNoSuccessError):
+            await resolver.resolve(["Dream"])
+        assert resolver.cached("Dream") == (False, None)
+    await resolver.session.close()
+
+
+@pytest.mark.asyncio
+async def test_client() -> None:
+    """Test the client resolves names through its resolver."""
+    client = Hypixel()
+    with aioresponses() as m:
+        m.post(PROFILES_URL, payload=profiles("Technoblade"))
+        assert await client.uuids_from_names(["technoblade"]) == {"technoblade": uuid_of("Technoblade")}
+        assert await client.uuid_from_name("Technoblade") == uuid_of("Technoblade")
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancel() -> None:
+    """Test cancelling one caller does not cancel a lookup shared with another."""
+    resolver = NameResolver(LazySession(HttpConfig()))
+    release = asyncio.Event()
+
+    async def stall(*args: Any, **kwargs: Any) -> None:
+        await release.wait()
+
+    with aioresponses() as m:
+        m.post(PROFILES_URL, callback=stall, payload=profiles("Technoblade"), repeat=True)
+        cancelled = asyncio.ensure_future(resolver.resolve(["Technoblade"]))
+        waiting = asyncio.ensure_future(resolver.resolve(["technoblade"]))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert "technoblade" in resolver._inflight
+
+        release.set()
+        assert await waiting == {"technoblade": uuid_of("Technoblade")}
+        assert not resolver._inflight
+        assert not resolver._lookups
+        assert len(m.requests[("POST", URL(PROFILES_URL))]) == 1
+
+        release.clear()
+        waiting = asyncio.ensure_future(resolver.resolve(["Dream"]))
+        await asyncio.sleep(0.01)
+        for lookup in resolver._lookups:
+            lookup.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert not resolver._inflight
+    await resolver.session.close()
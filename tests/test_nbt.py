@@ -0,0 +1,143 @@
+"""Test nbt."""
+import base64
+import gzip
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from asyncpixel import nbt
+from asyncpixel.models import AuctionEndedItem, AuctionItem
+from asyncpixel.nbt import decode_item_bytes, decode_items, decode_nbt
+from tests.utils import auction_item
+
+
+def named(tag: int, name: str, payload: bytes) -> bytes:
+    """Encode a named tag."""
+    return struct.pack(">b", tag) + string(name) + payload
+
+
+def string(value: str) -> bytes:
+    """Encode a string payload."""
+    encoded = value.encode()
+    return struct.pack(">H", len(encoded)) + encoded
+
+
+DOCUMENT = named(
+    10,
+    "",
+    named(
+        9,
+        "i",
+        struct.pack(">bi", 10, 1)
+        + named(1, "Count", struct.pack(">b", 1))
+        + named(2, "Damage", struct.pack(">h", 3))
+        + named(3, "id", struct.pack(">i", 276))
+        + named(4, "uuid", struct.pack(">q", 2**40))
+        + named(5, "float", struct.pack(">f", 0.5))
+        + named(6, "double", struct.pack(">d", 0.25))
+        + named(7, "bytes", struct.pack(">i", 2) + b"ab")
+        + named(8, "Name", string("§6Hyperion"))
+        + named(11, "ints", struct.pack(">iii", 2, 1, 2))
+        + named(12, "longs", struct.pack(">iq", 1, 3))
+        + b"\x00",
+    )
+    + b"\x00",
+)
+ENCODED = base64.b64encode(gzip.compress(DOCUMENT)).decode()
+DECODED = {
+    "i": [
+        {
+            "Count": 1,
+            "Damage": 3,
+            "id": 276,
+            "uuid": 2**40,
+            "float": 0.5,
+            "double": 0.25,
+            "bytes": b"ab",
+            "Name": "§6Hyperion",
+            "ints": [1, 2],
+            "longs": [3],
+        }
+    ]
+}
+
+
+def test_decode_nbt() -> None:
+    """Test every tag type is decoded."""
+    assert decode_nbt(DOCUMENT) == DECODED
+    with pytest.raises(ValueError, match="compound"):
+        decode_nbt(b"\x08")
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_nbt(DOCUMENT[:20])
+    with pytest.raises(ValueError, match="Unknown"):
+        decode_nbt(named(10, "", named(13, "x", b"")))
+
+
+def test_decode_item_bytes() -> None:
+    """Test item bytes are decoded in both formats."""
+    assert decode_item_bytes(ENCODED) == DECODED
+    assert decode_item_bytes({"type": 0, "data": ENCODED}) == DECODED
+
+
+def test_lazy_nbt() -> None:
+    """Test the nbt of an auction is decoded on access."""
+    auction = AuctionItem.model_validate(auction_item(item_bytes=ENCODED))
+    assert "nbt" not in auction.__dict__
+    assert auction.nbt == DECODED
+    assert auction.nbt is auction.nbt
+
+
+def test_equality_ignores_nbt() -> None:
+    """Test decoding the nbt of an auction does not change its equality."""
+    data = auction_item(item_bytes=ENCODED)
+    first, second = AuctionItem.model_validate(data), AuctionItem.model_validate(data)
+    assert first.nbt == DECODED
+    assert first == second
+    assert first != data
+    assert first != first.model_copy(update={"highest_bid_amount": 1})
+
+    ended = AuctionEndedItem.model_validate(
+        {
+            "auction_id": first.uuid,
+            "seller": first.uuid,
+            "seller_profile": first.uuid,
+            "buyer": first.uuid,
+            "timestamp": first.end,
+            "item_bytes": ENCODED,
+            "price": 1,
+        }
+    )
+    assert ended.nbt == DECODED
+    assert ended == ended.model_copy(deep=True)
+    assert ended != first
+
+
+@pytest.mark.asyncio
+async def test_decode_items() -> None:
+    """Test bulk decoding caches the result on each item."""
+    auctions = [AuctionItem.model_validate(auction_item(item_bytes=ENCODED)) for _ in range(5)]
+    ended = AuctionEndedItem(
+        auction_id=auctions[0].uuid,
+        seller=auctions[0].uuid,
+        seller_profile=auctions[0].uuid,
+        buyer=auctions[0].uuid,
+        timestamp=auctions[0].end,
+        item_bytes=ENCODED,
+        price=1,
+    )
+    assert ended.nbt == DECODED
+    with ThreadPoolExecutor() as executor:
+        await decode_items([*auctions, ended], executor=executor, chunksize=2)
+    assert all(auction.__dict__["nbt"] == DECODED for auction in auctions)
+    await decode_items(auctions)
+
+    fresh = AuctionItem.model_validate(auction_item(item_bytes=ENCODED))
+    await decode_items([fresh])
+    assert fresh.__dict__["nbt"] == DECODED
+    pool = nbt._pool
+    assert pool is not None
+
+    fresh = AuctionItem.model_validate(auction_item(item_bytes=ENCODED))
+    await decode_items([fresh])
+    assert nbt._pool is pool
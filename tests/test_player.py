@@ -5,9 +5,11 @@ from typing import AsyncGenerator
 
 import pytest
 from aioresponses import aioresponses
+from pydantic import ValidationError
 
 from asyncpixel import Hypixel
 from asyncpixel.constants import GameType
+from asyncpixel.models import Player
 from asyncpixel.models.players.bedwars import bedwars_level_from_exp
 from asyncpixel.models.utils import safe_divide
 from asyncpixel.utils import calc_player_level, validate_game_type
@@ -1694,6 +1696,74 @@ async def test_player_none(hypixel_client: AsyncGenerator[Hypixel, None], key: u
         assert data is None
 
 
+@pytest.mark.asyncio
+async def test_player_lazy_stats(key: uuid.UUID) -> None:
+    """Test game stats are only validated when accessed."""
+    stats = {
+        "Bedwars": {"Experience": 65262, "wins_bedwars": 79, "losses_bedwars": 321},
+        "SkyWars": {"kills": 0, "deaths": 2},
+        "SkyBlock": {"profiles": {}},
+    }
+    player = {"uuid": "405dcf08b80f4e23b97d943ad93d14fd", "firstLogin": 1441360709245, "stats": stats}
+    with aioresponses() as m:
+        m.get(
+            f"https://api.hypixel.net/player?key={key!s}" + "&uuid=405dcf08-b80f-4e23-b97d-943ad93d14fd",
+            status=200,
+            payload={"success": True, "player": player},
+        )
+        client = Hypixel(api_key=key, lazy_stats=True, player_raw="none")
+        data = await client.player("405dcf08-b80f-4e23-b97d-943ad93d14fd")
+        await client.close()
+
+    assert data is not None
+    assert data.raw == {}
+    assert data.stats.__dict__ == {}
+    assert data.stats.bedwars is not None
+    assert data.stats.bedwars.level == 15.6524
+    assert list(data.stats.__dict__) == ["bedwars"]
+    assert data.stats.arcade is None
+    assert data.stats.model_fields_set == {"bedwars"}
+
+    eager = Player.model_validate(player)
+    assert data.stats == eager.stats
+    assert data.stats != {}
+    assert data.stats.skywars is not None
+    assert data.stats.model_dump() == eager.stats.model_dump()
+    assert data.stats.model_fields_set == eager.stats.model_fields_set
+    with pytest.raises(AttributeError):
+        data.stats.missing  # noqa: B018
+
+
+def test_player_raw() -> None:
+    """Test the raw data of a player is kept as configured."""
+    player = {
+        "uuid": "405dcf08b80f4e23b97d943ad93d14fd",
+        "firstLogin": 1441360709245,
+        "networkExp": 1000,
+        "newPackageRank": "MVP_PLUS",
+        "stats": {},
+    }
+    data = Player.model_validate(player)
+    assert data.raw is player
+    assert data.rank == "MVP+"
+    assert data.level == calc_player_level(1000)
+    assert {"rank", "level"} <= data.model_fields_set
+    assert "raw" not in data.model_dump()
+    assert "rank" not in player
+
+    compact = Player.model_validate(player, context={"raw": "json"})
+    assert isinstance(compact._raw, bytes)
+    assert compact.raw == player
+    assert compact.rank == "MVP+"
+
+    assert Player.model_validate(player, context={"raw": "none"}).raw == {}
+    with pytest.raises(ValidationError, match="Unknown raw mode"):
+        Player.model_validate(player, context={"raw": "weak"})
+    with pytest.raises(ValueError, match="Unknown raw mode 'weak'"):
+        Hypixel(player_raw="weak")
+    assert Player.model_validate(data) is data
+
+
 def test_bedwars_level_calculation() -> None:
     """Test the bedwars level calculator against known values."""
     bw_star_data = [
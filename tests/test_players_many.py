@@ -0,0 +1,123 @@
+"""Test bulk player fetching."""
+import asyncio
+import datetime
+import uuid
+from typing import Any, Dict, Optional
+
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel
+from asyncpixel.cache import MemoryCache
+from asyncpixel.exceptions import ApiNoSuccessError, RateLimitError
+
+URL = "https://api.hypixel.net/player?key={}&uuid={}"
+
+
+def player(player_uuid: uuid.UUID) -> Dict[str, Any]:
+    """Build the response for a player."""
+    return {"success": True, "player": {"uuid": player_uuid.hex, "firstLogin": 1390770716373, "stats": {}}}
+
+
+@pytest.mark.asyncio
+async def test_players_many() -> None:
+    """Test each unique player gets one outcome."""
+    key = uuid.uuid4()
+    found, missing, failing = (uuid.uuid4() for _ in range(3))
+    with aioresponses() as m:
+        m.get(URL.format(key, found), payload=player(found))
+        m.get(URL.format(key, missing), payload={"success": True, "player": None})
+        m.get(URL.format(key, failing), status=500)
+        client = Hypixel(api_key=key)
+
+        results = {
+            result.uuid: result
+            async for result in client.players_many([found, found.hex, str(missing), failing, str(found)])
+        }
+
+        assert set(results) == {found, missing, failing}
+        assert results[found].ok
+        assert results[found].player is not None
+        assert results[found].player.uuid == found
+        assert results[missing].ok
+        assert results[missing].player is None
+        assert not results[failing].ok
+        assert isinstance(results[failing].error, ApiNoSuccessError)
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_players_many_cache() -> None:
+    """Test cached players are served without a request."""
+    key = uuid.uuid4()
+    cached = uuid.uuid4()
+    cache = MemoryCache()
+    await cache.set("player", {"uuid": str(cached)}, player(cached), 100)
+    with aioresponses():
+        client = Hypixel(api_key=key, cache=cache)
+        results = [result async for result in client.players_many([cached])]
+        assert results[0].player is not None
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_players_many_concurrency() -> None:
+    """Test no more than concurrency players are fetched at once."""
+    client = Hypixel(api_key=uuid.uuid4())
+    running = peak = 0
+
+    async def get(path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        assert params is not None
+        return player(uuid.UUID(params["uuid"]))
+
+    client._get = get  # type: ignore[method-assign]
+    uuids = [uuid.uuid4() for _ in range(20)]
+    results = [result async for result in client.players_many(iter(uuids), concurrency=3)]
+    assert {result.uuid for result in results} == set(uuids)
+    assert peak == 3
+
+    with pytest.raises(ValueError):
+        async for _ in client.players_many(["not a uuid"]):
+            pass  # pragma: no cover
+
+    async def stalled(path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Dict[str, Any]:
+        assert params is not None
+        if params["uuid"] != str(uuids[0]):
+            await asyncio.Event().wait()
+        return player(uuids[0])
+
+    client._get = stalled  # type: ignore[method-assign]
+    results = client.players_many(uuids, concurrency=3)
+    assert (await results.__anext__()).uuid == uuids[0]
+    await results.aclose()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_players_many_wait_not_shared() -> None:
+    """Test a waiting and a non waiting fetch of a player are not coalesced."""
+    key = uuid.uuid4()
+    target = uuid.uuid4()
+    with aioresponses() as m:
+        m.get(URL.format(key, target), payload=player(target), repeat=True)
+        client = Hypixel(api_key=key)
+        limiter = client._keys.limiters[0]
+        limiter.limit = 120
+        limiter.remaining = 0
+        limiter.reset = datetime.datetime.now() + datetime.timedelta(seconds=0.1)
+
+        waiting = asyncio.ensure_future(client.players_many([target]).__anext__())
+        await asyncio.sleep(0)
+        raising = [result async for result in client.players_many([target], wait_for_ratelimit=False)]
+        assert isinstance(raising[0].error, RateLimitError)
+
+        result = await waiting
+        assert result.ok
+        assert result.player is not None
+        assert sum(len(calls) for calls in m.requests.values()) == 1
+        await client.close()
@@ -0,0 +1,268 @@
+"""Test ratelimit."""
+import asyncio
+import datetime
+import re
+import sys
+import uuid
+from typing import Any, Dict, List
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel, ratelimit
+from asyncpixel.exceptions import ApiNoSuccessError, InvalidApiKeyError, RateLimitError
+from asyncpixel.ratelimit import KeyPool, RateLimiter
+from tests.utils import generate_key
+
+_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Clock that moves forward when slept on."""
+
+    def __init__(self) -> None:
+        """Start the clock at a fixed time."""
+        self.time = datetime.datetime(2023, 1, 1)
+        self.sleeps: List[float] = []
+
+    def now(self) -> datetime.datetime:
+        """Current fake time."""
+        return self.time
+
+    async def sleep(self, delay: float, *args: Any) -> None:
+        """Advance the clock instead of sleeping."""
+        if delay > 0:
+            self.sleeps.append(delay)
+            self.time += datetime.timedelta(seconds=delay)
+        await _sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch the ratelimit module with a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "_now", fake.now)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def headers(remaining: int, reset: int = 10, limit: int = 10) -> Dict[str, str]:
+    """Build ratelimit headers."""
+    return {"RateLimit-Limit": str(limit), "RateLimit-Remaining": str(remaining), "RateLimit-Reset": str(reset)}
+
+
+@pytest.mark.asyncio
+async def test_update(clock: FakeClock) -> None:
+    """Test state is learnt from headers."""
+    limiter = RateLimiter()
+    limiter.update({})
+    assert limiter.remaining == -1
+
+    limiter.update(headers(0))
+    assert limiter.limit == 10
+    assert limiter.remaining == 0
+    assert limiter.reset == clock.time + datetime.timedelta(seconds=10)
+    with pytest.raises(RateLimitError):
+        limiter.check()
+
+    limiter.update(headers(5, limit=20))
+    assert limiter.limit == 10
+    limiter.check()
+
+
+@pytest.mark.asyncio
+async def test_acquire_spreads_requests(clock: FakeClock) -> None:
+    """Test requests are spaced out across the window."""
+    limiter = RateLimiter()
+    limiter.update(headers(10))
+    start = clock.time
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release()
+    assert limiter.remaining == 7
+    assert clock.time - start == datetime.timedelta(seconds=2)
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_reset(clock: FakeClock) -> None:
+    """Test an exhausted budget waits for the window to reset."""
+    limiter = RateLimiter()
+    limiter.update(headers(0, reset=5))
+    await limiter.acquire()
+    limiter.release()
+    assert clock.sleeps == [5]
+    assert limiter.remaining == 9
+
+
+@pytest.mark.asyncio
+async def test_acquire_retry_after(clock: FakeClock) -> None:
+    """Test a throttled key waits for retry after."""
+    limiter = RateLimiter()
+    retry_after = limiter.throttle(3)
+    assert limiter.remaining == -1
+    with pytest.raises(RateLimitError):
+        limiter.check()
+    await limiter.acquire()
+    limiter.release()
+    assert clock.time == retry_after
+
+
+@pytest.mark.asyncio
+async def test_acquire_single_probe(clock: FakeClock) -> None:
+    """Test only one request is sent until the budget is known."""
+    limiter = RateLimiter()
+    await limiter.acquire()
+    second = asyncio.ensure_future(limiter.acquire())
+    await _sleep(0)
+    assert not second.done()
+    limiter.update(headers(10))
+    limiter.release()
+    await second
+    limiter.release()
+    assert limiter.remaining == 9
+
+
+@pytest.mark.asyncio
+async def test_client_waits(clock: FakeClock) -> None:
+    """Test client waits instead of raising when the key is exhausted."""
+    key = generate_key()
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/test?key={key!s}", status=200, headers=headers(0, reset=8), payload={})
+        m.get(f"https://api.hypixel.net/test?key={key!s}", status=429, headers={"Retry-After": "2"}, payload={})
+        m.get(f"https://api.hypixel.net/test?key={key!s}", status=200, headers=headers(9), payload={"a": 1})
+        client = Hypixel(api_key=str(key), wait_for_ratelimit=True)
+        await client._get("test")
+        assert await client._get("test") == {"a": 1}
+        assert clock.sleeps == [8, 2]
+        assert client.retry_after == clock.time
+        assert client.requests_remaining == 9
+        assert client._ratelimit_reset == clock.time + datetime.timedelta(seconds=10)
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_keyless_waits(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test keyless requests wait out a throttle and error responses are released."""
+    released = []
+    release = aiohttp.ClientResponse.release
+
+    def record(response: aiohttp.ClientResponse) -> Any:
+        released.append(response.status)
+        return release(response)
+
+    monkeypatch.setattr(aiohttp.ClientResponse, "release", record)
+    with aioresponses() as m:
+        m.get("https://api.hypixel.net/test", status=429, headers={"Retry-After": "3"}, payload={})
+        m.get("https://api.hypixel.net/test", status=500, payload={})
+        m.get("https://api.hypixel.net/test", status=200, payload={"a": 1})
+        client = Hypixel(wait_for_ratelimit=True)
+        with pytest.raises(ApiNoSuccessError):
+            await client._get("test", key_required=False)
+        assert released == [429, 500]
+        assert clock.sleeps == [3]
+        assert await client._get("test", key_required=False) == {"a": 1}
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_key_pool_routing(clock: FakeClock) -> None:
+    """Test requests go to the key with the most headroom."""
+    first, second = generate_key(), generate_key()
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/test?key={first!s}", status=200, headers=headers(1), payload={})
+        m.get(f"https://api.hypixel.net/test?key={second!s}", status=200, headers=headers(5), payload={})
+        m.get(f"https://api.hypixel.net/test?key={second!s}", status=200, headers=headers(4), payload={})
+        client = Hypixel(api_key=[first, str(second)])
+        assert client.api_key == first
+        assert client.api_keys == [first, second]
+        assert client.requests_remaining == -1
+        for _ in range(3):
+            await client._get("test")
+        assert client.total_requests == 20
+        assert client.requests_remaining == 5
+        assert client.retry_after == ratelimit.EPOCH
+        assert client._ratelimit_reset == clock.time + datetime.timedelta(seconds=10)
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_key_pool_drops_invalid_key() -> None:
+    """Test a key rejected by hypixel is dropped from the pool."""
+    first, second = generate_key(), generate_key()
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/test?key={first!s}", status=403, payload={})
+        m.get(f"https://api.hypixel.net/test?key={second!s}", status=200, payload={"a": 1})
+        m.get(f"https://api.hypixel.net/test?key={second!s}", status=403, payload={}, repeat=True)
+        m.get("https://api.hypixel.net/test", status=403, payload={})
+        client = Hypixel(api_key=[first, second])
+        assert await client._get("test") == {"a": 1}
+        assert client.api_keys == [second]
+        for _ in range(2):
+            # The last key is kept so every call reports it as invalid.
+            with pytest.raises(InvalidApiKeyError):
+                await client._get("test")
+        assert client.api_key == second
+        with pytest.raises(InvalidApiKeyError):
+            await client._get("test", key_required=False)
+        client.api_key = first
+        assert client.api_keys == [first]
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_key_pool_waits_for_any_key(clock: FakeClock) -> None:
+    """Test a waiting request takes whichever drained key has budget first."""
+    first, second = generate_key(), generate_key()
+    client = Hypixel(api_key=[first, second], wait_for_ratelimit=True)
+    first_limiter, second_limiter = client._keys.limiters
+    first_limiter.update(headers(0, reset=30))
+    second_limiter.update(headers(0, reset=5))
+    with aioresponses() as m:
+        m.get(f"https://api.hypixel.net/test?key={second!s}", status=200, headers=headers(9), payload={"a": 1})
+        assert await client._get("test") == {"a": 1}
+    assert clock.sleeps[0] == 5
+    assert first_limiter.remaining == 0
+    await client.close()
+
+    # Keys busy with requests in flight are left to the limiter to wait on.
+    pool = KeyPool([first, second])
+    for limiter in pool.limiters:
+        limiter.limit, limiter._pending = 1, 1
+    assert await pool.acquire() == (first, pool.limiters[0])
+    assert clock.sleeps == [5]
+
+
+@pytest.mark.asyncio
+async def test_key_pool_spreads_burst(clock: FakeClock) -> None:
+    """Test a burst of waiting requests is split across the keys."""
+    first, second = generate_key(), generate_key()
+    with aioresponses() as m:
+        m.get(
+            re.compile(r"https://api\.hypixel\.net/test\?.*"),
+            status=200,
+            headers=headers(299, reset=300, limit=300),
+            payload={},
+            repeat=True,
+        )
+        client = Hypixel(api_key=[first, second], wait_for_ratelimit=True)
+        await asyncio.gather(*(client._get("test", {"page": page}) for page in range(40)))
+        counts = {key: 0 for key in (first, second)}
+        for _, url in m.requests:
+            counts[uuid.UUID(url.query["key"])] += 1
+        assert sum(counts.values()) == 40
+        assert abs(counts[first] - counts[second]) <= 4
+        assert clock.time - datetime.datetime(2023, 1, 1) < datetime.timedelta(seconds=25)
+        await client.close()
+
+
+def test_headroom(clock: FakeClock) -> None:
+    """Test headroom of a key."""
+    limiter = RateLimiter()
+    assert limiter.headroom == sys.maxsize
+    limiter.update(headers(3))
+    assert limiter.headroom == 3
+    clock.time += datetime.timedelta(seconds=11)
+    assert limiter.headroom == 10
+    limiter.throttle(5)
+    assert limiter.headroom == -1
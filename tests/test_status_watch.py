@@ -0,0 +1,155 @@
+"""Test watching the status of players."""
+import asyncio
+import uuid
+from typing import Dict, List, Optional
+
+import pytest
+
+from asyncpixel import Hypixel, utils
+from asyncpixel.constants import GameType
+from asyncpixel.exceptions import ApiNoSuccessError
+from asyncpixel.models import Status
+from asyncpixel.status_watch import StatusWatcher
+
+ONLINE = Status(online=True)
+OFFLINE = Status(online=False)
+SKYWARS = Status.model_construct(online=True, game_type=GameType.model_construct(id=51), mode="ranked_normal")
+
+
+def client_for(statuses: Dict[uuid.UUID, List[Optional[Status]]]) -> Hypixel:
+    """Build a client answering each poll of a player with their next status."""
+    client = Hypixel()
+    client.calls = []  # type: ignore[attr-defined]
+
+    async def player_status(player_uuid: uuid.UUID) -> Optional[Status]:
+        client.calls.append(player_uuid)  # type: ignore[attr-defined]
+        answers = statuses[player_uuid]
+        status = answers.pop(0) if len(answers) > 1 else answers[0]
+        if status is None:
+            raise ApiNoSuccessError("status")
+        return status
+
+    client.player_status = player_status  # type: ignore[method-assign]
+    return client
+
+
+def test_observe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test transitions are reported and dormant players backed off."""
+    monkeypatch.setattr(utils, "monotonic", lambda: 0.0)
+    player = uuid.uuid4()
+    watcher = StatusWatcher(Hypixel(), [str(player)], min_interval=10, max_interval=35)
+    assert len(watcher) == 1
+
+    assert watcher.observe(player, None) is None
+    assert watcher.interval(str(player)) == 10
+    assert watcher.observe(player, OFFLINE) is None
+    assert watcher.observe(player, OFFLINE) is None
+    assert watcher.interval(player) == 35
+
+    change = watcher.observe(player, ONLINE)
+    assert change is not None
+    assert change.uuid == player
+    assert change.previous == OFFLINE
+    assert change.current == ONLINE
+    assert watcher.interval(player) == 10
+    assert watcher.observe(player, Status(online=True, mode="LOBBY")) is None
+
+    change = watcher.observe(player, SKYWARS)
+    assert change is not None
+    assert change.current is SKYWARS
+    assert watcher.observe(player, OFFLINE) is not None
+    assert watcher.interval(player) == 10
+
+    watcher.remove([player])
+    assert watcher.interval(player) is None
+    assert player not in watcher.statuses
+
+
+def test_spacing() -> None:
+    """Test requests are spaced to the share of the ratelimit."""
+    client = Hypixel(api_key=uuid.uuid4())
+    watcher = StatusWatcher(client, share=0.5)
+    assert watcher._spacing() == 0
+    client._keys.limiters[0].limit = 300
+    assert watcher._spacing() == 2
+
+
+@pytest.mark.asyncio
+async def test_watch() -> None:
+    """Test active players are polled more often and changes are yielded."""
+    active, dormant, failing, dropped = (uuid.uuid4() for _ in range(4))
+    client = client_for(
+        {
+            active: [OFFLINE, ONLINE, ONLINE, SKYWARS, OFFLINE],
+            dormant: [OFFLINE],
+            failing: [None],
+            dropped: [OFFLINE],
+        }
+    )
+    watcher = StatusWatcher(client, [active, dormant, failing], min_interval=0.01, max_interval=0.08, concurrency=2)
+    watcher.add([active])
+
+    changes = []
+    events = watcher.watch()
+    async for change in events:
+        changes.append(change)
+        if len(changes) == 1:
+            watcher.add([dropped])
+            watcher.remove([dropped])
+        if len(changes) == 3:
+            break
+    await events.aclose()
+
+    assert [(change.uuid, change.current) for change in changes] == [
+        (active, ONLINE),
+        (active, SKYWARS),
+        (active, OFFLINE),
+    ]
+    calls: List[uuid.UUID] = client.calls  # type: ignore[attr-defined]
+    assert calls.count(active) == 5
+    assert calls.count(dormant) < calls.count(active)
+    assert dropped not in calls
+    assert 0 < watcher.errors <= calls.count(failing)
+    assert failing not in watcher.statuses
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_watch_updates() -> None:
+    """Test players added and removed while polled, an empty watchlist and closing."""
+    player = uuid.uuid4()
+    polls: "asyncio.Queue[asyncio.Future[Optional[Status]]]" = asyncio.Queue()
+    client = Hypixel()
+
+    async def player_status(player_uuid: uuid.UUID) -> Optional[Status]:
+        poll = asyncio.get_running_loop().create_future()
+        polls.put_nowait(poll)
+        return await poll
+
+    client.player_status = player_status  # type: ignore[method-assign]
+    watcher = StatusWatcher(client, min_interval=0.01, concurrency=1)
+    events = watcher.watch()
+    task = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0.02)
+    watcher.add([player])
+    poll = await polls.get()
+    watcher.remove([player])
+    watcher.add([player])
+    poll.set_result(ONLINE)
+
+    poll = await polls.get()
+    assert watcher.statuses == {}
+    watcher.remove([player])
+    poll.set_result(ONLINE)
+    await asyncio.sleep(0.02)
+    assert watcher.statuses == {}
+    assert polls.empty()
+
+    watcher.add([player])
+    poll = await polls.get()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert poll.cancelled()
+    await client.close()
@@ -0,0 +1,71 @@
+"""Test streaming auctions."""
+import json
+import uuid
+
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel
+from asyncpixel.exceptions import ApiNoSuccessError
+from asyncpixel.models import AuctionItem
+from asyncpixel.streaming import ArrayItems
+from tests.utils import auction_item, auction_page
+
+
+@pytest.mark.parametrize("size", [1, 7, 1 << 16])
+def test_array_items(size: int) -> None:
+    """Test items are parsed whichever way the bytes are split."""
+    page = {**auction_page(0, 2, [auction_item(bids=2), auction_item(item_name="Hyperion ✪")]), "extra": [1.5, None]}
+    body = json.dumps(page, indent=1, ensure_ascii=False).encode()
+    parser = ArrayItems("auctions")
+    items = []
+    for start in range(0, len(body), size):
+        items += parser.feed(body[start : start + size])
+    items += parser.feed(b"", final=True)
+
+    assert items == page["auctions"]
+    assert parser.fields == {key: value for key, value in page.items() if key != "auctions"}
+
+
+def test_array_items_empty() -> None:
+    """Test empty objects and arrays, and keys that are not arrays."""
+    assert ArrayItems("auctions").feed(b"{ }", final=True) == []
+    parser = ArrayItems("auctions")
+    assert parser.feed(b'{"auctions": [], "page": 3}', final=True) == []
+    assert parser.fields == {"page": 3}
+    parser = ArrayItems("auctions")
+    assert parser.feed(b'{"auctions": null}', final=True) == []
+    assert parser.fields == {"auctions": None}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"page": 1', b'{"auctions": [1 2]}', b"[]", b"{}x", b'{"page": tru}', b'{"page" 1}'],
+)
+def test_array_items_malformed(body: bytes) -> None:
+    """Test malformed json is rejected."""
+    parser = ArrayItems("auctions")
+    with pytest.raises(ValueError):
+        parser.feed(body, final=True)
+
+
+@pytest.mark.asyncio
+async def test_auctions_stream() -> None:
+    """Test auctions are streamed in order."""
+    auction_ids = [uuid.uuid4() for _ in range(3)]
+    with aioresponses() as m:
+        m.get(
+            "https://api.hypixel.net/skyblock/auctions?page=2",
+            payload=auction_page(2, 3, [auction_item(auction_id) for auction_id in auction_ids]),
+        )
+        m.get("https://api.hypixel.net/skyblock/auctions?page=3", status=404)
+        client = Hypixel()
+
+        items = [item async for item in client.auctions_stream(2)]
+        assert all(isinstance(item, AuctionItem) for item in items)
+        assert [item.uuid for item in items] == auction_ids
+
+        with pytest.raises(ApiNoSuccessError):
+            async for _ in client.auctions_stream(3):
+                pass  # pragma: no cover
+        await client.close()
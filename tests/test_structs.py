@@ -0,0 +1,173 @@
+"""Test msgspec structs."""
+import datetime
+import json
+import uuid
+
+import pytest
+from aioresponses import aioresponses
+
+from asyncpixel import Hypixel
+from asyncpixel.auction_sync import AuctionSync
+from tests.test_nbt import DECODED, ENCODED
+from tests.utils import auction_item, auction_page
+
+structs = pytest.importorskip("asyncpixel.structs")
+
+UTC = datetime.timezone.utc
+GUILD = {
+    "_id": "52e57a1c0cf2e250d1cd00f8",
+    "created": 1390770716373,
+    "name": "The Sloths",
+    "name_lower": "the sloths",
+    "tagColor": "DARK_AQUA",
+    "exp": 2238673,
+    "members": [
+        {
+            "uuid": "f7c77d999f154a66a87dc4a51ef30d19",
+            "rank": "GUILDMASTER",
+            "joined": 1390770716373,
+            "expHistory": {"2020-05-25": 108},
+        }
+    ],
+    "achievements": {"WINNERS": 2},
+    "ranks": [{"name": "Member", "default": True, "created": 1, "priority": 1}],
+    "chatMute": 1590703490783,
+}
+
+
+def test_decode() -> None:
+    """Test structs decode from json bytes with the attributes of the models."""
+    page = auction_page(0, 2, [auction_item(bids=1, item_bytes=ENCODED)], last_updated=1571065561345)
+    data = structs.decode(json.dumps(page).encode(), structs.Auction)
+
+    assert data.total_pages == 2
+    assert data.last_updated == datetime.datetime.fromtimestamp(1571065561.345, tz=UTC)
+    item = data.auctions[0]
+    assert isinstance(item, structs.AuctionItem)
+    assert item.end == datetime.datetime.fromtimestamp(1571071181.232, tz=UTC)
+    assert item.bids[0].amount == 256
+    assert item.nbt == DECODED
+    assert not item.active()
+    assert item.lowest_possible_bid() == 294
+    assert structs.convert({**auction_item(starting_bid=2)}, structs.AuctionItem).lowest_possible_bid() == 3
+
+
+@pytest.mark.parametrize(
+    "value",
+    [1390770716, 1390770716000, "2014-01-26T21:11:56Z"],
+)
+def test_timestamp(value: object) -> None:
+    """Test timestamps are read from seconds, milliseconds and iso strings."""
+    timestamp = structs.convert(value, structs.Timestamp)
+    assert isinstance(timestamp, structs.Timestamp)
+    assert timestamp == datetime.datetime(2014, 1, 26, 21, 11, 56, tzinfo=UTC)
+
+
+def test_unsupported_type() -> None:
+    """Test types without a decode hook are rejected."""
+    with pytest.raises(NotImplementedError):
+        structs._dec_hook(complex, 1)
+
+
+@pytest.mark.asyncio
+async def test_client_models(key: uuid.UUID) -> None:
+    """Test the client builds structs for the bulk endpoints."""
+    bazaar = {
+        "success": True,
+        "lastUpdated": 1590854517479,
+        "products": {
+            "INK_SACK:3": {
+                "product_id": "INK_SACK:3",
+                "sell_summary": [{"amount": 20569, "pricePerUnit": 4.2, "orders": 1}],
+                "buy_summary": [],
+                "quick_status": {
+                    "productId": "INK_SACK:3",
+                    "sellPrice": 4.2,
+                    "sellVolume": 409855,
+                    "sellMovingWeek": 8301075,
+                    "sellOrders": 11,
+                    "buyPrice": 4.99,
+                    "buyVolume": 1254854,
+                    "buyMovingWeek": 5830656,
+                    "buyOrders": 85,
+                },
+            }
+        },
+    }
+    ended = {
+        "success": True,
+        "lastUpdated": 1679435322685,
+        "auctions": [
+            {
+                "auction_id": "50e70ff17ac2409b8d5e94e51b0e9531",
+                "seller": "3c0f6da52855408c96a87c391734f2db",
+                "seller_profile": "d7ab595483ac4e74aa137d5d4ce82cf6",
+                "buyer": "af510607b5734653aa61e1e51aa5fa39",
+                "timestamp": 1679435259014,
+                "price": 17000000,
+                "item_bytes": ENCODED,
+            }
+        ],
+    }
+    with aioresponses() as m:
+        m.get("https://api.hypixel.net/skyblock/auctions?page=0", payload=auction_page(0, 1, [auction_item()]))
+        m.get("https://api.hypixel.net/skyblock/bazaar", payload=bazaar)
+        m.get("https://api.hypixel.net/skyblock/auctions_ended", payload=ended)
+        m.get(f"https://api.hypixel.net/guild?key={key}&name=The+Sloths", payload={"success": True, "guild": GUILD})
+        m.get(
+            f"https://api.hypixel.net/skyblock/auction?key={key}&player={key.hex}",
+            payload={"success": True, "auctions": [auction_item()]},
+        )
+        client = Hypixel(api_key=key, models="msgspec")
+
+        auctions = await client.auctions()
+        assert isinstance(auctions, structs.Auction)
+
+        data = await client.bazaar()
+        assert isinstance(data, structs.Bazaar)
+        assert data.bazaar_items[0].product_id == "INK_SACK:3"
+        assert data.bazaar_items[0].sell_summary[0].price_per_unit == 4.2
+        assert data.bazaar_items[0].quick_status.buy_orders == 85
+
+        auctions_ended = await client.auctions_ended()
+        assert isinstance(auctions_ended, structs.AuctionEnded)
+        assert not auctions_ended.auctions[0].bin
+        assert auctions_ended.auctions[0].nbt == DECODED
+
+        guild = await client.guild_by_name("The Sloths")
+        assert isinstance(guild, structs.Guild)
+        assert guild.id == "52e57a1c0cf2e250d1cd00f8"
+        assert guild.name_lower == "the sloths"
+        assert guild.tag_color == "DARK_AQUA"
+        assert guild.members[0].exp_history == {"2020-05-25": 108}
+        assert guild.members[0].muted_till is None
+        assert guild.ranks is not None and guild.ranks[0].tag is None
+        assert guild.chat_mute == datetime.datetime.fromtimestamp(1590703490.783, tz=UTC)
+
+        items = await client.auction_from_player(key.hex)
+        assert items is not None
+        assert isinstance(items[0], structs.AuctionItem)
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_auction_sync_structs() -> None:
+    """Test auction sync works with structs."""
+    auction_id = uuid.uuid4()
+    with aioresponses() as m:
+        m.get(
+            "https://api.hypixel.net/skyblock/auctions?page=0",
+            payload=auction_page(0, 1, [auction_item(auction_id)]),
+        )
+        client = Hypixel(models="msgspec")
+        diff = await AuctionSync(client).refresh()
+        assert diff is not None
+        assert [item.uuid for item in diff.new] == [auction_id]
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_models() -> None:
+    """Test unknown model families are rejected."""
+    with pytest.raises(ValueError):
+        Hypixel(models="attrs")
@@ -1,8 +1,11 @@
 """Test utilss."""
+import uuid
+
 import pytest
 
+from asyncpixel.constants import GameType, GameTypeIndex
 from asyncpixel.models.utils import safe_divide, to_camel
-from asyncpixel.utils import get_rank, validate_game_type
+from asyncpixel.utils import get_rank, unique_uuids, validate_game_type
 
 
 @pytest.mark.asyncio
@@ -39,9 +42,44 @@ async def test_validate_game_type() -> None:
     """Test validate game type."""
     assert validate_game_type(2).id == 2
     assert validate_game_type("QUAKECRAFT").id == 2
+    assert validate_game_type("Bed Wars") is validate_game_type(58)
 
-    with pytest.raises(StopIteration):
+    with pytest.raises(ValueError):
         validate_game_type(1)
 
-    with pytest.raises(StopIteration):
+    with pytest.raises(ValueError):
         validate_game_type("NULL")
+
+
+@pytest.mark.asyncio
+async def test_game_type_index() -> None:
+    """Test game type lookups by id and name."""
+    bedwars = GameType(
+        id=58,
+        type_name="BEDWARS",
+        database_name="Bedwars",
+        lobby_name="bedwars",
+        clean_name="Bed Wars",
+        standard_name="BedWars",
+    )
+    duplicate = GameType(id=58, type_name="BEDWARS_LEGACY", database_name="Bedwars", clean_name="x", standard_name="x")
+    index = GameTypeIndex([bedwars, duplicate])
+    assert index.get(58) is bedwars
+    assert index.get("BEDWARS") is bedwars
+    assert index.get("Bedwars") is bedwars
+    assert index.get("Bed Wars") is bedwars
+    assert index.get("BEDWARS_LEGACY") is duplicate
+
+    with pytest.raises(ValueError, match="Unknown game type 2"):
+        index.get(2)
+
+    with pytest.raises(ValueError):
+        index.get("NULL")
+
+
+def test_unique_uuids() -> None:
+    """Test uuids are parsed and repeats skipped."""
+    first, second = uuid.uuid4(), uuid.uuid4()
+    assert list(unique_uuids([first, first.hex, str(second), second])) == [first, second]
+    with pytest.raises(ValueError):
+        list(unique_uuids(["not a uuid"]))
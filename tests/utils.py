@@ -1,7 +1,67 @@
 """Utils."""
 import uuid
+from typing import Any, Dict, List, Optional
 
 
 def generate_key() -> uuid.UUID:
     """Generate key."""
     return uuid.uuid4()
+
+
+def auction_item(
+    auction_id: Optional[uuid.UUID] = None,
+    item_name: str = "Magical Mushroom Soup",
+    starting_bid: int = 256,
+    bids: int = 0,
+    bin: bool = True,
+    tier: str = "UNCOMMON",
+    end: int = 1571071181232,
+    item_bytes: str = "...",
+) -> Dict[str, Any]:
+    """Build the json of an auction."""
+    auction_id = auction_id or uuid.uuid4()
+    player = "96a7c06732f54c1382ab6a2515dbb960"
+    bid_list: List[Dict[str, Any]] = [
+        {
+            "auction_id": auction_id.hex,
+            "bidder": player,
+            "profile_id": player,
+            "amount": starting_bid + i,
+            "timestamp": 1571065921089,
+        }
+        for i in range(bids)
+    ]
+    return {
+        "uuid": auction_id.hex,
+        "auctioneer": player,
+        "profile_id": player,
+        "coop": [player],
+        "start": 1571049581232,
+        "end": end,
+        "item_name": item_name,
+        "item_lore": "",
+        "extra": item_name,
+        "category": "consumables",
+        "tier": tier,
+        "starting_bid": starting_bid,
+        "item_bytes": item_bytes,
+        "claimed": False,
+        "claimed_bidders": [],
+        "highest_bid_amount": bid_list[-1]["amount"] if bid_list else 0,
+        "bin": bin,
+        "bids": bid_list,
+    }
+
+
+def auction_page(
+    page: int = 0, total_pages: int = 1, auctions: Optional[List[Dict[str, Any]]] = None, last_updated: int = 1
+) -> Dict[str, Any]:
+    """Build the json of a page of auctions."""
+    return {
+        "success": True,
+        "page": page,
+        "totalPages": total_pages,
+        "totalAuctions": len(auctions or []),
+        "lastUpdated": last_updated,
+        "auctions": auctions or [],
+    }